@@ -1,5 +1,7 @@
+import numpy as np
 from enum import Enum
 from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Sequence
 
 class Severity(Enum):
     Advisory = 1
@@ -36,3 +38,87 @@ class Alert:
     message: str
     timestamp: str
     status: Status = Status.ACTIVE
+
+
+@dataclass(frozen=True, eq=False)
+class FaultBatch:
+    """
+    Columnar result of batch fault detection.
+
+    Each detected fault is one position across parallel arrays: the row it was detected in,
+    the index of the rule that fired (into rules), the severity code (Severity.value), the
+    reading's timestamp and whether the entry clears a previously raised fault (resolved).
+    Fault objects are only built when the batch is iterated or indexed with an integer;
+    slicing or boolean/integer-array indexing returns another FaultBatch.
+    """
+    row_index: np.ndarray
+    rule_index: np.ndarray
+    severity: np.ndarray
+    timestamp: np.ndarray
+    resolved: np.ndarray
+    rules: Sequence[Any] = ()
+
+    @classmethod
+    def empty(cls, rules: Sequence[Any] = ()) -> "FaultBatch":
+        """Create a batch with no faults."""
+        return cls(
+            row_index=np.empty(0, dtype=np.int64),
+            rule_index=np.empty(0, dtype=np.int64),
+            severity=np.empty(0, dtype=np.int8),
+            timestamp=np.empty(0, dtype=object),
+            resolved=np.empty(0, dtype=bool),
+            rules=rules
+        )
+
+    def __len__(self) -> int:
+        return len(self.row_index)
+
+    def __iter__(self) -> Iterator[Fault]:
+        for rule_pos, timestamp, resolved in zip(self.rule_index.tolist(), self.timestamp.tolist(), self.resolved.tolist()):
+            yield self._to_fault(rule_pos, timestamp, resolved)
+
+    def __getitem__(self, key: Any) -> "Fault | FaultBatch":
+        if isinstance(key, (int, np.integer)):
+            return self._to_fault(int(self.rule_index[key]), self.timestamp[key], bool(self.resolved[key]))
+        return FaultBatch(
+            row_index=self.row_index[key],
+            rule_index=self.rule_index[key],
+            severity=self.severity[key],
+            timestamp=self.timestamp[key],
+            resolved=self.resolved[key],
+            rules=self.rules
+        )
+
+    def _to_fault(self, rule_pos: int, timestamp: str, resolved: bool) -> Fault:
+        rule = self.rules[rule_pos]
+        return Fault(
+            fault_id=rule.fault_code,
+            sensor_id=rule.sensor_id,
+            severity=rule.severity,
+            description=rule.message,
+            timestamp=timestamp,
+            status=Status.RESOLVED if resolved else Status.ACTIVE
+        )
+
+    def raised(self) -> "FaultBatch":
+        """Return only the entries that raise a fault."""
+        return self[~self.resolved]
+
+    def severity_counts(self) -> Dict[Severity, int]:
+        """Count faults per severity without building Fault objects."""
+        counts = np.bincount(self.severity, minlength=max(s.value for s in Severity) + 1)
+        return {severity: int(counts[severity.value]) for severity in Severity}
+
+    def to_alert_creations(self) -> Iterator[AlertCreation]:
+        """Lazily convert each raised fault into an AlertCreation record for bulk alert creation."""
+        for rule_pos, timestamp, resolved in zip(self.rule_index.tolist(), self.timestamp.tolist(), self.resolved.tolist()):
+            if resolved:
+                continue
+            rule = self.rules[rule_pos]
+            yield AlertCreation(
+                sensor_id=rule.sensor_id,
+                fault_code=rule.fault_code,
+                severity=rule.severity.name,
+                message=rule.message,
+                timestamp=timestamp
+            )
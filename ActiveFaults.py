@@ -0,0 +1,154 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Tuple
+from Abstractions import Fault
+
+# Transition codes returned by ActiveFaultTable.observe() and observe_series().
+RAISED = 1
+CLEARED = -1
+
+@dataclass
+class FaultState:
+    """Detection state for one (sensor_id, fault_code) key."""
+    active: bool = False
+    trigger_run: int = 0    # Consecutive triggered samples seen most recently.
+    clear_run: int = 0      # Consecutive cleared samples seen most recently.
+    fault: Optional[Fault] = None  # The Fault that raised the key, while active.
+
+def _run_lengths(flags: np.ndarray, carry: int) -> np.ndarray:
+    """
+    Length of the run of consecutive True values ending at each position.
+
+    Args:
+        flags: boolean samples.
+        carry: length of the run still open at the end of the previous call.
+
+    Returns:
+        np.ndarray: run length per position (0 where flags is False).
+    """
+    positions = np.arange(len(flags))
+    last_false = np.maximum.accumulate(np.where(flags, -1, positions))
+    runs = positions - last_false
+    # Positions before the first False continue the run carried over from the previous call.
+    runs[last_false == -1] += carry
+    return runs
+
+class ActiveFaultTable:
+    """
+    Bounded table of raised faults keyed by (sensor_id, fault_code).
+
+    A key raises once it has been triggered for debounce consecutive samples, and clears once
+    it has been cleared for debounce consecutive samples; samples that are neither (e.g. inside
+    a rule's hysteresis margin) hold the current state. Only keys that are active or part-way
+    through a trigger run are stored, so the table never grows beyond the number of rule keys.
+
+    """
+
+    def __init__(self) -> None:
+        self._states: Dict[str, Dict[str, FaultState]] = {}
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.active_faults())
+
+    def clear(self) -> None:
+        """Forget all fault state."""
+        self._states = {}
+
+    def get(self, sensor_id: str, fault_code: str) -> Optional[FaultState]:
+        """Return the stored state for a key, or None if it is idle."""
+        return self._states.get(sensor_id, {}).get(fault_code)
+
+    def tracked_codes(self, sensor_id: str) -> Tuple[str, ...]:
+        """Fault codes with stored state for a sensor."""
+        return tuple(self._states.get(sensor_id, {}))
+
+    def active_faults(self) -> Iterator[Fault]:
+        """Yield the raising Fault of every currently active key."""
+        for codes in self._states.values():
+            for state in codes.values():
+                if state.active and state.fault is not None:
+                    yield state.fault
+
+    def set_fault(self, sensor_id: str, fault_code: str, fault: Fault) -> None:
+        """Record the Fault that raised an active key."""
+        self._states[sensor_id][fault_code].fault = fault
+
+    def observe(self, sensor_id: str, fault_code: str, triggered: bool, cleared: bool, debounce: int = 1) -> int:
+        """
+        Feed one sample for a key through the raise/clear state machine.
+
+        Args:
+            sensor_id: sensor the sample belongs to.
+            fault_code: fault code of the rule(s) evaluated.
+            triggered: whether the rule condition was met.
+            cleared: whether the reading is clear of the rule, hysteresis included.
+            debounce: consecutive samples needed to raise or clear.
+
+        Returns:
+            int: RAISED, CLEARED or 0 when the state did not change.
+        """
+        state = self._states.get(sensor_id, {}).get(fault_code) or FaultState()
+        cleared = cleared and not triggered
+        state.trigger_run = state.trigger_run + 1 if triggered else 0
+        state.clear_run = state.clear_run + 1 if cleared else 0
+
+        transition = 0
+        if not state.active and state.trigger_run >= debounce:
+            state.active = True
+            transition = RAISED
+        elif state.active and state.clear_run >= debounce:
+            state.active = False
+            state.fault = None
+            transition = CLEARED
+
+        self._store(sensor_id, fault_code, state)
+        return transition
+
+    def observe_series(self, sensor_id: str, fault_code: str, triggered: np.ndarray, cleared: np.ndarray, debounce: int = 1) -> np.ndarray:
+        """
+        Vectorized observe() over a time-ordered array of samples for one key.
+
+        Args:
+            sensor_id: sensor the samples belong to.
+            fault_code: fault code of the rule(s) evaluated.
+            triggered: boolean array, whether the rule condition was met per sample.
+            cleared: boolean array, whether each reading is clear of the rule.
+            debounce: consecutive samples needed to raise or clear.
+
+        Returns:
+            np.ndarray: per-sample transition codes (RAISED, CLEARED or 0).
+        """
+        state = self._states.get(sensor_id, {}).get(fault_code) or FaultState()
+        triggered = np.asarray(triggered, dtype=bool)
+        cleared = np.asarray(cleared, dtype=bool) & ~triggered
+        if triggered.size == 0:
+            return np.zeros(0, dtype=np.int8)
+
+        trigger_runs = _run_lengths(triggered, state.trigger_run)
+        clear_runs = _run_lengths(cleared, state.clear_run)
+
+        # Samples that force the state one way or the other; -1 holds the previous state.
+        forced = np.where(trigger_runs >= debounce, 1, np.where(clear_runs >= debounce, 0, -1))
+        positions = np.arange(len(forced))
+        last_forced = np.maximum.accumulate(np.where(forced >= 0, positions, -1))
+        level = np.where(last_forced >= 0, forced[np.maximum(last_forced, 0)], int(state.active))
+        transitions = np.diff(level, prepend=int(state.active)).astype(np.int8)
+
+        state.active = bool(level[-1])
+        state.trigger_run = int(trigger_runs[-1])
+        state.clear_run = int(clear_runs[-1])
+        if not state.active:
+            state.fault = None
+
+        self._store(sensor_id, fault_code, state)
+        return transitions
+
+    def _store(self, sensor_id: str, fault_code: str, state: FaultState) -> None:
+        """Keep state only for keys that are active or part-way through a trigger run."""
+        codes = self._states.setdefault(sensor_id, {})
+        if state.active or state.trigger_run:
+            codes[fault_code] = state
+        else:
+            codes.pop(fault_code, None)
+            if not codes:
+                del self._states[sensor_id]
@@ -1,17 +1,38 @@
+import csv
 import logging
-from typing import List
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List
 from Abstractions import AlertCreation, Alert, Status
-from Database import AlertDatabase
+from Database import AlertDatabase, AlertPage
 
 # Configure logging for module.
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Columns of an alert CSV export.
+EXPORT_COLUMNS = ["alert_id", "sensor_id", "fault_code", "severity", "message", "timestamp", "status"]
+
+@dataclass
+class AlertStatistics:
+    """Counts over a set of alerts, from AlertModule.alert_statistics()."""
+    total: int = 0
+    by_severity: Dict[str, int] = field(default_factory=dict)
+    by_status: Dict[str, int] = field(default_factory=dict)
+    per_hour: List[int] = field(default_factory=lambda: [0] * 24)   # Alerts per hour of the day, 00 to 23.
+
 class AlertModule:
     def __init__(self, database: AlertDatabase) -> None:
-        """Initialise the AlertModule with a reference to the AlertDatabase."""
+        """
+        Initialise the AlertModule with a reference to the AlertDatabase.
+
+        The stored alerts are not loaded; self.alerts holds the alerts created one at a time
+        with create_alert(), or all of them after get_all_alerts(). Batches from
+        create_alerts() are only kept in the database, so uploads don't grow it.
+        """
         self.database: AlertDatabase = database
-        self.alerts: List[Alert] = self.database.get_all()
-        logging.info("AlertModule initialised with %d existing alerts.", len(self.alerts))
+        self.alerts: List[Alert] = []
+        logging.info("AlertModule initialised with %d existing alerts.", self.database.count())
 
     def create_alert(self, sensor_id: str, fault_code: str, severity: str, message: str, timestamp: str) -> Alert:
         """
@@ -49,9 +70,36 @@ class AlertModule:
             logging.error("Failed to create alert for sensor '%s': %s", sensor_id, e)
             raise
     
+    def create_alerts(self, alerts: Iterable[AlertCreation]) -> List[Alert]:
+        """
+        Create a batch of alerts and store them in the database.
+
+        Accepts any iterable of AlertCreation records, such as FaultBatch.to_alert_creations(),
+        so faults can be turned into alerts without building intermediate Fault objects. The
+        whole batch is validated and inserted in one transaction with AlertDatabase.create_many(),
+        so an invalid record stores none of the batch.
+
+        Args:
+            alerts: AlertCreation records to store.
+
+        Returns:
+            list[Alert]: Alerts created, in input order. They are not added to self.alerts;
+            page through them with query_alerts() or stream them with iter_alerts().
+        """
+        try:
+            created: List[Alert] = self.database.create_many(alerts)
+        except Exception as e:
+            logging.error("Failed to create alert batch: %s", e)
+            raise
+
+        logging.info("Created %d alert(s) in batch.", len(created))
+        return created
+
     def get_all_alerts(self) -> List[Alert]:
         """
-        Retrieve all alerts from the database.
+        Retrieve all alerts from the database and keep them in self.alerts.
+
+        The whole table is built as a list; iter_alerts() streams it instead.
 
         Args:
             self: AlertModule instance.
@@ -67,6 +115,87 @@ class AlertModule:
             logging.error("Error retrieving alerts from database: %s", e)
             raise
     
+    def iter_alerts(self, **filters: Any) -> Iterator[Alert]:
+        """
+        Stream the alerts matching a filter from the database in constant memory.
+
+        Args:
+            filters: keyword arguments of AlertDatabase.iter_alerts() (severity, status,
+                sensor_id, start, end, batch_size).
+
+        Returns:
+            Iterator[Alert]: the matching alerts in alert_id order.
+        """
+        return self.database.iter_alerts(**filters)
+
+    def export_csv(self, file_path: str | os.PathLike[str], **filters: Any) -> int:
+        """
+        Write the alerts matching a filter to a CSV file, streaming them from the database.
+
+        Args:
+            file_path: CSV file to write (overwritten).
+            filters: keyword arguments of AlertDatabase.iter_alerts().
+
+        Returns:
+            int: number of alerts written.
+        """
+        written = 0
+        try:
+            with open(file_path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(EXPORT_COLUMNS)
+                for alert in self.database.iter_alerts(**filters):
+                    writer.writerow((alert.alert_id, alert.sensor_id, alert.fault_code, alert.severity,
+                                     alert.message, alert.timestamp, alert.status.value))
+                    written += 1
+        except Exception as e:
+            logging.error("Failed to export alerts to %s after %d alert(s): %s", file_path, written, e)
+            raise
+        logging.info("Exported %d alert(s) to %s.", written, file_path)
+        return written
+
+    def alert_statistics(self, **filters: Any) -> AlertStatistics:
+        """
+        Count the alerts matching a filter by severity, status and hour of the day, streaming them from the database.
+
+        Args:
+            filters: keyword arguments of AlertDatabase.iter_alerts().
+
+        Returns:
+            AlertStatistics: the counts.
+        """
+        severities: Counter = Counter()
+        statuses: Counter = Counter()
+        stats = AlertStatistics()
+        for alert in self.database.iter_alerts(**filters):
+            severities[alert.severity] += 1
+            statuses[alert.status.value] += 1
+            # Stored timestamps are validated HH:MM:SS.
+            stats.per_hour[int(alert.timestamp[:2])] += 1
+        stats.total = sum(severities.values())
+        stats.by_severity = dict(severities)
+        stats.by_status = dict(statuses)
+        return stats
+
+    def query_alerts(self, **filters: Any) -> AlertPage:
+        """
+        Retrieve one page of the alerts matching a filter, filtered and paged in the database.
+
+        Args:
+            filters: keyword arguments of AlertDatabase.query() (severity, status, sensor_id,
+                start, end, order_by, descending, after, limit).
+
+        Returns:
+            AlertPage: the matching alerts and the cursor of the next page.
+        """
+        try:
+            page = self.database.query(**filters)
+            logging.info("Queried %d alert(s) matching %s.", len(page.alerts), filters)
+            return page
+        except Exception as e:
+            logging.error("Error querying alerts with %s: %s", filters, e)
+            raise
+
     def resolve_alert(self, alert_id: int) -> bool:
         """
         Mark an alert as resolved in the database.
@@ -141,4 +270,61 @@ class AlertModule:
             return False
         except Exception as e:
             logging.error("Failed to delete alert ID %d: %s", alert_id, e)
-            raise
\ No newline at end of file
+            raise
+
+    def resolve_alerts(self, alert_ids: Iterable[int] | None = None, **filters: Any) -> int:
+        """
+        Mark many alerts as resolved in one transaction.
+
+        Args:
+            alert_ids: ids of the alerts to resolve.
+            filters: severity, sensor_id, start and end filters (see AlertDatabase.query()).
+
+        Returns:
+            int: number of alerts resolved.
+        """
+        return self._update_statuses(Status.RESOLVED, alert_ids, filters)
+
+    def unresolve_alerts(self, alert_ids: Iterable[int] | None = None, **filters: Any) -> int:
+        """
+        Mark many resolved alerts as active again in one transaction.
+
+        Args:
+            alert_ids: ids of the alerts to reactivate.
+            filters: severity, sensor_id, start and end filters (see AlertDatabase.query()).
+
+        Returns:
+            int: number of alerts reactivated.
+        """
+        return self._update_statuses(Status.ACTIVE, alert_ids, filters)
+
+    def _update_statuses(self, status: Status, alert_ids: Iterable[int] | None, filters: Dict[str, Any]) -> int:
+        """Set the status of the alerts selected by ids and filters and log how many changed."""
+        try:
+            updated = self.database.update_status_many(status, alert_ids, **filters)
+            logging.info("Set %d alert(s) to %s.", len(updated), status.value)
+            return len(updated)
+        except Exception as e:
+            logging.error("Failed to set alerts to %s: %s", status.value, e)
+            raise
+
+    def delete_alerts(self, alert_ids: Iterable[int] | None = None, **filters: Any) -> int:
+        """
+        Delete many alerts in one transaction.
+
+        Args:
+            alert_ids: ids of the alerts to delete.
+            filters: severity, status, sensor_id, start and end filters (see AlertDatabase.query()).
+
+        Returns:
+            int: number of alerts deleted.
+        """
+        try:
+            deleted = set(self.database.delete_many(alert_ids, **filters))
+            if deleted:
+                self.alerts = [a for a in self.alerts if a.alert_id not in deleted]
+            logging.info("Deleted %d alert(s).", len(deleted))
+            return len(deleted)
+        except Exception as e:
+            logging.error("Failed to delete alerts: %s", e)
+            raise
@@ -0,0 +1,110 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import json
+import logging
+import multiprocessing
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict
+
+import numpy as np
+
+from Abstractions import AlertCreation, Status
+from AlertModule import AlertModule
+from Bench_Pipeline import peak_rss_mb, summarise, time_calls
+from Database import AlertDatabase
+
+SEVERITIES = ("Advisory", "Moderate", "Critical")
+
+def populate(database: AlertDatabase, alerts: int, sensors: int, resolved_ratio: float, chunk: int = 100_000) -> None:
+    """Insert synthetic alerts in create_many batches, then resolve a fraction of them."""
+    rng = np.random.default_rng(0)
+    for start in range(0, alerts, chunk):
+        count = min(chunk, alerts - start)
+        sensor = rng.integers(0, sensors, count).tolist()
+        severity = rng.integers(0, len(SEVERITIES), count).tolist()
+        second = rng.integers(0, 86_400, count).tolist()
+        database.create_many(
+            AlertCreation(f"SENSOR_{s}", "F001", SEVERITIES[v], "synthetic", f"{t // 3600:02d}:{t % 3600 // 60:02d}:{t % 60:02d}")
+            for s, v, t in zip(sensor, severity, second)
+        )
+    with database._write_lock, database._con:
+        database._con.execute("UPDATE alerts SET status = ? WHERE abs(random()) % 1000 < ?", (Status.RESOLVED.value, int(resolved_ratio * 1000)))
+
+def scan(db_path: str, mode: str, work_dir: str) -> Dict[str, Any]:
+    """Read every alert once. Runs in its own process so peak RSS is per mode."""
+    logging.disable(logging.INFO)
+    database = AlertDatabase(db_path)
+    alert_module = AlertModule(database)
+    start = time.perf_counter()
+    if mode == "get_all":
+        count = len(database.get_all())
+    elif mode == "iter_alerts":
+        count = sum(1 for _ in database.iter_alerts())
+    elif mode == "export_csv":
+        count = alert_module.export_csv(os.path.join(work_dir, "export.csv"))
+    else:
+        count = alert_module.alert_statistics().total
+    elapsed = time.perf_counter() - start
+    database.close()
+    return {"mode": mode, "alerts": count, "seconds": elapsed, "alerts_per_sec": count / elapsed, "peak_rss_mb": round(peak_rss_mb(), 1)}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time filtered, paginated AlertDatabase.query() calls on a large alert table.")
+    parser.add_argument("--alerts", type=int, default=1_000_000)
+    parser.add_argument("--sensors", type=int, default=64)
+    parser.add_argument("--resolved-ratio", type=float, default=0.01)
+    parser.add_argument("--limit", type=int, default=100, help="alerts per page")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--baseline", action="store_true", help="also time get_all() with filtering in Python")
+    parser.add_argument("--output", help="optional JSON results file")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        database = AlertDatabase(os.path.join(work_dir, "alerts.db"))
+        start = time.perf_counter()
+        populate(database, args.alerts, args.sensors, args.resolved_ratio)
+        print(f"populated {args.alerts:,} alerts in {time.perf_counter() - start:.1f}s")
+        database.close()
+        database = AlertDatabase(os.path.join(work_dir, "alerts.db"))
+
+        middle = database.query(order_by="timestamp", start="12:00:00", limit=1).next_cursor
+        cases: Dict[str, Dict[str, Any]] = {
+            "critical_active": {"severity": "Critical", "status": Status.ACTIVE},
+            "resolved": {"status": Status.RESOLVED},
+            "sensor": {"sensor_id": "SENSOR_7"},
+            "time_window": {"start": "12:00:00", "end": "12:05:00", "order_by": "timestamp"},
+            "newest_first": {"descending": True},
+            "deep_page_by_time": {"order_by": "timestamp", "after": middle},
+        }
+        results: Dict[str, Any] = {"alerts": args.alerts}
+        for name, filters in cases.items():
+            samples, page = time_calls(lambda: database.query(limit=args.limit, **filters), args.repeat)
+            results[name] = summarise(samples, len(page.alerts))
+            print(f"{name:>18}: p50 {results[name]['p50_s'] * 1000:8.3f} ms  p99 {results[name]['p99_s'] * 1000:8.3f} ms  ({len(page.alerts)} alerts)")
+
+        if args.baseline:
+            samples, _ = time_calls(lambda: [a for a in database.get_all() if a.severity == "Critical" and a.status == Status.ACTIVE][:args.limit], 3)
+            results["baseline_get_all_filter"] = summarise(samples, args.limit)
+            print(f"{'get_all + filter':>18}: p50 {results['baseline_get_all_filter']['p50_s'] * 1000:8.1f} ms")
+        database.close()
+
+        # Full scans: the list from get_all() against streaming with iter_alerts() and its consumers.
+        context = multiprocessing.get_context("spawn")
+        for mode in ("get_all", "iter_alerts", "export_csv", "statistics"):
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                result = pool.submit(scan, os.path.join(work_dir, "alerts.db"), mode, work_dir).result()
+            results[f"scan_{mode}"] = result
+            print(f"{mode:>18}: {result['alerts']:,} alerts in {result['seconds']:6.2f}s ({result['alerts_per_sec']:>10,.0f}/s), "
+                  f"peak RSS {result['peak_rss_mb']:8.1f} MiB")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
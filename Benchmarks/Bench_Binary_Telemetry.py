@@ -0,0 +1,71 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import json
+import logging
+import multiprocessing
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict
+
+from BinaryTelemetry import write_telemetry
+from Bench_Pipeline import generate_csv, peak_rss_mb
+from SensorIntegration import SensorIntegration
+
+def convert(csv_path: str, bin_path: str) -> None:
+    """Write the readings of a CSV to a binary telemetry file."""
+    logging.disable(logging.INFO)
+    write_telemetry(bin_path, SensorIntegration("typed").read_csv(csv_path))
+
+def load(path: str, source: str) -> Dict[str, Any]:
+    """Load a recording and touch every value. Runs in its own process so peak RSS is per source."""
+    logging.disable(logging.INFO)
+    start = time.perf_counter()
+    if source == "binary":
+        data_frame = SensorIntegration().read_binary(path)
+    else:
+        data_frame = SensorIntegration(source).read_csv(path)
+    total = float(data_frame["value"].sum())
+    elapsed = time.perf_counter() - start
+    return {
+        "source": source,
+        "rows": len(data_frame),
+        "seconds": elapsed,
+        "rows_per_sec": len(data_frame) / elapsed,
+        "file_mb": os.path.getsize(path) / (1024 * 1024),
+        "peak_rss_mb": peak_rss_mb(),
+        "value_sum": total,
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare loading a recording from CSV and from a binary telemetry file.")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--sensors", type=int, default=8)
+    parser.add_argument("--output", help="optional JSON results file")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        csv_path = os.path.join(work_dir, "sensors.csv")
+        bin_path = os.path.join(work_dir, "sensors.bin")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            pool.submit(generate_csv, csv_path, args.rows, args.sensors, 0.001).result()
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            pool.submit(convert, csv_path, bin_path).result()
+
+        for source in SensorIntegration.PROFILES + ("binary",):
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                result = pool.submit(load, bin_path if source == "binary" else csv_path, source).result()
+            results.append(result)
+            print(f"{source:>8}: {result['rows']:>11,} rows in {result['seconds']:7.2f}s ({result['rows_per_sec']:>12,.0f} rows/sec), "
+                  f"file {result['file_mb']:8.1f} MiB, peak RSS {result['peak_rss_mb']:8.1f} MiB")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
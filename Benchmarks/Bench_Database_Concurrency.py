@@ -0,0 +1,87 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import json
+import logging
+import random
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List
+
+from Abstractions import AlertCreation
+from Bench_Pipeline import summarise
+from Database import AlertDatabase
+
+def run(db_path: str, readers: int, writer_threads: int, reader_threads: int, batch: int, duration: float) -> Dict[str, Any]:
+    """Insert alert batches from writer threads while reader threads look alerts up, for duration seconds."""
+    database = AlertDatabase(db_path, readers=readers)
+    database.create_many(AlertCreation(f"SENSOR_{i % 16}", "F001", "Moderate", "seed", "00:00:00") for i in range(1000))
+    stop = threading.Event()
+    written: List[int] = []
+    latencies: List[List[float]] = [[] for _ in range(reader_threads)]
+    commit_latencies: List[float] = []
+
+    def write(worker: int) -> None:
+        rows = [AlertCreation(f"SENSOR_{worker}_{i % 16}", "F001", "Moderate", "stress", f"00:00:{i % 60:02d}") for i in range(batch)]
+        count = 0
+        while not stop.is_set():
+            start = time.perf_counter()
+            count += len(database.create_many(rows))
+            commit_latencies.append(time.perf_counter() - start)
+        written.append(count)
+
+    def read(worker: int) -> None:
+        rng = random.Random(worker)
+        samples = latencies[worker]
+        while not stop.is_set():
+            start = time.perf_counter()
+            database.get(rng.randint(1, 1000))
+            samples.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(writer_threads)]
+    threads += [threading.Thread(target=read, args=(i,)) for i in range(reader_threads)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    database.close()
+
+    reads = [sample for samples in latencies for sample in samples]
+    return {
+        "mode": "wal_pool" if readers else "shared_connection",
+        "alerts_written_per_sec": sum(written) / duration,
+        "reads_per_sec": len(reads) / duration,
+        "read": summarise(reads, 1),
+        "write_batch": summarise(commit_latencies, batch),
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stress AlertDatabase with concurrent writer and reader threads.")
+    parser.add_argument("--writers", type=int, default=2, help="threads inserting alert batches")
+    parser.add_argument("--readers", type=int, default=4, help="threads reading single alerts")
+    parser.add_argument("--batch", type=int, default=1000, help="alerts per create_many call")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per mode")
+    parser.add_argument("--output", help="optional JSON results file")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        # readers=0 shares the writer connection, like the database before the reader pool.
+        for pool_size in (0, args.readers):
+            result = run(os.path.join(work_dir, f"alerts_{pool_size}.db"), pool_size, args.writers, args.readers, args.batch, args.duration)
+            results.append(result)
+            print(f"{result['mode']:>17}: {result['alerts_written_per_sec']:>10,.0f} alerts/s written, "
+                  f"{result['reads_per_sec']:>9,.0f} reads/s, read p50 {result['read']['p50_s'] * 1000:7.3f} ms "
+                  f"p99 {result['read']['p99_s'] * 1000:7.3f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from FaultDetection import FaultDetection
+
+RULES_PATH = os.path.join(os.path.dirname(__file__), "..", "fault_rules.json")
+
+# Sensors covered by fault_rules.json, with a typical reading and spread for each.
+SENSOR_PROFILES = {
+    "ENG_OILTEMP": ("Temperature", 200.0, 15.0, "C"),
+    "ENG_OILPRESS": ("Pressure", 1100.0, 120.0, "psi"),
+    "CABIN_PRESS": ("Pressure", 8500.0, 400.0, "hPa"),
+    "HYDRAULIC_PRESS": ("Pressure", 5.0, 4.0, "bar"),
+    "FUEL_FLOW": ("Flow Rate", 140.0, 30.0, "kg/h"),
+    "FUEL_QUANT": ("Quantity", 800.0, 250.0, "kg"),
+    "ELEC_BUS": ("Voltage", 24.0, 3.0, "V"),
+    "APU_EGT": ("Temperature", 450.0, 40.0, "C"),  # No rules, exercises the non-matching path.
+}
+
+def generate_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Generate a synthetic, already cleaned sensor DataFrame with the given number of rows."""
+    rng = np.random.default_rng(seed)
+    names = list(SENSOR_PROFILES)
+    picks = rng.integers(0, len(names), size=rows)
+
+    types = np.array([SENSOR_PROFILES[n][0] for n in names], dtype=object)
+    means = np.array([SENSOR_PROFILES[n][1] for n in names])
+    spreads = np.array([SENSOR_PROFILES[n][2] for n in names])
+    units = np.array([SENSOR_PROFILES[n][3] for n in names], dtype=object)
+
+    seconds = np.sort(rng.integers(0, 24 * 3600, size=rows))
+    timestamps = [f"{s // 3600:02d}:{s % 3600 // 60:02d}:{s % 60:02d}" for s in seconds.tolist()]
+
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "sensor_id": np.array(names, dtype=object)[picks],
+        "sensor_type": types[picks],
+        "value": np.round(rng.normal(means[picks], spreads[picks]), 2),
+        "unit": units[picks],
+    })
+
+def time_detection(data_frame: pd.DataFrame, vectorized: bool) -> tuple[float, int]:
+    """Run detect_from_batch once on a fresh FaultDetection and return (seconds, fault count)."""
+    fault_detection = FaultDetection()
+    fault_detection.load_rules(RULES_PATH)
+
+    start = time.perf_counter()
+    faults = fault_detection.detect_from_batch(data_frame, vectorized=vectorized)
+    return time.perf_counter() - start, len(faults)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare row-by-row and vectorized fault detection throughput.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows for the vectorized path")
+    parser.add_argument("--row-path-rows", type=int, default=50_000, help="rows for the row-by-row path")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for label, rows, vectorized in (
+        ("row-by-row", args.row_path_rows, False),
+        ("vectorized", args.rows, True),
+    ):
+        data_frame = generate_frame(rows, args.seed)
+        elapsed, faults = time_detection(data_frame, vectorized)
+        print(f"{label:>11}: {rows:>10,} rows in {elapsed:8.3f}s -> {rows / elapsed:>14,.0f} rows/sec ({faults:,} faults)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import json
+import logging
+import multiprocessing
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict
+
+from Bench_Pipeline import generate_csv, peak_rss_mb
+from SensorIntegration import HAS_PYARROW, SensorIntegration
+
+def load(csv_path: str, profile: str) -> Dict[str, Any]:
+    """Read a CSV with one ingest profile. Runs in its own process so peak RSS is per profile."""
+    logging.disable(logging.INFO)
+    start = time.perf_counter()
+    data_frame = SensorIntegration(profile).read_csv(csv_path)
+    elapsed = time.perf_counter() - start
+    return {
+        "profile": profile,
+        "rows": len(data_frame),
+        "seconds": elapsed,
+        "rows_per_sec": len(data_frame) / elapsed,
+        "frame_mb": data_frame.memory_usage(deep=True).sum() / (1024 * 1024),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the default and typed CSV ingest profiles.")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--sensors", type=int, default=8)
+    parser.add_argument("--csv", help="existing sensor CSV to read instead of generating one")
+    parser.add_argument("--output", help="optional JSON results file")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as work_dir:
+        csv_path = args.csv
+        if csv_path is None:
+            csv_path = os.path.join(work_dir, "sensors.csv")
+            # Generated in a child process: children inherit the peak RSS of their parent on Linux.
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                pool.submit(generate_csv, csv_path, args.rows, args.sensors, 0.001).result()
+        print(f"{csv_path}: {os.path.getsize(csv_path) / (1024 * 1024):,.0f} MiB, pyarrow {'available' if HAS_PYARROW else 'not installed'}")
+
+        results = []
+        for profile in SensorIntegration.PROFILES:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                result = pool.submit(load, csv_path, profile).result()
+            results.append(result)
+            print(f"{profile:>8}: {result['rows']:>11,} rows in {result['seconds']:7.2f}s ({result['rows_per_sec']:>10,.0f} rows/sec), "
+                  f"frame {result['frame_mb']:8.1f} MiB, peak RSS {result['peak_rss_mb']:8.1f} MiB")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
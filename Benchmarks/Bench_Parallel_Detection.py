@@ -0,0 +1,69 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from Bench_Fault_Detection import RULES_PATH, generate_frame
+from FaultDetection import FaultDetection
+from ParallelDetection import ParallelDetection
+from SensorRegistry import SENSOR_REGISTRY
+from Timestamps import timestamp_seconds
+
+def integration_frame(rows: int, seed: int) -> pd.DataFrame:
+    """generate_frame() readings encoded the way SensorIntegration returns them, with a seconds column."""
+    data_frame = generate_frame(rows, seed)
+    data_frame["seconds"] = timestamp_seconds(data_frame["timestamp"].to_numpy()).astype(np.int32)
+    return SENSOR_REGISTRY.encode_frame(data_frame)
+
+def time_parallel(frames: list[pd.DataFrame], workers: int, repeat: int) -> tuple[float, int]:
+    """
+    Detect every frame once to start the workers, then time repeat further passes.
+
+    The same ParallelDetection (and its worker processes) is used throughout, as it would be
+    for a stream of batches, so process start-up is not part of the measured time.
+
+    Returns:
+        tuple: (best seconds per pass, fault count of the last pass).
+    """
+    fault_detection = FaultDetection()
+    fault_detection.load_rules(RULES_PATH)
+    parallel = ParallelDetection(fault_detection, workers=workers)
+    try:
+        for data_frame in frames:
+            parallel.detect_from_batch(data_frame)
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            faults = sum(len(parallel.detect_from_batch(data_frame)) for data_frame in frames)
+            best = min(best, time.perf_counter() - start)
+        return best, faults
+    finally:
+        parallel.close()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure sharded fault detection throughput for several worker counts.")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batches", type=int, default=4, help="split the rows into this many consecutive batches")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    batch_rows = args.rows // args.batches
+    frames = [integration_frame(batch_rows, args.seed + index) for index in range(args.batches)]
+    rows = batch_rows * args.batches
+    print(f"{rows:,} rows in {args.batches} batch(es), {os.cpu_count()} CPU(s) available")
+
+    baseline = None
+    for workers in args.workers:
+        elapsed, faults = time_parallel(frames, workers, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{workers:>3} worker(s): {elapsed:8.3f}s -> {rows / elapsed:>14,.0f} rows/sec, "
+              f"speedup {baseline / elapsed:5.2f}x ({faults:,} faults)")
+
+if __name__ == "__main__":
+    main()
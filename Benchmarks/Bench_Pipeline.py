@@ -0,0 +1,292 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import json
+import logging
+import multiprocessing
+import platform
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+# Peak RSS comes from resource on Unix and psutil elsewhere (such as Windows) if it is installed.
+try:
+    import resource
+except ImportError:
+    resource = None
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+import numpy as np
+import pandas as pd
+
+from AlertModule import AlertModule
+from Database import AlertDatabase
+from FaultDetection import FaultDetection
+from SensorIntegration import SensorIntegration
+
+RULES_PATH = os.path.join(os.path.dirname(__file__), "..", "fault_rules.json")
+
+# Rows generated and written per CSV chunk, so large files never sit in memory whole.
+WRITE_CHUNK_ROWS = 1_000_000
+
+def sensor_specs(sensors: int) -> List[Dict[str, Any]]:
+    """
+    Describe the sensors to generate: the sensors of fault_rules.json first, then sensors without rules.
+
+    Each spec holds the range normal readings are drawn from and the values a faulty reading
+    takes (one past each rule threshold of the sensor).
+    """
+    with open(RULES_PATH) as f:
+        rules = json.load(f)
+
+    by_sensor: Dict[str, List[Dict[str, Any]]] = {}
+    for rule in rules:
+        if rule["condition"] in (">", "<"):
+            by_sensor.setdefault(rule["sensor_id"], []).append(rule)
+
+    specs = []
+    for sensor_id, sensor_rules in by_sensor.items():
+        upper = min((r["threshold"] for r in sensor_rules if r["condition"] == ">"), default=None)
+        lower = max((r["threshold"] for r in sensor_rules if r["condition"] == "<"), default=None)
+        span = abs(upper if upper is not None else lower) * 0.2 + 10
+        lower = lower if lower is not None else upper - span
+        upper = upper if upper is not None else lower + span
+        margin = (upper - lower) * 0.1
+        faulty = [r["threshold"] + (abs(r["threshold"]) * 0.05 + 1) * (1 if r["condition"] == ">" else -1) for r in sensor_rules]
+        specs.append({"sensor_id": sensor_id, "type": sensor_rules[0].get("parameter", "Generic"),
+                      "low": lower + margin, "high": upper - margin, "faulty": faulty})
+
+    for index in range(len(specs), sensors):
+        specs.append({"sensor_id": f"SENSOR_{index:04d}", "type": "Generic", "low": 0.0, "high": 100.0, "faulty": []})
+    return specs[:sensors]
+
+def generate_csv(file_path: str, rows: int, sensors: int, fault_ratio: float, seed: int = 0) -> None:
+    """
+    Write a synthetic sensor CSV in the format read by SensorIntegration.read_csv().
+
+    Timestamps are spread evenly over one day in ascending order. A fraction fault_ratio of the
+    readings of sensors with rules is pushed past one of their rule thresholds.
+
+    Args:
+        file_path: CSV file to create (overwritten).
+        rows: number of data rows.
+        sensors: number of distinct sensor ids.
+        fault_ratio: fraction of readings generated past a rule threshold.
+        seed: random seed.
+    """
+    rng = np.random.default_rng(seed)
+    specs = sensor_specs(sensors)
+    names = np.array([s["sensor_id"] for s in specs], dtype=object)
+    types = np.array([s["type"] for s in specs], dtype=object)
+    low = np.array([s["low"] for s in specs])
+    high = np.array([s["high"] for s in specs])
+
+    header = True
+    for start in range(0, rows, WRITE_CHUNK_ROWS):
+        size = min(WRITE_CHUNK_ROWS, rows - start)
+        picks = rng.integers(0, len(specs), size=size)
+        values = rng.uniform(low[picks], high[picks])
+
+        for position in np.flatnonzero(rng.random(size) < fault_ratio):
+            faulty = specs[picks[position]]["faulty"]
+            if faulty:
+                values[position] = faulty[rng.integers(0, len(faulty))]
+
+        seconds = (np.arange(start, start + size) * 86_400) // max(rows, 1)
+        timestamps = pd.Series(seconds // 3600).map("{:02d}".format) + ":" + \
+            pd.Series(seconds % 3600 // 60).map("{:02d}".format) + ":" + pd.Series(seconds % 60).map("{:02d}".format)
+
+        pd.DataFrame({
+            "timestamp": timestamps,
+            "sensor_id": names[picks],
+            "sensor_type": types[picks],
+            "value": np.round(values, 2),
+            "unit": "u",
+        }).to_csv(file_path, mode="w" if header else "a", header=header, index=False)
+        header = False
+
+def peak_rss_mb() -> float:
+    """
+    Peak resident set size of this process since it started, in MiB, or NaN if it can't be measured.
+
+    This is a running maximum over the whole process, so it covers everything run before the
+    call as well; run a stage in its own process to measure that stage alone. Without the
+    resource module it comes from psutil, which gives the peak on Windows and only the current
+    RSS on other platforms.
+    """
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    if psutil is not None:
+        memory = psutil.Process().memory_info()
+        return getattr(memory, "peak_wset", memory.rss) / (1024 * 1024)
+    return float("nan")
+
+def summarise(samples: List[float], items: int) -> Dict[str, Any]:
+    """
+    Latency percentiles of a stage and its throughput at the median latency.
+
+    The peak RSS recorded with them is the process's running maximum when the stage finished
+    (see peak_rss_mb()), so it includes every stage timed before it in the same process.
+    """
+    p50 = float(np.percentile(samples, 50))
+    return {
+        "samples": len(samples),
+        "p50_s": p50,
+        "p99_s": float(np.percentile(samples, 99)),
+        "mean_s": float(np.mean(samples)),
+        "items": items,
+        "items_per_sec": items / p50 if p50 > 0 else None,
+        "cumulative_peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+def time_calls(call: Callable[[], Any], repeat: int) -> tuple[List[float], Any]:
+    """Time repeat calls of call, returning the per-call seconds and the last result."""
+    samples, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = call()
+        samples.append(time.perf_counter() - start)
+    return samples, result
+
+def run_size(csv_path: str, rows: int, repeat: int, alert_samples: int, work_dir: str, profile: str = "default") -> Dict[str, Any]:
+    """Time every stage on one generated CSV. Runs in its own process so peak RSS is per size."""
+    logging.disable(logging.INFO)
+    stages: Dict[str, Any] = {}
+
+    samples, data_frame = time_calls(lambda: SensorIntegration(profile).read_csv(csv_path), repeat)
+    stages["read_csv"] = summarise(samples, rows)
+
+    def detect():
+        fault_detection = FaultDetection()
+        fault_detection.load_rules(RULES_PATH)
+        start = time.perf_counter()
+        batch = fault_detection.detect_from_batch(data_frame)
+        return time.perf_counter() - start, batch
+
+    results = [detect() for _ in range(repeat)]
+    batch = results[-1][1]
+    stages["detect_from_batch"] = summarise([seconds for seconds, _ in results], rows)
+
+    # Per-call latency of single alert inserts, on up to alert_samples of the detected faults.
+    database = AlertDatabase(os.path.join(work_dir, f"alerts_{rows}.db"))
+    alert_module = AlertModule(database)
+    creations = list(batch.raised().to_alert_creations())[:alert_samples]
+    samples = []
+    for alert in creations:
+        start = time.perf_counter()
+        alert_module.create_alert(alert.sensor_id, alert.fault_code, alert.severity, alert.message, alert.timestamp)
+        samples.append(time.perf_counter() - start)
+    if samples:
+        stages["create_alert"] = summarise(samples, 1)
+
+    # One create_alerts batch (a single transaction) of every raised fault, into a fresh database each time.
+    all_creations = list(batch.raised().to_alert_creations())
+    def create_batch():
+        batch_db = AlertDatabase(os.path.join(work_dir, f"batch_{rows}_{time.perf_counter_ns()}.db"))
+        try:
+            return AlertModule(batch_db).create_alerts(all_creations)
+        finally:
+            batch_db.close()
+
+    if all_creations:
+        samples, _ = time_calls(create_batch, repeat)
+        stages["create_alerts"] = summarise(samples, len(all_creations))
+
+    samples, alerts = time_calls(database.get_all, repeat)
+    stages["get_all"] = summarise(samples, len(alerts))
+    database.close()
+
+    def end_to_end():
+        end_to_end_db = AlertDatabase(os.path.join(work_dir, f"end_to_end_{rows}_{time.perf_counter_ns()}.db"))
+        try:
+            fault_detection = FaultDetection()
+            fault_detection.load_rules(RULES_PATH)
+            faults = fault_detection.detect_from_batch(SensorIntegration(profile).read_csv(csv_path))
+            return len(AlertModule(end_to_end_db).create_alerts(faults.to_alert_creations()))
+        finally:
+            end_to_end_db.close()
+
+    samples, created = time_calls(end_to_end, repeat)
+    stages["end_to_end"] = summarise(samples, rows)
+
+    return {
+        "rows": rows,
+        "faults": len(batch),
+        "alerts_created_end_to_end": created,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "stages": stages,
+    }
+
+def git_revision() -> str | None:
+    """Short hash of the checked out commit, if this is a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the ingest, detect and alert pipeline on synthetic sensor CSVs.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="CSV sizes to generate (10^3 up to 10^8)")
+    parser.add_argument("--sensors", type=int, default=8, help="distinct sensor ids; the first ones have fault rules")
+    parser.add_argument("--fault-ratio", type=float, default=0.001, help="fraction of readings generated past a rule threshold")
+    parser.add_argument("--repeat", type=int, default=5, help="timed repetitions per stage")
+    parser.add_argument("--alert-samples", type=int, default=200, help="single create_alert calls timed per size")
+    parser.add_argument("--profile", choices=SensorIntegration.PROFILES, default="default", help="SensorIntegration ingest profile")
+    parser.add_argument("--data-dir", help="keep generated CSVs here and reuse them on later runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_pipeline.json", help="JSON results file")
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {
+        "benchmark": "pipeline",
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": {k: getattr(args, k) for k in ("rows", "sensors", "fault_ratio", "repeat", "alert_samples", "profile", "seed")},
+        "results": [],
+    }
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        data_dir = args.data_dir or work_dir
+        os.makedirs(data_dir, exist_ok=True)
+        context = multiprocessing.get_context("spawn")
+        for rows in args.rows:
+            csv_path = os.path.join(data_dir, f"sensors_{rows}_{args.sensors}_{args.fault_ratio}_{args.seed}.csv")
+            # Generating and timing each run in its own process keeps this process small; a child
+            # inherits the peak RSS of the process it was started from on Linux.
+            if not os.path.exists(csv_path):
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    pool.submit(generate_csv, csv_path, rows, args.sensors, args.fault_ratio, args.seed).result()
+
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                result = pool.submit(run_size, csv_path, rows, args.repeat, args.alert_samples, work_dir, args.profile).result()
+            report["results"].append(result)
+
+            print(f"{rows:>11,} rows  peak RSS {result['peak_rss_mb']:>8.1f} MiB")
+            for stage, stats in result["stages"].items():
+                rate = f"{stats['items_per_sec']:>14,.0f}/s" if stats["items_per_sec"] else " " * 16
+                print(f"  {stage:<18} p50 {stats['p50_s'] * 1000:>10.2f} ms  p99 {stats['p99_s'] * 1000:>10.2f} ms  {rate}")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
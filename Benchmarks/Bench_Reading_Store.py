@@ -0,0 +1,65 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+
+import numpy as np
+
+from Bench_Pipeline import generate_csv, summarise
+from ReadingStore import ReadingStore
+from SensorIntegration import SensorIntegration
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time storing a recording in the ReadingStore and querying the readings around alerts.")
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--sensors", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=1000, help="random around() queries timed")
+    parser.add_argument("--window", type=int, default=30, help="seconds either side of each queried time")
+    parser.add_argument("--output", help="optional JSON results file")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        csv_path = os.path.join(work_dir, "sensors.csv")
+        db_path = os.path.join(work_dir, "readings.db")
+        generate_csv(csv_path, args.rows, args.sensors, 0.001)
+        readings = SensorIntegration("typed").read_csv(csv_path)
+        sensor_ids = readings["sensor_id"].astype(str).unique().tolist()
+
+        store = ReadingStore(db_path)
+        start = time.perf_counter()
+        store.append(readings)
+        ingest = time.perf_counter() - start
+
+        rng = np.random.default_rng(0)
+        samples = []
+        returned = 0
+        for sensor, second in zip(rng.integers(0, len(sensor_ids), args.queries).tolist(), rng.integers(0, 86_400, args.queries).tolist()):
+            start = time.perf_counter()
+            returned += len(store.around(sensor_ids[sensor], second, args.window))
+            samples.append(time.perf_counter() - start)
+        store.close()
+
+        results = {
+            "rows": len(readings),
+            "ingest_seconds": ingest,
+            "ingest_rows_per_sec": len(readings) / ingest,
+            "db_mb": os.path.getsize(db_path) / (1024 * 1024),
+            "csv_mb": os.path.getsize(csv_path) / (1024 * 1024),
+            "query": summarise(samples, 1),
+            "mean_readings_per_query": returned / args.queries,
+        }
+
+    print(f"ingest: {results['rows']:,} readings in {ingest:.2f}s ({results['ingest_rows_per_sec']:,.0f} rows/sec), "
+          f"{results['db_mb']:.1f} MiB on disk vs {results['csv_mb']:.1f} MiB CSV")
+    print(f" query: ±{args.window}s windows, {json.dumps(results['query'])}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from dataclasses import asdict
+from typing import Any, Dict, Iterator
+
+import numpy as np
+
+from Bench_Pipeline import RULES_PATH, sensor_specs
+from FaultDetection import FaultDetection
+from TelemetryServer import TRANSPORTS, TelemetryServer, format_line_protocol, send_records
+
+def synthetic_lines(records: int, sensors: int, line_format: str, seed: int = 0) -> Iterator[str]:
+    """Sensor records around the fault_rules.json thresholds, as CSV or line protocol lines."""
+    rng = np.random.default_rng(seed)
+    specs = sensor_specs(sensors)
+    picks = rng.integers(0, len(specs), size=records).tolist()
+    draws = rng.random(records).tolist()
+    for i, (pick, draw) in enumerate(zip(picks, draws)):
+        spec = specs[pick]
+        value = round(spec["low"] + draw * (spec["high"] - spec["low"]), 2)
+        second = i * 86_400 // max(records, 1)
+        timestamp = f"{second // 3600:02d}:{second % 3600 // 60:02d}:{second % 60:02d}"
+        if line_format == "csv":
+            yield f"{timestamp},{spec['sensor_id']},{spec['type']},{value},u"
+        else:
+            yield format_line_protocol(timestamp, spec["sensor_id"], spec["type"], value, "u")
+
+async def run(args: argparse.Namespace, transport: str) -> Dict[str, Any]:
+    """Send args.records over one transport to a local server and report throughput and drops."""
+    fault_detection = FaultDetection()
+    fault_detection.load_rules(RULES_PATH)
+    server = TelemetryServer(fault_detection, tcp_port=0 if transport == "tcp" else None, udp_port=0 if transport == "udp" else None,
+                             batch_size=args.batch_size, batch_interval=args.batch_interval, queue_size=args.queue_size)
+    await server.start()
+    port = server.tcp_port if transport == "tcp" else server.udp_port
+
+    start = time.perf_counter()
+    sent = await send_records("127.0.0.1", port, synthetic_lines(args.records, args.sensors, args.format), transport,
+                              rate=args.rate, lines_per_send=args.lines_per_send)
+    await server.stop(drain_timeout=60)
+    elapsed = time.perf_counter() - start
+
+    return {"transport": transport, "sent": sent, "seconds": elapsed, "records_per_sec": sent / elapsed, **asdict(server.stats)}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the TelemetryServer on localhost.")
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--sensors", type=int, default=8)
+    parser.add_argument("--transport", choices=TRANSPORTS + ("both",), default="both")
+    parser.add_argument("--format", choices=("csv", "line"), default="csv", help="record format sent")
+    parser.add_argument("--rate", type=float, help="records per second to send at; as fast as possible by default")
+    parser.add_argument("--lines-per-send", type=int, default=100, help="records per write or datagram")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--batch-interval", type=float, default=0.2)
+    parser.add_argument("--queue-size", type=int, default=10_000)
+    parser.add_argument("--output", help="optional JSON results file")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    results = []
+    for transport in TRANSPORTS if args.transport == "both" else (args.transport,):
+        result = asyncio.run(run(args, transport))
+        results.append(result)
+        print(f"{transport}: {result['sent']:,} sent in {result['seconds']:.2f}s ({result['records_per_sec']:,.0f} records/sec), "
+              f"{result['received']:,} received, {result['dropped']:,} dropped, {result['rejected']:,} rejected, "
+              f"{result['batches']:,} batches, {result['faults']:,} faults")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
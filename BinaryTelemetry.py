@@ -0,0 +1,153 @@
+import json
+import logging
+import os
+import struct
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from Timestamps import SECONDS_PER_DAY, day_timestamps, timestamp_seconds
+
+MAGIC = b"HMTB"
+VERSION = 1
+
+# Fixed part of the header: magic, format version, length of the JSON sensor dictionary.
+PREAMBLE = struct.Struct("<4sHI")
+
+# One packed reading: seconds of the day, index into the sensor dictionary, value.
+RECORD_DTYPE = np.dtype([("seconds", "<i4"), ("sensor", "<u2"), ("value", "<f4")])
+
+MAX_SENSORS = np.iinfo(np.uint16).max + 1
+
+def _records_offset(dictionary_length: int) -> int:
+    """Records start on an 8 byte boundary after the header."""
+    return (PREAMBLE.size + dictionary_length + 7) // 8 * 8
+
+def write_telemetry(file_path: str | os.PathLike[str], data_frame: pd.DataFrame) -> int:
+    """
+    Write cleaned sensor readings to a packed binary telemetry file.
+
+    The file starts with a header holding a dictionary of the distinct (sensor_id,
+    sensor_type, unit) combinations, followed by one fixed-width RECORD_DTYPE record per
+    reading that refers to its sensor by position in the dictionary. Values are stored as
+    float32.
+
+    Args:
+        file_path: file to create (overwritten).
+        data_frame: readings with the SensorIntegration columns, as returned by read_csv().
+
+    Returns:
+        int: number of records written.
+
+    Raises:
+        ValueError: If a timestamp is not valid HH:MM:SS or there are more than MAX_SENSORS sensors.
+    """
+    seconds = data_frame["seconds"].to_numpy() if "seconds" in data_frame.columns else timestamp_seconds(data_frame["timestamp"].to_numpy())
+    if (seconds < 0).any():
+        raise ValueError("Invalid timestamp format detected: Expected HH:MM:SS.")
+
+    keys = pd.MultiIndex.from_arrays([data_frame[col].astype(str) for col in ("sensor_id", "sensor_type", "unit")])
+    codes, sensors = pd.factorize(keys)
+    if len(sensors) > MAX_SENSORS:
+        raise ValueError(f"At most {MAX_SENSORS} distinct sensors fit in a telemetry file, got {len(sensors)}")
+
+    dictionary = json.dumps({
+        "sensors": [{"sensor_id": sensor_id, "sensor_type": sensor_type, "unit": unit} for sensor_id, sensor_type, unit in sensors]
+    }).encode()
+    offset = _records_offset(len(dictionary))
+
+    records = np.empty(len(data_frame), dtype=RECORD_DTYPE)
+    records["seconds"] = seconds
+    records["sensor"] = codes
+    records["value"] = data_frame["value"].to_numpy(dtype=np.float32)
+
+    with open(file_path, "wb") as f:
+        f.write(PREAMBLE.pack(MAGIC, VERSION, len(dictionary)))
+        f.write(dictionary)
+        f.write(b"\0" * (offset - PREAMBLE.size - len(dictionary)))
+        records.tofile(f)
+
+    logging.info(f"Wrote {len(records)} telemetry records for {len(sensors)} sensors to {file_path}")
+    return len(records)
+
+def read_telemetry_header(file_path: str | os.PathLike[str]) -> Dict[str, Any]:
+    """
+    Read the header of a binary telemetry file.
+
+    Returns:
+        dict: the sensor dictionary ("sensors"), the byte offset of the first record
+        ("offset") and the number of complete records in the file ("records").
+
+    Raises:
+        ValueError: If the file is not a binary telemetry file of a supported version.
+    """
+    with open(file_path, "rb") as f:
+        preamble = f.read(PREAMBLE.size)
+        if len(preamble) < PREAMBLE.size:
+            raise ValueError(f"{file_path} is too short to be a binary telemetry file")
+        magic, version, dictionary_length = PREAMBLE.unpack(preamble)
+        if magic != MAGIC:
+            raise ValueError(f"{file_path} is not a binary telemetry file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported binary telemetry version {version} in {file_path}")
+        try:
+            header = json.loads(f.read(dictionary_length))
+        except ValueError as e:
+            raise ValueError(f"Corrupt sensor dictionary in {file_path}: {e}")
+
+    offset = _records_offset(dictionary_length)
+    payload = os.path.getsize(file_path) - offset
+    if payload % RECORD_DTYPE.itemsize:
+        # A writer may still be appending; the partial record is left for a later read.
+        logging.warning(f"Ignoring {payload % RECORD_DTYPE.itemsize} trailing bytes of an incomplete record in {file_path}")
+    header["offset"] = offset
+    header["records"] = max(payload, 0) // RECORD_DTYPE.itemsize
+    return header
+
+def read_telemetry(file_path: str | os.PathLike[str]) -> pd.DataFrame:
+    """
+    Load a binary telemetry file as a sensor DataFrame without parsing it.
+
+    The records are memory-mapped with np.memmap and exposed as column views, so no Python
+    object is created per reading. The frame has the same columns as a frame returned by
+    SensorIntegration.read_csv(): the text columns are categoricals built from the sensor
+    dictionary, timestamp is a categorical over the seconds of the day, value is float32
+    and seconds is int32.
+
+    Returns:
+        pd.DataFrame: the readings, in file order.
+
+    Raises:
+        ValueError: If the file is not a valid binary telemetry file.
+    """
+    header = read_telemetry_header(file_path)
+    count = header["records"]
+    if count:
+        records = np.memmap(file_path, dtype=RECORD_DTYPE, mode="r", offset=header["offset"], shape=(count,))
+    else:
+        records = np.empty(0, dtype=RECORD_DTYPE)
+
+    sensors: List[Dict[str, str]] = header["sensors"]
+    seconds = records["seconds"]
+    sensor = records["sensor"]
+    if count and (seconds.min() < 0 or seconds.max() >= SECONDS_PER_DAY):
+        raise ValueError(f"Corrupt telemetry record in {file_path}: time of day out of range")
+    if count and sensor.max() >= len(sensors):
+        raise ValueError(f"Corrupt telemetry record in {file_path}: unknown sensor index {sensor.max()}")
+
+    def dictionary_column(key: str) -> pd.Categorical:
+        # Sensors sharing a type or unit map onto one category.
+        codes, categories = pd.factorize(np.array([s[key] for s in sensors], dtype=object))
+        return pd.Categorical.from_codes(codes[sensor] if len(sensors) else sensor.astype(np.int64), categories=categories)
+
+    data_frame = pd.DataFrame({
+        "timestamp": pd.Categorical.from_codes(seconds, categories=day_timestamps()),
+        "sensor_id": dictionary_column("sensor_id"),
+        "sensor_type": dictionary_column("sensor_type"),
+        "value": records["value"],
+        "unit": dictionary_column("unit"),
+        "seconds": seconds,
+    }, copy=False)
+    logging.info(f"Loaded {count} telemetry records for {len(sensors)} sensors from {file_path}")
+    return data_frame
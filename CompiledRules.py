@@ -0,0 +1,234 @@
+import numpy as np
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Upper bound on the number of (reading, band) comparisons materialised at once.
+BAND_CHUNK_ELEMENTS = 4_000_000
+
+def _expand_ranges(rows: np.ndarray, starts: np.ndarray, stops: np.ndarray, rule_order: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expand per-row [start, stop) slices of a sorted rule table into (row, rule) pairs.
+
+    Args:
+        rows: row position of each reading.
+        starts: first triggered position in rule_order for each reading.
+        stops: one past the last triggered position in rule_order for each reading.
+        rule_order: rule positions in threshold-sorted order.
+
+    Returns:
+        tuple: (rows, rules) arrays with one entry per triggered rule.
+    """
+    counts = stops - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    # Offset that maps a position in the flattened output back to a position in rule_order.
+    offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return np.repeat(rows, counts), rule_order[np.arange(total) + offsets]
+
+def merge_hits(*hits: Tuple[np.ndarray, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate (rows, rules) hit arrays and order them by row first and rule second."""
+    rows = np.concatenate([r for r, _ in hits]) if hits else np.empty(0, dtype=np.int64)
+    rules = np.concatenate([c for _, c in hits]) if hits else np.empty(0, dtype=np.int64)
+    order = np.lexsort((rules, rows))
+    return rows[order], rules[order]
+
+class SensorRuleTable:
+    """Threshold arrays for all the rules of a single sensor.
+
+    Rules are split by condition into contiguous, threshold-sorted arrays so that a whole
+    array of readings can be classified with np.searchsorted (for >, < and =) or
+    broadcasting (for inside/outside band rules), instead of calling is_triggered() once
+    per rule. Rules with any other condition are kept aside and evaluated through their
+    own triggered_mask(). Temporal rules (those with a truthy temporal attribute) depend on
+    earlier readings, so they are evaluated on the derived signals passed in as metrics,
+    keyed by the rule's position in this table.
+
+    positions maps each of this sensor's rules to its index in the full rule list.
+
+    """
+
+    def __init__(self, rules: Sequence[Any], positions: Sequence[int] | None = None) -> None:
+        self.rules: List[Any] = list(rules)
+        self.positions: np.ndarray = np.asarray(
+            positions if positions is not None else range(len(self.rules)), dtype=np.int64
+        )
+
+        grouped: Dict[str, List[int]] = {}
+        for position, rule in enumerate(self.rules):
+            grouped.setdefault(rule.condition, []).append(position)
+
+        self.gt_thresholds, self.gt_rules = self._sorted_thresholds(grouped.pop(">", []))
+        self.lt_thresholds, self.lt_rules = self._sorted_thresholds(grouped.pop("<", []))
+        self.eq_thresholds, self.eq_rules = self._sorted_thresholds(grouped.pop("=", []))
+        self.inside_lower, self.inside_upper, self.inside_rules = self._bands(grouped.pop("inside", []))
+        self.outside_lower, self.outside_upper, self.outside_rules = self._bands(grouped.pop("outside", []))
+        remaining = sorted(p for positions in grouped.values() for p in positions)
+        self.temporal_rules: List[int] = [p for p in remaining if getattr(self.rules[p], "temporal", False)]
+        self.other_rules: List[int] = [p for p in remaining if not getattr(self.rules[p], "temporal", False)]
+
+        # Rules sharing a fault code form one key in the active fault table.
+        self.fault_codes: List[str] = list(dict.fromkeys(rule.fault_code for rule in self.rules))
+        key_ids = {fault_code: key for key, fault_code in enumerate(self.fault_codes)}
+        self.key_of_rule: np.ndarray = np.array([key_ids[rule.fault_code] for rule in self.rules], dtype=np.int64)
+        self.key_rules: List[List[int]] = [[] for _ in self.fault_codes]
+        for position, rule in enumerate(self.rules):
+            self.key_rules[key_ids[rule.fault_code]].append(position)
+        self.key_debounce: List[int] = [max(self.rules[p].debounce for p in positions) for positions in self.key_rules]
+
+    def _sorted_thresholds(self, positions: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (thresholds, rule positions) sorted by threshold."""
+        thresholds = np.array([self.rules[p].threshold for p in positions], dtype=float)
+        order = np.argsort(thresholds, kind="stable")
+        return thresholds[order], np.array(positions, dtype=np.int64)[order]
+
+    def _bands(self, positions: List[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (lower, upper, rule positions) arrays for band rules."""
+        lower = np.array([self.rules[p].lower for p in positions], dtype=float)
+        upper = np.array([self.rules[p].upper for p in positions], dtype=float)
+        return lower, upper, np.array(positions, dtype=np.int64)
+
+    @staticmethod
+    def _band_hits(values: np.ndarray, rows: np.ndarray, lower: np.ndarray, upper: np.ndarray,
+                   rule_positions: np.ndarray, inside: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """Broadcast readings against band limits in row chunks to bound memory."""
+        chunk = max(1, BAND_CHUNK_ELEMENTS // len(rule_positions))
+        hit_rows: List[np.ndarray] = []
+        hit_rules: List[np.ndarray] = []
+        for start in range(0, len(values), chunk):
+            block = values[start:start + chunk, None]
+            if inside:
+                mask = (block >= lower) & (block <= upper)
+            else:
+                mask = (block < lower) | (block > upper)
+            r, c = np.nonzero(mask)
+            hit_rows.append(rows[start + r])
+            hit_rules.append(rule_positions[c])
+        if not hit_rows:
+            # No readings to check, such as a sensor whose values are all NaN.
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(hit_rows), np.concatenate(hit_rules)
+
+    def cleared_mask(self, key: int, values: np.ndarray, metrics: Dict[int, np.ndarray] | None = None) -> np.ndarray:
+        """Readings that clear every rule of a fault key, hysteresis included."""
+        mask = np.ones(len(values), dtype=bool)
+        for position in self.key_rules[key]:
+            signal = metrics[position] if metrics is not None and position in metrics else values
+            mask &= self.rules[position].cleared_mask(signal)
+        return mask
+
+    def temporal_hits(self, metrics: Dict[int, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Classify the derived signals of the temporal rules, returning (rows, rules) like evaluate()."""
+        hits = []
+        for position in self.temporal_rules:
+            r = np.flatnonzero(self.rules[position].triggered_mask(metrics[position]))
+            hits.append((r, np.full(r.size, position, dtype=np.int64)))
+        return merge_hits(*hits)
+
+    def evaluate(self, values: np.ndarray, metrics: Dict[int, np.ndarray] | None = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Classify an array of readings against every rule of this sensor.
+
+        Args:
+            values: float readings for this sensor.
+            metrics: derived signal per temporal rule position; temporal rules are skipped without it.
+
+        Returns:
+            tuple: (rows, rules) where rows are positions in values and rules are positions
+            in self.rules, ordered by row first and rule position second.
+        """
+        values = np.asarray(values, dtype=float)
+        all_rows = np.arange(len(values))
+
+        # NaN never triggers a comparison, but would sort past every threshold.
+        valid = ~np.isnan(values)
+        rows = all_rows[valid] if not valid.all() else all_rows
+        readings = values[rows]
+
+        hit_rows: List[np.ndarray] = []
+        hit_rules: List[np.ndarray] = []
+
+        if self.gt_thresholds.size:
+            # Every threshold strictly below the reading is exceeded.
+            stops = np.searchsorted(self.gt_thresholds, readings, side="left")
+            r, c = _expand_ranges(rows, np.zeros_like(stops), stops, self.gt_rules)
+            hit_rows.append(r)
+            hit_rules.append(c)
+
+        if self.lt_thresholds.size:
+            # Every threshold strictly above the reading is undershot.
+            starts = np.searchsorted(self.lt_thresholds, readings, side="right")
+            r, c = _expand_ranges(rows, starts, np.full_like(starts, self.lt_thresholds.size), self.lt_rules)
+            hit_rows.append(r)
+            hit_rules.append(c)
+
+        if self.eq_thresholds.size:
+            starts = np.searchsorted(self.eq_thresholds, readings, side="left")
+            stops = np.searchsorted(self.eq_thresholds, readings, side="right")
+            r, c = _expand_ranges(rows, starts, stops, self.eq_rules)
+            hit_rows.append(r)
+            hit_rules.append(c)
+
+        if self.inside_rules.size:
+            r, c = self._band_hits(readings, rows, self.inside_lower, self.inside_upper, self.inside_rules, inside=True)
+            hit_rows.append(r)
+            hit_rules.append(c)
+
+        if self.outside_rules.size:
+            r, c = self._band_hits(readings, rows, self.outside_lower, self.outside_upper, self.outside_rules, inside=False)
+            hit_rows.append(r)
+            hit_rules.append(c)
+
+        for position in self.other_rules:
+            r = np.flatnonzero(self.rules[position].triggered_mask(values))
+            hit_rows.append(r)
+            hit_rules.append(np.full(r.size, position, dtype=np.int64))
+
+        if metrics is not None and self.temporal_rules:
+            r, c = self.temporal_hits(metrics)
+            hit_rows.append(r)
+            hit_rules.append(c)
+
+        return merge_hits(*zip(hit_rows, hit_rules))
+
+class CompiledRuleSet:
+    """Per-sensor SensorRuleTable objects compiled from a list of fault rules.
+
+    A compiled rule set is not modified after construction, so it can be shared between
+    FaultDetection instances and swapped in as a whole when the rules change.
+
+    """
+
+    def __init__(self, rules: Sequence[Any]) -> None:
+        self.rules: List[Any] = list(rules)
+        by_sensor: Dict[str, List[int]] = {}
+        for position, rule in enumerate(self.rules):
+            by_sensor.setdefault(rule.sensor_id, []).append(position)
+        self.rule_index: Dict[str, List[Any]] = {
+            sensor_id: [self.rules[p] for p in positions] for sensor_id, positions in by_sensor.items()
+        }
+        self.tables: Dict[str, SensorRuleTable] = {
+            sensor_id: SensorRuleTable([self.rules[p] for p in positions], positions)
+            for sensor_id, positions in by_sensor.items()
+        }
+        self.table_ids: List[str] = list(self.tables)
+        self._table_code: Dict[str, int] = {sensor_id: code for code, sensor_id in enumerate(self.table_ids)}
+
+    def table_codes(self, sensor_ids: Sequence[str]) -> np.ndarray:
+        """
+        Map distinct sensor ids, such as the categories of a dictionary-encoded column, to rule tables.
+
+        Returns:
+            np.ndarray: per sensor id, its position in table_ids, or -1 if it has no rules.
+        """
+        return np.array([self._table_code.get(sensor_id, -1) for sensor_id in sensor_ids], dtype=np.int64)
+
+    def __contains__(self, sensor_id: object) -> bool:
+        return sensor_id in self.tables
+
+    def __len__(self) -> int:
+        return len(self.tables)
+
+    def get(self, sensor_id: str) -> SensorRuleTable | None:
+        """Return the rule table for a sensor, or None if it has no rules."""
+        return self.tables.get(sensor_id)
@@ -1,30 +1,153 @@
-import re
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from Abstractions import Alert, AlertCreation, Status
+from Timestamps import HOUR_MINUTE_SECOND, timestamp_seconds
+
+# Alert columns with the sensor code resolved back to its sensor_id.
+ALERT_SELECT = """
+    SELECT a.alert_id, s.sensor_id, a.fault_code, a.severity, a.message, a.timestamp, a.status
+    FROM alerts a JOIN sensors s ON s.sensor_code = a.sensor_code
+"""
+
+# Status enum of each stored status value.
+STATUS_BY_VALUE = {status.value: status for status in Status}
+
+def alert_row_factory(cursor: sqlite3.Cursor, row: tuple) -> Alert:
+    """sqlite3 row factory building an Alert straight from an ALERT_SELECT row tuple."""
+    return Alert(row[0], row[1], row[2], row[3], row[4], row[5], STATUS_BY_VALUE[row[6]])
+
+# Columns a query() can be sorted by, each with the alert_id tie-breaker that makes the key unique.
+SORT_KEYS = {"alert_id": ("a.alert_id",), "timestamp": ("a.timestamp", "a.alert_id")}
+
+@dataclass(frozen=True)
+class AlertPage:
+    """One page of AlertDatabase.query() results."""
+    alerts: List[Alert]
+    next_cursor: Optional[Tuple[Any, ...]] = None   # Pass as after= for the next page; None on the last page.
+
+# Pragmas of every connection: 64 MiB page cache and up to 256 MiB of the file memory-mapped.
+CONNECTION_PRAGMAS = ("PRAGMA cache_size = -65536", "PRAGMA mmap_size = 268435456", "PRAGMA temp_store = MEMORY")
+
+# Milliseconds a connection waits for a lock held by another process before failing.
+BUSY_TIMEOUT_MS = 5000
+
+# Alert ids bound per statement by bulk updates and deletes, well under SQLite's parameter limit.
+BULK_CHUNK = 500
 
 class AlertDatabase:
+    """
+    SQLite store of alerts.
 
-    def __init__(self, db_path: str = "alerts.db") -> None:
+    Sensor ids are normalized into a sensors table: each alert row stores the integer
+    sensor_code of its sensor, and reads join the sensor_id back in.
+
+    The database is opened in WAL mode with one writer connection and a pool of up to
+    readers read-only connections. Writes are serialized on the writer by a lock and commit
+    with synchronous=NORMAL. Reads borrow a pooled connection and see the last committed
+    state, so they never wait for a write transaction in progress. Databases that cannot
+    use WAL (such as ":memory:") fall back to running reads on the writer connection under
+    the same lock.
+
+    """
+
+    def __init__(self, db_path: str = "alerts.db", readers: int = 4) -> None:
+        """
+        Args:
+            db_path: SQLite file, or ":memory:".
+            readers: most read-only connections open at once; 0 runs reads on the writer connection.
+
+        Raises:
+            ValueError: If readers is negative.
+        """
+        if readers < 0:
+            raise ValueError(f"readers must not be negative, got {readers}")
         self.db_path = db_path
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        self._con = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._con = sqlite3.connect(self.db_path, check_same_thread=False, timeout=BUSY_TIMEOUT_MS / 1000)
         self._con.row_factory = sqlite3.Row
+        self._write_lock = threading.RLock()
+        self._sensor_codes: Dict[str, int] = {}
+
+        journal_mode = self._con.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        if journal_mode.lower() == "wal":
+            self._con.execute("PRAGMA synchronous = NORMAL")
+        else:
+            readers = 0
+        for pragma in CONNECTION_PRAGMAS:
+            self._con.execute(pragma)
+        self.readers = readers
+        self._idle_readers: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self._reader_connections: List[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
         self._init_table()
 
     def close(self) -> None:
         try:
+            with self._pool_lock:
+                for con in self._reader_connections:
+                    con.close()
+                self._reader_connections.clear()
+            # Refreshes the planner statistics the query() indexes rely on; cheap when nothing changed.
+            with self._write_lock:
+                self._con.execute("PRAGMA optimize")
             self._con.close()
         finally:
             self._con = None
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection to the database file."""
+        con = sqlite3.connect(f"{Path(self.db_path).resolve().as_uri()}?mode=ro", uri=True,
+                              check_same_thread=False, timeout=BUSY_TIMEOUT_MS / 1000)
+        con.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            con.execute(pragma)
+        return con
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Lend a read-only connection from the pool, or the writer connection (under its lock) when there is no pool."""
+        if not self.readers:
+            with self._write_lock:
+                yield self._con
+            return
+
+        try:
+            con = self._idle_readers.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                opened = len(self._reader_connections) < self.readers
+                if opened:
+                    con = self._open_reader()
+                    self._reader_connections.append(con)
+            if not opened:
+                con = self._idle_readers.get()
+        try:
+            yield con
+        finally:
+            self._idle_readers.put(con)
     
     def _init_table(self) -> None:
+        self._con.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sensors (
+                sensor_code     INTEGER PRIMARY KEY,
+                sensor_id       TEXT    NOT NULL UNIQUE
+            )
+            """
+        )
+        columns = [row["name"] for row in self._con.execute("PRAGMA table_info(alerts)")]
+        if "sensor_id" in columns:
+            self._migrate_sensor_ids()
         self._con.execute(
             """
             CREATE TABLE IF NOT EXISTS alerts (
                 alert_id        INTEGER PRIMARY KEY AUTOINCREMENT,
-                sensor_id       TEXT    NOT NULL,
+                sensor_code     INTEGER NOT NULL REFERENCES sensors(sensor_code),
                 fault_code      TEXT    NOT NULL,
                 severity        TEXT    NOT NULL,
                 message         TEXT    NOT NULL,
@@ -33,8 +156,50 @@ class AlertDatabase:
             )
             """
         )
+        # Back the query() filters; every index also orders its entries by alert_id, so an equality
+        # filter on its columns reads a page in alert_id order without sorting. Status on its own
+        # has an index too, so status-only pages don't sort all matches by severity first.
+        self._con.execute("CREATE INDEX IF NOT EXISTS alerts_by_status_severity ON alerts(status, severity)")
+        self._con.execute("CREATE INDEX IF NOT EXISTS alerts_by_status ON alerts(status)")
+        self._con.execute("CREATE INDEX IF NOT EXISTS alerts_by_sensor ON alerts(sensor_code)")
+        self._con.execute("CREATE INDEX IF NOT EXISTS alerts_by_timestamp ON alerts(timestamp)")
         self._con.commit()
 
+    def _migrate_sensor_ids(self) -> None:
+        """Move an alerts table that stores sensor_id text over to sensor codes, keeping alert ids."""
+        self._con.execute("INSERT OR IGNORE INTO sensors(sensor_id) SELECT DISTINCT sensor_id FROM alerts")
+        self._con.execute("ALTER TABLE alerts RENAME TO alerts_text_ids")
+        self._con.execute(
+            """
+            CREATE TABLE alerts (
+                alert_id        INTEGER PRIMARY KEY AUTOINCREMENT,
+                sensor_code     INTEGER NOT NULL REFERENCES sensors(sensor_code),
+                fault_code      TEXT    NOT NULL,
+                severity        TEXT    NOT NULL,
+                message         TEXT    NOT NULL,
+                timestamp       TEXT    NOT NULL CHECK (timestamp GLOB '??:??:??'),
+                status          TEXT    NOT NULL DEFAULT 'Active'
+            )
+            """
+        )
+        self._con.execute(
+            """
+            INSERT INTO alerts(alert_id, sensor_code, fault_code, severity, message, timestamp, status)
+            SELECT a.alert_id, s.sensor_code, a.fault_code, a.severity, a.message, a.timestamp, a.status
+            FROM alerts_text_ids a JOIN sensors s ON s.sensor_id = a.sensor_id
+            """
+        )
+        self._con.execute("DROP TABLE alerts_text_ids")
+
+    def _sensor_code(self, sensor_id: str) -> int:
+        """Return the code of a sensor, adding it to the sensors table if it is new. Called with the write lock held."""
+        code = self._sensor_codes.get(sensor_id)
+        if code is None:
+            self._con.execute("INSERT OR IGNORE INTO sensors(sensor_id) VALUES (?)", (sensor_id,))
+            code = self._con.execute("SELECT sensor_code FROM sensors WHERE sensor_id = ?", (sensor_id,)).fetchone()[0]
+            self._sensor_codes[sensor_id] = code
+        return code
+
     @staticmethod # doesn't require the class, just simply a utility function.
     def _validate_timestamp(ts: str) -> None:
         """
@@ -47,8 +212,7 @@ class AlertDatabase:
             ValueError: If timestamp isn't in valid 24-hour HH:MM:SS format.
 
         """
-        hour_minute_second = re.compile(r"^(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d$")
-        if not hour_minute_second.match(ts):
+        if not HOUR_MINUTE_SECOND.match(ts):
             raise ValueError("timestamp must be valid 24-hour HH:MM:SS (00–23:59:59)")
         
     @staticmethod
@@ -83,53 +247,215 @@ class AlertDatabase:
         """
         self._validate_timestamp(alert.timestamp)
         try:
-            row = self._con.execute(
-                """
-                INSERT INTO alerts(sensor_id, fault_code, severity, message, timestamp, status) 
-                VALUES (?,?,?,?,?,?)
-                RETURNING alert_id, sensor_id, fault_code, severity, message, timestamp, status
-                """,
-                (
-                alert.sensor_id,
-                alert.fault_code,
-                alert.severity,
-                alert.message,
-                alert.timestamp,
-                Status.ACTIVE.value
-                ),
-            ).fetchone()
-
-            self._con.commit()
+            with self._write_lock:
+                row = self._con.execute(
+                    """
+                    INSERT INTO alerts(sensor_code, fault_code, severity, message, timestamp, status) 
+                    VALUES (?,?,?,?,?,?)
+                    RETURNING alert_id, ? AS sensor_id, fault_code, severity, message, timestamp, status
+                    """,
+                    (
+                    self._sensor_code(alert.sensor_id),
+                    alert.fault_code,
+                    alert.severity,
+                    alert.message,
+                    alert.timestamp,
+                    Status.ACTIVE.value,
+                    alert.sensor_id
+                    ),
+                ).fetchone()
+
+                self._con.commit()
             return self._to_alert(row)
             
         except sqlite3.IntegrityError as e:
             raise ValueError(f"Invalid alert data: {e}")
 
+    def create_many(self, alerts: Iterable[AlertCreation]) -> List[Alert]:
+        """
+        Insert a batch of alerts in one transaction and return them as Alert objects.
+
+        Every timestamp is validated before anything is written, then all rows are inserted
+        with a single executemany and one commit, so either the whole batch is stored or none
+        of it is. Ids are assigned consecutively in input order.
+
+        Args:
+            alerts: alert creation dataclass instances.
+
+        Returns:
+            list[Alert]: the alerts created, in input order.
+
+        Raises:
+            ValueError: If any alert contains invalid data; nothing is inserted.
+        """
+        alerts = list(alerts)
+        if not alerts:
+            return []
+        invalid = timestamp_seconds([alert.timestamp for alert in alerts]) < 0
+        if invalid.any():
+            raise ValueError(f"timestamp must be valid 24-hour HH:MM:SS (00–23:59:59), got {alerts[int(invalid.argmax())].timestamp!r}")
+
+        try:
+            with self._write_lock, self._con:
+                rows = [
+                    (self._sensor_code(alert.sensor_id), alert.fault_code, alert.severity, alert.message, alert.timestamp, Status.ACTIVE.value)
+                    for alert in alerts
+                ]
+                self._con.executemany(
+                    "INSERT INTO alerts(sensor_code, fault_code, severity, message, timestamp, status) VALUES (?,?,?,?,?,?)",
+                    rows
+                )
+                # The transaction holds the write lock, so the AUTOINCREMENT ids just taken are consecutive up to seq.
+                last_id = self._con.execute("SELECT seq FROM sqlite_sequence WHERE name = 'alerts'").fetchone()[0]
+                first_id = last_id - len(rows) + 1
+        except sqlite3.IntegrityError as e:
+            # Sensors added in the rolled back transaction are gone again.
+            self._sensor_codes.clear()
+            raise ValueError(f"Invalid alert data: {e}")
+
+        return [
+            Alert(first_id + index, alert.sensor_id, alert.fault_code, alert.severity, alert.message, alert.timestamp, Status.ACTIVE)
+            for index, alert in enumerate(alerts)
+        ]
+
+    def _select(self, sql: str, params: Iterable[Any] = ()) -> List[Alert]:
+        """Run an ALERT_SELECT statement on a reader and return its rows as Alerts."""
+        with self._reader() as con:
+            cursor = con.cursor()
+            cursor.row_factory = alert_row_factory
+            return cursor.execute(sql, tuple(params)).fetchall()
+
     def get(self, alert_id: int) -> Optional[Alert]:
         """Retrieve a single alert by ID."""
-        row = self._con.execute(
-            "SELECT alert_id, sensor_id, fault_code, severity, message, timestamp, status FROM alerts WHERE alert_id = ?", (alert_id,)
-        ).fetchone()
-        if row is None:
-            return None
-        
-        return self._to_alert(row)
+        alerts = self._select(f"{ALERT_SELECT} WHERE a.alert_id = ?", (alert_id,))
+        return alerts[0] if alerts else None
     
     def get_all(self) -> list[Alert]:
-        """Retrieve all alerts from the database."""
-        rows = self._con.execute(
-            """
-            SELECT alert_id, sensor_id, fault_code, severity, message, timestamp, status
-            FROM alerts
-            ORDER BY alert_id ASC;
-            """
-        ).fetchall()
+        """Retrieve all alerts from the database. Builds the whole list; iter_alerts() streams them instead."""
+        return list(self.iter_alerts())
+
+    def iter_alerts(self, severity: Optional[str] = None, status: Optional[Status] = None, sensor_id: Optional[str] = None,
+                    start: Optional[str] = None, end: Optional[str] = None, batch_size: int = 10_000) -> Iterator[Alert]:
+        """
+        Iterate over the alerts matching a filter in alert_id order, batch_size rows at a time.
+
+        Each batch is a separate keyset query that continues after the last alert_id of the
+        previous one, so memory stays bounded by batch_size however large the table is, and
+        no read is kept open between batches. Alerts committed while iterating are included
+        if their ids come after the current batch.
+
+        Args:
+            severity, status, sensor_id, start, end: filters, as for query().
+            batch_size: rows fetched per query.
+
+        Returns:
+            Iterator[Alert]: the matching alerts.
+
+        Raises:
+            ValueError: If batch_size isn't positive or start or end isn't valid HH:MM:SS.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        conditions, params = self._filter_sql(severity, status, sensor_id, start, end)
+        sql = f"{ALERT_SELECT} WHERE {' AND '.join(conditions + ['a.alert_id > ?'])} ORDER BY a.alert_id LIMIT ?"
+        return self._iter_batches(sql, params, batch_size)
 
-        # Convert status string back to status enum for each record.
-        alerts = []
-        for r in rows:
-            alerts.append(self._to_alert(r))
-        return alerts
+    def _iter_batches(self, sql: str, params: List[Any], batch_size: int) -> Iterator[Alert]:
+        """Yield the alerts of sql one keyset batch at a time; its last two parameters are the previous alert_id and the batch size."""
+        last_id = 0
+        while True:
+            batch = self._select(sql, (*params, last_id, batch_size))
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            last_id = batch[-1].alert_id
+
+    def count(self, severity: Optional[str] = None, status: Optional[Status] = None, sensor_id: Optional[str] = None,
+              start: Optional[str] = None, end: Optional[str] = None) -> int:
+        """Number of alerts matching a filter (see query())."""
+        conditions, params = self._filter_sql(severity, status, sensor_id, start, end)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._reader() as con:
+            return con.execute(f"SELECT COUNT(*) FROM alerts a {where}", params).fetchone()[0]
+
+    def _filter_sql(self, severity: Optional[str] = None, status: Optional[Status] = None, sensor_id: Optional[str] = None,
+                    start: Optional[str] = None, end: Optional[str] = None) -> Tuple[List[str], List[Any]]:
+        """
+        Build the WHERE conditions and parameters of an alert filter over the alerts table aliased as a.
+
+        Raises:
+            ValueError: If start or end isn't valid HH:MM:SS.
+        """
+        conditions: List[str] = []
+        params: List[Any] = []
+        if status is not None:
+            conditions.append("a.status = ?")
+            params.append(status.value)
+        if severity is not None:
+            conditions.append("a.severity = ?")
+            params.append(severity)
+        if sensor_id is not None:
+            conditions.append("a.sensor_code = (SELECT sensor_code FROM sensors WHERE sensor_id = ?)")
+            params.append(sensor_id)
+        if start is not None:
+            self._validate_timestamp(start)
+            conditions.append("a.timestamp >= ?")
+            params.append(start)
+        if end is not None:
+            self._validate_timestamp(end)
+            conditions.append("a.timestamp <= ?")
+            params.append(end)
+        return conditions, params
+
+    def query(self, severity: Optional[str] = None, status: Optional[Status] = None, sensor_id: Optional[str] = None,
+              start: Optional[str] = None, end: Optional[str] = None, order_by: str = "alert_id", descending: bool = False,
+              after: Optional[Tuple[Any, ...]] = None, limit: int = 100) -> AlertPage:
+        """
+        Retrieve one page of the alerts matching a filter.
+
+        Filters are combined with AND and run in SQLite on the indexes over (status, severity),
+        sensor and timestamp. Pages use keyset pagination: the next page starts after the sort
+        key of the last alert of this one, so every page costs about the same however deep it is.
+
+        Args:
+            severity: only alerts of this severity ("Advisory", "Moderate" or "Critical").
+            status: only alerts with this status.
+            sensor_id: only alerts of this sensor.
+            start: only alerts at or after this HH:MM:SS time.
+            end: only alerts at or before this HH:MM:SS time.
+            order_by: "alert_id" or "timestamp" (ties broken by alert_id).
+            descending: sort from the highest key down.
+            after: next_cursor of the previous page.
+            limit: most alerts per page.
+
+        Returns:
+            AlertPage: the alerts of the page and the cursor of the next one.
+
+        Raises:
+            ValueError: If a time, order_by, after or limit is invalid.
+        """
+        if order_by not in SORT_KEYS:
+            raise ValueError(f"order_by must be one of {sorted(SORT_KEYS)}, got {order_by!r}")
+        if limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+        key = SORT_KEYS[order_by]
+        conditions, params = self._filter_sql(severity, status, sensor_id, start, end)
+        if after is not None:
+            if len(after) != len(key):
+                raise ValueError(f"after must be a cursor of {len(key)} value(s) for order_by={order_by!r}, got {after!r}")
+            conditions.append(f"({', '.join(key)}) {'<' if descending else '>'} ({', '.join('?' * len(key))})")
+            params.extend(after)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        direction = "DESC" if descending else "ASC"
+        sql = f"{ALERT_SELECT} {where} ORDER BY {', '.join(f'{col} {direction}' for col in key)} LIMIT ?"
+        alerts = self._select(sql, (*params, limit + 1))
+        next_cursor = None
+        if len(alerts) > limit:
+            del alerts[limit:]
+            last = alerts[-1]
+            next_cursor = (last.alert_id,) if order_by == "alert_id" else (last.timestamp, last.alert_id)
+        return AlertPage(alerts, next_cursor)
 
     def delete(self, alert_id: int) -> bool:
         """
@@ -145,11 +471,12 @@ class AlertDatabase:
             RuntimeError: if delete failed.
         """
         try:
-            cur = self._con.execute(
-                "DELETE FROM alerts WHERE alert_id = ?",
-                (alert_id,)
-            )
-            self._con.commit()
+            with self._write_lock:
+                cur = self._con.execute(
+                    "DELETE FROM alerts WHERE alert_id = ?",
+                    (alert_id,)
+                )
+                self._con.commit()
             return cur.rowcount > 0
         except sqlite3.OperationalError as e:
             raise RuntimeError(f"Delete failed: {e}")
@@ -169,11 +496,99 @@ class AlertDatabase:
             RuntimeError: if status has failed to be updated.
         """
         try:
-            cur = self._con.execute(
-                "UPDATE alerts SET status = ? WHERE alert_id = ?",
-                (status.value, alert_id)
-            )
-            self._con.commit()
+            with self._write_lock:
+                cur = self._con.execute(
+                    "UPDATE alerts SET status = ? WHERE alert_id = ?",
+                    (status.value, alert_id)
+                )
+                self._con.commit()
             return cur.rowcount > 0
         except sqlite3.OperationalError as e:
-            raise RuntimeError(f"Failed to update alert status: {e}")
\ No newline at end of file
+            raise RuntimeError(f"Failed to update alert status: {e}")
+
+    def update_status_many(self, status: Status, alert_ids: Optional[Iterable[int]] = None, severity: Optional[str] = None,
+                           sensor_id: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None) -> List[int]:
+        """
+        Set the status of many alerts in one transaction.
+
+        The alerts are those in alert_ids (if given) that also match the filters. Alerts that
+        already have the status are left alone.
+
+        Args:
+            status: status to set.
+            alert_ids: ids of the alerts to update.
+            severity, sensor_id, start, end: filters, as for query().
+
+        Returns:
+            list[int]: ids of the alerts whose status changed, ascending.
+
+        Raises:
+            ValueError: If neither alert_ids nor a filter is given, or a time isn't valid HH:MM:SS.
+            RuntimeError: If the update failed; no status is changed.
+        """
+        conditions, params = self._filter_sql(severity, None, sensor_id, start, end)
+        self._require_target(alert_ids, conditions)
+        conditions.append("a.status != ?")
+        params.append(status.value)
+        try:
+            return self._apply_bulk("UPDATE alerts SET status = ?", [status.value], alert_ids, conditions, params)
+        except sqlite3.OperationalError as e:
+            raise RuntimeError(f"Failed to update alert statuses: {e}")
+
+    def delete_many(self, alert_ids: Optional[Iterable[int]] = None, severity: Optional[str] = None, status: Optional[Status] = None,
+                    sensor_id: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None) -> List[int]:
+        """
+        Delete many alerts in one transaction.
+
+        The alerts are those in alert_ids (if given) that also match the filters.
+
+        Args:
+            alert_ids: ids of the alerts to delete.
+            severity, status, sensor_id, start, end: filters, as for query().
+
+        Returns:
+            list[int]: ids of the deleted alerts, ascending.
+
+        Raises:
+            ValueError: If neither alert_ids nor a filter is given, or a time isn't valid HH:MM:SS.
+            RuntimeError: If the delete failed; nothing is deleted.
+        """
+        conditions, params = self._filter_sql(severity, status, sensor_id, start, end)
+        self._require_target(alert_ids, conditions)
+        try:
+            return self._apply_bulk("DELETE FROM alerts", [], alert_ids, conditions, params)
+        except sqlite3.OperationalError as e:
+            raise RuntimeError(f"Delete failed: {e}")
+
+    @staticmethod
+    def _require_target(alert_ids: Optional[Iterable[int]], conditions: List[str]) -> None:
+        """Refuse a bulk change with neither ids nor a filter, which would touch every alert."""
+        if alert_ids is None and not conditions:
+            raise ValueError("pass alert_ids or at least one filter")
+
+    def _apply_bulk(self, statement: str, statement_params: List[Any], alert_ids: Optional[Iterable[int]],
+                    conditions: List[str], params: List[Any]) -> List[int]:
+        """
+        Run an UPDATE or DELETE statement on the matching alerts in one write transaction.
+
+        The ids of the alerts matching alert_ids and conditions are selected first, then the
+        statement runs on them by primary key, BULK_CHUNK ids at a time. Both steps hold the
+        write lock, so the ids returned are exactly the alerts changed.
+        """
+        where = " AND ".join(conditions)
+        with self._write_lock, self._con:
+            if alert_ids is None:
+                targets = [row[0] for row in self._con.execute(f"SELECT a.alert_id FROM alerts a WHERE {where} ORDER BY a.alert_id", params)]
+            else:
+                ids = sorted({int(alert_id) for alert_id in alert_ids})
+                targets = []
+                for i in range(0, len(ids), BULK_CHUNK):
+                    chunk = ids[i:i + BULK_CHUNK]
+                    in_chunk = f"a.alert_id IN ({', '.join('?' * len(chunk))})"
+                    sql = f"SELECT a.alert_id FROM alerts a WHERE {' AND '.join([in_chunk] + conditions)} ORDER BY a.alert_id"
+                    targets.extend(row[0] for row in self._con.execute(sql, (*chunk, *params)))
+            for i in range(0, len(targets), BULK_CHUNK):
+                chunk = targets[i:i + BULK_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                self._con.execute(f"{statement} WHERE alert_id IN ({placeholders})", (*statement_params, *chunk))
+        return targets
@@ -1,56 +1,406 @@
+import numpy as np
 import pandas as pd
-import json
 import logging
-from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List
 from abc import ABC, abstractmethod
-from Abstractions import Fault, Severity, Status
+from Abstractions import Fault, FaultBatch, Severity, Status
+from ActiveFaults import RAISED, CLEARED, ActiveFaultTable
+from CompiledRules import CompiledRuleSet, SensorRuleTable
+from RingBuffer import RingBuffer
+from RuleCache import RULE_SET_CACHE
+from Timestamps import SECONDS_PER_DAY, timestamp_seconds
 
 # Configure logging for the module.
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+def elapsed_seconds(later: np.ndarray | float, earlier: np.ndarray | float) -> np.ndarray | float:
+    """Seconds from one time of day to the next reading's, counting a step back of over half a day as crossing midnight."""
+    elapsed = np.subtract(later, earlier)
+    return np.where(elapsed < -SECONDS_PER_DAY / 2, elapsed + SECONDS_PER_DAY, elapsed)
+
+def unwrap_midnight(seconds: np.ndarray, last: float) -> np.ndarray:
+    """
+    Make consecutive times of day continuous across midnight.
+
+    A step back of more than half a day from the previous reading is taken as the next day,
+    so 23:59:59 followed by 00:00:01 becomes 86399 and 86401.
+
+    Args:
+        seconds: times of day of consecutive readings, in file order.
+        last: continuous time of the reading before seconds[0], as returned by an earlier
+            call, or NaN if there is none.
+
+    Returns:
+        np.ndarray: the times, plus SECONDS_PER_DAY for every midnight crossed since day 0.
+    """
+    seconds = np.asarray(seconds, dtype=float)
+    if not len(seconds):
+        return seconds
+    known = not np.isnan(last)
+    previous = np.concatenate([[last % SECONDS_PER_DAY if known else seconds[0]], seconds[:-1]])
+    days = (last // SECONDS_PER_DAY if known else 0) + np.cumsum(seconds - previous < -SECONDS_PER_DAY / 2)
+    return seconds + days * SECONDS_PER_DAY
+
 class FaultRule(ABC):
     """Abstract base class for a fault detection rule.
     
     Defines a standard interface for evaluating sensor values against
     fault thresholds. Subclasses then implement specific comparison logic
     (e.g. GreaterThanRule, LessThanRule, EqualRule).
+
+    The condition class attribute names the comparison so that CompiledRuleSet can
+    group rules into threshold tables. Rules with an unrecognised condition are
+    evaluated through triggered_mask() instead.
+
+    Once raised, a fault only clears when is_cleared() holds, which subclasses widen by
+    hysteresis so that a reading hovering around the threshold does not toggle the fault.
+    debounce is the number of consecutive samples needed to raise or clear it.
     
     """
 
-    def __init__(self, sensor_id: str, threshold: float, fault_code: str, severity: str, message: str) -> None:
+    condition: str = ""
+
+    def __init__(self, sensor_id: str, threshold: float, fault_code: str, severity: str, message: str,
+                 hysteresis: float = 0.0, debounce: int = 1) -> None:
+        if hysteresis < 0:
+            raise ValueError(f"Rule '{fault_code}' has negative hysteresis {hysteresis}")
+        if debounce < 1:
+            raise ValueError(f"Rule '{fault_code}' has debounce {debounce}, expected at least 1")
         self.sensor_id = sensor_id
         self.threshold = threshold
         self.fault_code = fault_code
         self.severity = Severity[severity.capitalize()]
         self.message = message
+        self.hysteresis = hysteresis
+        self.debounce = debounce
 
     @abstractmethod
     def is_triggered(self, value: float) -> bool:
         """Evaluate whether the rule condition is met."""
         pass
 
+    def triggered_mask(self, values: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the rule condition for a whole array of values at once.
+
+        The comparison subclasses are written with plain operators, so is_triggered()
+        broadcasts over a NumPy array and returns one boolean per element.
+
+        Args:
+            values: array of sensor readings.
+
+        Returns:
+            np.ndarray: boolean mask, True where the rule is triggered.
+        """
+        return np.asarray(self.is_triggered(values), dtype=bool)
+
+    def is_cleared(self, value: float) -> bool:
+        """Evaluate whether a raised fault may clear. By default, whenever the rule is not triggered."""
+        return ~np.asarray(self.is_triggered(value), dtype=bool)
+
+    def cleared_mask(self, values: np.ndarray) -> np.ndarray:
+        """Evaluate is_cleared() for a whole array of values at once."""
+        return np.asarray(self.is_cleared(values), dtype=bool)
+
 class GreaterThanRule(FaultRule):
     """Rule triggered when value exceeds the threshold."""
+    condition = ">"
+
     def is_triggered(self, value: float) -> bool:
         return value > self.threshold
 
+    def is_cleared(self, value: float) -> bool:
+        return value <= self.threshold - self.hysteresis
+
 
 class LessThanRule(FaultRule):
     """Rule triggered when value falls below the threshold."""
+    condition = "<"
+
     def is_triggered(self, value: float) -> bool:
         return value < self.threshold
 
+    def is_cleared(self, value: float) -> bool:
+        return value >= self.threshold + self.hysteresis
+
 class EqualRule(FaultRule):
     """Rule triggered when value equals the threshold."""
+    condition = "="
+
     def is_triggered(self, value: float) -> bool:
         return value == self.threshold
+
+    def is_cleared(self, value: float) -> bool:
+        return abs(value - self.threshold) > self.hysteresis
+
+class BandRule(FaultRule):
+    """Abstract rule comparing a value against an inclusive [lower, upper] band.
+
+    The band limits are held in lower and upper, and threshold holds the (lower, upper) pair.
+
+    """
+
+    def __init__(self, sensor_id: str, lower: float, upper: float, fault_code: str, severity: str, message: str,
+                 hysteresis: float = 0.0, debounce: int = 1) -> None:
+        if lower > upper:
+            raise ValueError(f"Band rule '{fault_code}' has min {lower} greater than max {upper}")
+        super().__init__(sensor_id, (lower, upper), fault_code, severity, message, hysteresis, debounce)
+        self.lower = lower
+        self.upper = upper
+
+class InsideBandRule(BandRule):
+    """Rule triggered when value lies within the band (limits included)."""
+    condition = "inside"
+
+    def is_triggered(self, value: float) -> bool:
+        return (value >= self.lower) & (value <= self.upper)
+
+    def is_cleared(self, value: float) -> bool:
+        return (value < self.lower - self.hysteresis) | (value > self.upper + self.hysteresis)
+
+class OutsideBandRule(BandRule):
+    """Rule triggered when value lies outside the band."""
+    condition = "outside"
+
+    def is_triggered(self, value: float) -> bool:
+        return (value < self.lower) | (value > self.upper)
+
+    def is_cleared(self, value: float) -> bool:
+        return (value >= self.lower + self.hysteresis) & (value <= self.upper - self.hysteresis)
+
+class TemporalRule(FaultRule):
+    """Abstract rule comparing a signal derived from a sensor's recent readings against the threshold.
+
+    Subclasses turn a time-ordered series of readings into a derived signal (a rate of change,
+    a rolling mean, ...) with series(), which is vectorized over a whole batch, and update(),
+    which advances one reading at a time. Both continue from, and update, a small state object
+    created by new_state() that carries the samples the next call needs in a RingBuffer. The
+    state belongs to the caller (FaultDetection), so compiled rules stay immutable and can
+    be shared.
+
+    is_triggered() and is_cleared() are applied to the derived signal rather than the raw
+    reading. operator is ">" or "<"; where the signal is undefined (NaN) the rule neither
+    triggers nor clears.
+
+    """
+
+    temporal = True
+
+    def __init__(self, sensor_id: str, threshold: float, fault_code: str, severity: str, message: str,
+                 operator: str = ">", hysteresis: float = 0.0, debounce: int = 1) -> None:
+        if operator not in (">", "<"):
+            raise ValueError(f"Rule '{fault_code}' has operator {operator!r}, expected '>' or '<'")
+        super().__init__(sensor_id, threshold, fault_code, severity, message, hysteresis, debounce)
+        self.operator = operator
+
+    def is_triggered(self, value: float) -> bool:
+        return value > self.threshold if self.operator == ">" else value < self.threshold
+
+    def is_cleared(self, value: float) -> bool:
+        if self.operator == ">":
+            return value <= self.threshold - self.hysteresis
+        return value >= self.threshold + self.hysteresis
+
+    @abstractmethod
+    def new_state(self) -> RingBuffer:
+        """Create the empty state carried between calls to series() and update()."""
+        pass
+
+    @abstractmethod
+    def series(self, values: np.ndarray, seconds: np.ndarray, state: RingBuffer) -> np.ndarray:
+        """
+        Compute the derived signal for consecutive readings of one sensor.
+
+        Args:
+            values: readings, oldest first.
+            seconds: time of each reading in seconds.
+            state: state left by the previous call, updated in place.
+
+        Returns:
+            np.ndarray: derived signal per reading, NaN where undefined.
+        """
+        pass
+
+    @abstractmethod
+    def update(self, value: float, second: float, state: RingBuffer) -> float:
+        """Advance the derived signal by one reading (see series())."""
+        pass
+
+class RateOfChangeRule(TemporalRule):
+    """Rule triggered when a reading changes faster than threshold units per second.
+
+    The rate is taken against the previous valid reading of the sensor, counting a step back
+    of over half a day as crossing midnight (see elapsed_seconds()); readings with the same
+    timestamp as the previous one, or an earlier one, have no defined rate.
+
+    """
+    condition = "rate"
+
+    def new_state(self) -> RingBuffer:
+        # The last valid (value, second) sample.
+        return RingBuffer(1, width=2)
+
+    def series(self, values: np.ndarray, seconds: np.ndarray, state: RingBuffer) -> np.ndarray:
+        history = state.to_array()
+        all_values = np.concatenate([history[:, 0], values])
+        all_seconds = np.concatenate([history[:, 1], seconds])
+
+        # Index of the latest valid reading before each position.
+        positions = np.arange(len(all_values))
+        valid = ~np.isnan(all_values)
+        last_valid = np.maximum.accumulate(np.where(valid, positions, -1))
+        previous = np.concatenate([[-1], last_valid[:-1]])
+
+        rates = np.full(len(all_values), np.nan)
+        has_previous = valid & (previous >= 0)
+        prior = previous[has_previous]
+        elapsed = elapsed_seconds(all_seconds[has_previous], all_seconds[prior])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rates[has_previous] = np.where(elapsed > 0, (all_values[has_previous] - all_values[prior]) / elapsed, np.nan)
+
+        if valid.any():
+            newest = last_valid[-1]
+            state.replace([[all_values[newest], all_seconds[newest]]])
+        return rates[len(history):]
+
+    def update(self, value: float, second: float, state: RingBuffer) -> float:
+        if np.isnan(value):
+            return np.nan
+        rate = np.nan
+        if len(state):
+            last_value, last_second = state.right()
+            elapsed = elapsed_seconds(second, last_second)
+            if elapsed > 0:
+                rate = (value - last_value) / elapsed
+        state.append((value, second))
+        return rate
+
+class PersistenceRule(TemporalRule):
+    """Rule triggered when the comparison holds for samples consecutive readings.
+
+    The derived signal is the least extreme of the last samples readings (their minimum for
+    ">" and maximum for "<"), so it only crosses the threshold once every one of them does,
+    and a single reading back across the threshold clears it.
+
+    """
+    condition = "persistence"
+
+    def __init__(self, sensor_id: str, threshold: float, fault_code: str, severity: str, message: str,
+                 samples: int, operator: str = ">", hysteresis: float = 0.0, debounce: int = 1) -> None:
+        if samples < 1:
+            raise ValueError(f"Rule '{fault_code}' has samples {samples}, expected at least 1")
+        super().__init__(sensor_id, threshold, fault_code, severity, message, operator, hysteresis, debounce)
+        self.samples = samples
+
+    def new_state(self) -> RingBuffer:
+        # The last samples - 1 readings.
+        return RingBuffer(max(self.samples - 1, 1))
+
+    def series(self, values: np.ndarray, seconds: np.ndarray, state: RingBuffer) -> np.ndarray:
+        history = state.to_array()[:, 0] if self.samples > 1 else np.empty(0)
+        all_values = np.concatenate([history, values])
+        extremes = np.full(len(all_values), np.nan)
+        if len(all_values) >= self.samples:
+            windows = np.lib.stride_tricks.sliding_window_view(all_values, self.samples)
+            extremes[self.samples - 1:] = windows.min(axis=1) if self.operator == ">" else windows.max(axis=1)
+        if self.samples > 1:
+            state.replace(all_values[:, None])
+        return extremes[len(history):]
+
+    def update(self, value: float, second: float, state: RingBuffer) -> float:
+        if self.samples == 1:
+            return value
+        extreme = np.nan
+        if len(state) == self.samples - 1:
+            window = np.append(state.to_array()[:, 0], value)
+            extreme = window.min() if self.operator == ">" else window.max()
+        state.append((value,))
+        return extreme
+
+class RollingMeanRule(TemporalRule):
+    """Rule triggered when the mean of the readings in the last window seconds crosses the threshold.
+
+    The window of a reading at time t covers the valid readings with times in (t - window, t].
+    Readings are taken in the order they arrive, with times made continuous across midnight
+    (see unwrap_midnight()). A reading that is still earlier than the one before it, such as a
+    recording restarting, starts a new window.
+
+    """
+    condition = "rolling_mean"
+
+    def __init__(self, sensor_id: str, threshold: float, fault_code: str, severity: str, message: str,
+                 window: float, operator: str = ">", hysteresis: float = 0.0, debounce: int = 1) -> None:
+        if window <= 0:
+            raise ValueError(f"Rule '{fault_code}' has window {window}, expected a positive number of seconds")
+        super().__init__(sensor_id, threshold, fault_code, severity, message, operator, hysteresis, debounce)
+        self.window = window
+
+    def new_state(self) -> RingBuffer:
+        # The valid (value, second) samples still inside the window; grows with the sample rate.
+        return RingBuffer(16, width=2, grow=True)
+
+    def series(self, values: np.ndarray, seconds: np.ndarray, state: RingBuffer) -> np.ndarray:
+        history = state.to_array()
+        valid = ~np.isnan(values) & ~np.isnan(seconds)
+        result = np.full(len(values), np.nan)
+        if not valid.any():
+            return result
+        last = history[-1, 1] if len(history) else np.nan
+        all_values = np.concatenate([history[:, 0], values[valid]])
+        all_seconds = np.concatenate([history[:, 1], unwrap_midnight(seconds[valid], last)])
+
+        # Each step back in time starts a new window. Offsetting every window run by more than
+        # the span of the times keeps the keys ascending, so searchsorted never crosses runs.
+        runs = np.concatenate([[0], np.cumsum(np.diff(all_seconds) < 0)])
+        keys = all_seconds + runs * (np.ptp(all_seconds) + self.window + 1)
+        sums = np.concatenate([[0.0], np.cumsum(all_values)])
+        ends = np.arange(1, len(all_values) + 1)
+        starts = np.searchsorted(keys, keys - self.window, side="right")
+        means = (sums[ends] - sums[starts]) / (ends - starts)
+
+        result[valid] = means[len(history):]
+        keep = np.searchsorted(keys, keys[-1] - self.window, side="right")
+        state.replace(np.column_stack([all_values[keep:], all_seconds[keep:]]))
+        return result
+
+    def update(self, value: float, second: float, state: RingBuffer) -> float:
+        if np.isnan(value) or np.isnan(second):
+            return np.nan
+        if len(state):
+            last = state.right()[1]
+            second = float(unwrap_midnight([second], last)[0])
+            if second < last:
+                state.replace(np.empty((0, 2)))
+        state.append((value, second))
+        while state.left()[1] <= second - self.window:
+            state.popleft()
+        return float(state.to_array()[:, 0].mean())
     
 class FaultDetection():
-    """Detects faults from sensor data using configurable fault rules sets."""
+    """Detects faults from sensor data using configurable fault rules sets.
+
+    Raised faults are tracked in an ActiveFaultTable keyed by (sensor_id, fault_code), and
+    detection only reports transitions: a Fault with status ACTIVE when a key is raised and
+    one with status RESOLVED when it clears. Readings of a fault that is already active do
+    not produce new records.
+
+    """
     def __init__(self) -> None:
-        self.active_faults: List[Fault] = []
-        self.detection_rules: List[FaultRule] = []
+        self.active_faults: ActiveFaultTable = ActiveFaultTable()
+        self.compiled_rules: CompiledRuleSet = CompiledRuleSet([])
+        self.rules_path: str | None = None
+        # History carried between calls for temporal rules, keyed by (sensor_id, rule position).
+        self.temporal_states: Dict[tuple[str, int], RingBuffer] = {}
+
+    @property
+    def detection_rules(self) -> List[FaultRule]:
+        """The loaded rules, in file order."""
+        return self.compiled_rules.rules
+
+    @property
+    def rule_index(self) -> Dict[str, List[FaultRule]]:
+        """The loaded rules grouped by sensor_id, in file order."""
+        return self.compiled_rules.rule_index
     
     def load_rules(self, file_path: str) -> None:
         """
@@ -58,15 +408,52 @@ class FaultDetection():
 
         Each JSON rule is converted into the appropriate FaultRule subclass based on its condition (>, <, =),
         allowing each rule type to evaluate its logic independently through polymorphism.
+        Band rules use the "inside" or "outside" condition with "min" and "max" instead of "threshold".
+        Temporal rules compare a signal derived from recent readings against "threshold" using
+        "operator" (">" by default): "rate" (change per second), "persistence" (the comparison
+        holds for "samples" consecutive readings) and "rolling_mean" (mean over "window" seconds).
+        Any rule may also set "hysteresis" (margin a reading must clear by) and "debounce"
+        (consecutive samples needed to raise or clear the fault).
+        The rules are also indexed by sensor_id (in file order) so that each record is only
+        checked against the rules for its own sensor, and compiled into per-sensor threshold
+        tables for batch detection.
+
+        Compiled rule sets are cached by path, modification time and content hash (see
+        RuleCache), so calling this again for an unchanged file only costs a stat. The new
+        rule set replaces the old one in a single assignment, and each detection call works
+        on the rule set that was current when it started.
 
         Args:
             file_path: location of JSON rules.
 
+        Raises:
+            FileNotFoundError: If the rules file does not exist.
+            ValueError: If a rule has invalid parameters.
+
+        """
+        compiled = RULE_SET_CACHE.get(file_path, self._compile_rules)
+        if compiled is not self.compiled_rules:
+            self.temporal_states = {}
+        self.compiled_rules = compiled
+        self.rules_path = str(file_path)
+
+    def refresh_rules(self) -> bool:
+        """
+        Hot-reload the rules file last passed to load_rules() if it has changed on disk.
+
+        Returns:
+            bool: whether a different rule set is now in use.
         """
-        with open(Path(file_path), "r") as f:
-            rules_data = json.load(f)
+        if self.rules_path is None:
+            return False
+        previous = self.compiled_rules
+        self.load_rules(self.rules_path)
+        return self.compiled_rules is not previous
 
-        self.detection_rules = []
+    @staticmethod
+    def _compile_rules(rules_data: List[Dict[str, Any]]) -> CompiledRuleSet:
+        """Create rule objects from parsed JSON rules and compile them into a CompiledRuleSet."""
+        detection_rules: List[FaultRule] = []
         for rule in rules_data:
             condition = rule["condition"]
             if condition == ">":
@@ -75,7 +462,9 @@ class FaultDetection():
                     threshold=rule["threshold"],
                     fault_code=rule["fault_code"],
                     severity=rule["severity"],
-                    message=rule["message"]
+                    message=rule["message"],
+                    hysteresis=rule.get("hysteresis", 0.0),
+                    debounce=rule.get("debounce", 1)
                 )
             elif condition == "<":
                 rule_obj = LessThanRule(
@@ -83,7 +472,9 @@ class FaultDetection():
                     threshold=rule["threshold"],
                     fault_code=rule["fault_code"],
                     severity=rule["severity"],
-                    message=rule["message"]
+                    message=rule["message"],
+                    hysteresis=rule.get("hysteresis", 0.0),
+                    debounce=rule.get("debounce", 1)
                 )
             elif condition in ("=","=="):
                 rule_obj = EqualRule(
@@ -91,23 +482,62 @@ class FaultDetection():
                     threshold=rule["threshold"],
                     fault_code=rule["fault_code"],
                     severity=rule["severity"],
-                    message=rule["message"]                  
+                    message=rule["message"],
+                    hysteresis=rule.get("hysteresis", 0.0),
+                    debounce=rule.get("debounce", 1)
+                )
+            elif condition in ("inside", "outside"):
+                band_rule = InsideBandRule if condition == "inside" else OutsideBandRule
+                rule_obj = band_rule(
+                    sensor_id=rule["sensor_id"],
+                    lower=rule["min"],
+                    upper=rule["max"],
+                    fault_code=rule["fault_code"],
+                    severity=rule["severity"],
+                    message=rule["message"],
+                    hysteresis=rule.get("hysteresis", 0.0),
+                    debounce=rule.get("debounce", 1)
+                )
+            elif condition in ("rate", "persistence", "rolling_mean"):
+                extra: Dict[str, Any] = {}
+                if condition == "persistence":
+                    temporal_rule = PersistenceRule
+                    extra["samples"] = rule["samples"]
+                elif condition == "rolling_mean":
+                    temporal_rule = RollingMeanRule
+                    extra["window"] = rule["window"]
+                else:
+                    temporal_rule = RateOfChangeRule
+                rule_obj = temporal_rule(
+                    sensor_id=rule["sensor_id"],
+                    threshold=rule["threshold"],
+                    fault_code=rule["fault_code"],
+                    severity=rule["severity"],
+                    message=rule["message"],
+                    operator=rule.get("operator", ">"),
+                    hysteresis=rule.get("hysteresis", 0.0),
+                    debounce=rule.get("debounce", 1),
+                    **extra
                 )
             else: 
                 continue
 
-            self.detection_rules.append(rule_obj)
+            detection_rules.append(rule_obj)
+
+        return CompiledRuleSet(detection_rules)
 
     def detect_faults(self, sensor_data: Dict[str, Any]) -> List[Fault]:
         """
-        Apply all loaded FaultRule objects to a single sensor record.
+        Apply the loaded FaultRule objects for this record's sensor to a single sensor record.
 
-        Each rule evaluates its own condition via its is_triggered() method, demonstrating polymorphism.
-        When a rule's condition is satisfied, a corresponding Fault object is created and returned.
+        Each rule evaluates its own condition via its is_triggered() and is_cleared() methods,
+        demonstrating polymorphism. The results are fed through the active fault table per
+        fault code, and a Fault is returned for every key that is raised (status ACTIVE) or
+        cleared (status RESOLVED) by this record.
         
         Note:
-            This method is called internally by detect_from_batch(), 
-            which applies detection to an entire pandas DataFrame.
+            detect_from_batch(vectorized=False) calls this method once per row and serves as
+            the reference for the vectorized path.
 
         Args:
             sensor_data (dict): 
@@ -119,36 +549,76 @@ class FaultDetection():
                 - "unit" (str): The unit of measurement (e.g., "°C", "psi", "V").
 
         Returns:
-            list[Fault]: A list of detected fault objects for the sensor. 
-            Returns an empty list if no rules are triggered.
+            list[Fault]: The fault transitions caused by this record, in rule order.
+            Returns an empty list if no fault was raised or cleared.
         """
+        return self._detect_record(sensor_data, self.compiled_rules)
 
-        detected_faults: List[Fault] = []
-        for rule in self.detection_rules:
-             if rule.sensor_id == sensor_data.get("sensor_id"):
-                value = sensor_data.get("value")
-                if rule.is_triggered(value):
-                    fault = Fault(
-                        fault_id=rule.fault_code,
-                        sensor_id=sensor_data["sensor_id"],
-                        severity=rule.severity,
-                        description=rule.message,
-                        timestamp = sensor_data["timestamp"],
-                        status=Status.ACTIVE
-                    )
-                    detected_faults.append(fault)
-                    self.active_faults.append(fault)
-        return detected_faults
+    def _detect_record(self, sensor_data: Dict[str, Any], compiled: CompiledRuleSet) -> List[Fault]:
+        """Apply the rules of one compiled rule set to a single sensor record (see detect_faults())."""
+        return [fault for _, fault in self._record_transitions(sensor_data, compiled)]
+
+    def _record_transitions(self, sensor_data: Dict[str, Any], compiled: CompiledRuleSet) -> List[tuple[int, Fault]]:
+        """The fault transitions of one sensor record, as (rule position in compiled.rules, Fault) in rule order."""
+        sensor_id = sensor_data.get("sensor_id")
+        table = compiled.get(sensor_id)
+        if table is None:
+            return []
+
+        value = sensor_data.get("value")
+        signals: Dict[int, float] = {}
+        if table.temporal_rules:
+            second = sensor_data.get("seconds")
+            if second is None:
+                second = timestamp_seconds([sensor_data.get("timestamp")])[0]
+            second = float(second) if second >= 0 else np.nan
+            for position in table.temporal_rules:
+                state = self._temporal_state(sensor_id, table, position)
+                signals[position] = table.rules[position].update(float(value), second, state)
+
+        transitions: List[tuple[int, Fault]] = []
+        for key, fault_code in enumerate(table.fault_codes):
+            positions = table.key_rules[key]
+            triggered = [p for p in positions if table.rules[p].is_triggered(signals.get(p, value))]
+            cleared = all(table.rules[p].is_cleared(signals.get(p, value)) for p in positions)
+
+            change = self.active_faults.observe(sensor_id, fault_code, bool(triggered), cleared, table.key_debounce[key])
+            if change == 0:
+                continue
+
+            position = triggered[0] if change == RAISED else positions[0]
+            rule = table.rules[position]
+            fault = Fault(
+                fault_id=rule.fault_code,
+                sensor_id=sensor_id,
+                severity=rule.severity,
+                description=rule.message,
+                timestamp = sensor_data["timestamp"],
+                status=Status.ACTIVE if change == RAISED else Status.RESOLVED
+            )
+            if change == RAISED:
+                self.active_faults.set_fault(sensor_id, fault_code, fault)
+            transitions.append((int(table.positions[position]), fault))
+
+        transitions.sort(key=lambda item: item[0])
+        return transitions
     
-    def detect_from_batch(self, data_frame: pd.DataFrame) -> List[Fault]:
+    def detect_from_batch(self, data_frame: pd.DataFrame, vectorized: bool = True) -> FaultBatch:
         """
         Apply fault detection to all rows in a DataFrame.
 
+        By default rules are evaluated column-wise (see _detect_vectorized()). Passing
+        vectorized=False falls back to calling detect_faults() once per row; both paths return
+        a columnar FaultBatch, which only builds Fault objects when iterated or indexed, with
+        the same faults in the same order. Either way each sensor's readings are processed in
+        file order, the order they were recorded in, and the faults are listed by row.
+
         Args:
             data_frame: Sensor data with the required columns.
+            vectorized: evaluate rules column-wise instead of row by row.
 
         Returns:
-            list[Fault]: A list of all detected faults.
+            FaultBatch: All detected faults.
 
         Raises:
             TypeError: If format other than a dataframe is supplied.
@@ -156,13 +626,261 @@ class FaultDetection():
         """
         if not isinstance(data_frame, pd.DataFrame):
             raise TypeError("Expected a pandas DataFrame for detect_from_batch()")
-        
-        all_faults: List[Fault] = []
-        for index, row in data_frame.iterrows():
-            row_faults = self.detect_faults(row.to_dict())
-            all_faults.extend(row_faults)
-        return all_faults
+
+        if vectorized:
+            return self._detect_vectorized(data_frame)
+
+        compiled = self.compiled_rules
+        detected: List[tuple[int, int, Fault]] = []
+        for position, record in enumerate(data_frame.to_dict("records")):
+            detected.extend((position, rule, fault) for rule, fault in self._record_transitions(record, compiled))
+        if not detected:
+            return FaultBatch.empty(compiled.rules)
+
+        rows, rule_positions, faults = zip(*detected)
+        rule_positions = np.array(rule_positions, dtype=np.int64)
+        severity_codes = np.array([rule.severity.value for rule in compiled.rules], dtype=np.int8)
+        return FaultBatch(
+            row_index=np.array(rows, dtype=np.int64),
+            rule_index=rule_positions,
+            severity=severity_codes[rule_positions],
+            timestamp=np.array([fault.timestamp for fault in faults], dtype=object),
+            resolved=np.array([fault.status == Status.RESOLVED for fault in faults], dtype=bool),
+            rules=compiled.rules
+        )
+
+    def detect_stream(self, chunks: Iterable[pd.DataFrame | List[Dict[str, Any]]]) -> Iterator[FaultBatch]:
+        """
+        Apply fault detection to a stream of sensor record chunks.
+
+        Chunks are pulled from the iterable one at a time and the faults for each are yielded
+        before the next chunk is read, so only one chunk is held in memory at once. This pairs
+        with SensorIntegration.read_csv_chunks() for recordings too large to load whole.
+
+        Args:
+            chunks: iterable of DataFrames, or of lists of sensor record dicts.
+
+        Yields:
+            FaultBatch: the faults detected in each chunk, with row_index relative to the chunk.
+        """
+        for chunk in chunks:
+            if not isinstance(chunk, pd.DataFrame):
+                chunk = pd.DataFrame.from_records(list(chunk), columns=["timestamp", "sensor_id", "sensor_type", "value", "unit"])
+            yield self.detect_from_batch(chunk)
+
+    def _detect_vectorized(self, data_frame: pd.DataFrame) -> FaultBatch:
+        """
+        Classify the rows of each sensor against its compiled threshold table.
+
+        Rows are grouped by sensor_id once (see _group_by_sensor()), and each sensor's values
+        are classified against all of its rules at once by SensorRuleTable.evaluate(). The hits
+        are then turned into fault transitions by _apply_transitions().
+
+        Args:
+            data_frame: Sensor data with the required columns.
+
+        Returns:
+            FaultBatch: fault transitions, with rule_index pointing into detection_rules.
+        """
+        # Work on one rule set for the whole call, even if load_rules() swaps in a new one.
+        compiled = self.compiled_rules
+        groups = self._group_by_sensor(compiled, data_frame)
+        if not groups:
+            return FaultBatch.empty(compiled.rules)
+
+        values = data_frame["value"].to_numpy(dtype=float)
+        metrics = self._temporal_metrics(compiled, data_frame, groups)
+        hits = [compiled.get(sensor_id).evaluate(values[rows], signals) for (sensor_id, rows), signals in zip(groups, metrics)]
+        return self._apply_transitions(compiled, data_frame, groups, hits, metrics)
+
+    def _temporal_state(self, sensor_id: str, table: SensorRuleTable, position: int) -> RingBuffer:
+        """Return the carried state of one temporal rule, creating it on first use."""
+        key = (sensor_id, int(table.positions[position]))
+        state = self.temporal_states.get(key)
+        if state is None:
+            state = self.temporal_states[key] = table.rules[position].new_state()
+        return state
+
+    def _temporal_metrics(self, compiled: CompiledRuleSet, data_frame: pd.DataFrame,
+                          groups: List[tuple[str, np.ndarray]]) -> List[Dict[int, np.ndarray] | None]:
+        """
+        Compute the derived signal of every temporal rule for each sensor group.
+
+        Each rule's series() runs once over all of the sensor's readings in the batch, continuing
+        from the state left by the previous call.
+
+        Args:
+            compiled: rule set to look sensors up in.
+            data_frame: Sensor data with the required columns.
+            groups: (sensor_id, row positions) per sensor, from _group_by_sensor().
+
+        Returns:
+            list: per group, the signal per temporal rule position, or None if it has none.
+        """
+        metrics: List[Dict[int, np.ndarray] | None] = [None] * len(groups)
+        if not any(compiled.get(sensor_id).temporal_rules for sensor_id, _ in groups):
+            return metrics
+
+        values = data_frame["value"].to_numpy(dtype=float)
+        seconds = self._reading_seconds(data_frame)
+        for index, (sensor_id, rows) in enumerate(groups):
+            table = compiled.get(sensor_id)
+            if table.temporal_rules:
+                metrics[index] = {
+                    position: table.rules[position].series(
+                        values[rows], seconds[rows], self._temporal_state(sensor_id, table, position)
+                    )
+                    for position in table.temporal_rules
+                }
+        return metrics
+
+    @staticmethod
+    def _reading_seconds(data_frame: pd.DataFrame) -> np.ndarray:
+        """Time of day of each reading in seconds, NaN where the timestamp is invalid."""
+        # SensorIntegration adds the seconds column; other frames have their timestamps parsed here.
+        if "seconds" in data_frame.columns:
+            seconds = data_frame["seconds"].to_numpy(dtype=float, copy=True)
+        else:
+            seconds = timestamp_seconds(data_frame["timestamp"].to_numpy()).astype(float)
+        seconds[seconds < 0] = np.nan
+        return seconds
+
+    @staticmethod
+    def _group_by_sensor(compiled: CompiledRuleSet, data_frame: pd.DataFrame) -> List[tuple[str, np.ndarray]]:
+        """
+        Group row positions by sensor_id, skipping sensors that have no rules.
+
+        Rules are looked up once per distinct sensor, by code, rather than once per row.
+        Rows belonging to sensors with no rules (or a missing sensor_id) are dropped before
+        any per-row work is done. Grouping is stable, so each sensor's rows keep their file
+        order: the raise/clear state machine and temporal windows see the readings in the
+        order they were recorded, including across midnight.
+
+        Args:
+            compiled: rule set to look sensors up in.
+            data_frame: Sensor data with the required columns.
+
+        Returns:
+            list: (sensor_id, ascending row positions) per sensor with rules.
+        """
+        if data_frame.empty or not len(compiled):
+            return []
+
+        column = data_frame["sensor_id"]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            # Dictionary-encoded ids (see SensorRegistry): the codes already index the distinct sensors.
+            codes, sensors = column.cat.codes.to_numpy(), column.cat.categories.to_numpy(dtype=object)
+        else:
+            codes, sensors = pd.factorize(column)
+        has_rules = compiled.table_codes(sensors) >= 0
+        if not has_rules.any():
+            return []
+
+        # A code of -1 marks a missing sensor_id.
+        candidates = np.flatnonzero((codes >= 0) & has_rules[codes])
+        if candidates.size == 0:
+            return []
+        grouped = candidates[np.argsort(codes[candidates], kind="stable")]
+        boundaries = np.flatnonzero(np.diff(codes[grouped])) + 1
+        return [(sensors[codes[rows[0]]], rows) for rows in np.split(grouped, boundaries)]
+
+    def _apply_transitions(self, compiled: CompiledRuleSet, data_frame: pd.DataFrame,
+                           groups: List[tuple[str, np.ndarray]], hits: List[tuple[np.ndarray, np.ndarray]],
+                           metrics: List[Dict[int, np.ndarray] | None] | None = None) -> FaultBatch:
+        """
+        Run each sensor's rule hits through the active fault table.
+
+        Every fault key that fired or is already tracked is fed through
+        ActiveFaultTable.observe_series() in row order. The resulting transitions are ordered
+        by row position first and rule position second, which is the order the row-by-row
+        path produces them in.
+
+        Args:
+            compiled: rule set the hits were produced with.
+            data_frame: Sensor data with the required columns.
+            groups: (sensor_id, row positions) per sensor, from _group_by_sensor().
+            hits: (rows, rules) per group from SensorRuleTable.evaluate(), positions local to the group and table.
+            metrics: temporal rule signals per group, from _temporal_metrics().
+
+        Returns:
+            FaultBatch: fault transitions, with rule_index pointing into compiled.rules.
+        """
+        rules = compiled.rules
+        values = data_frame["value"].to_numpy(dtype=float)
+        timestamps = data_frame["timestamp"].to_numpy(dtype=object)
+
+        out_rows: List[np.ndarray] = []
+        out_rules: List[np.ndarray] = []
+        out_resolved: List[np.ndarray] = []
+        metrics = metrics if metrics is not None else [None] * len(groups)
+        for (sensor_id, rows), (hit_rows, hit_rules), signals in zip(groups, hits, metrics):
+            table = compiled.get(sensor_id)
+            sensor_values = values[rows]
+            hit_keys = table.key_of_rule[hit_rules]
+
+            tracked = [
+                table.fault_codes.index(code)
+                for code in self.active_faults.tracked_codes(sensor_id) if code in table.fault_codes
+            ]
+            for key in sorted(set(np.unique(hit_keys).tolist()) | set(tracked)):
+                fault_code = table.fault_codes[key]
+                in_key = hit_keys == key
+                key_rows = hit_rows[in_key]
+                triggered = np.zeros(len(rows), dtype=bool)
+                triggered[key_rows] = True
+
+                transitions = self.active_faults.observe_series(
+                    sensor_id, fault_code, triggered, table.cleared_mask(key, sensor_values, signals), table.key_debounce[key]
+                )
+                changed = np.flatnonzero(transitions)
+                if changed.size == 0:
+                    continue
+
+                # A raise is attributed to the first rule of the key that fired on that row
+                # (hits are sorted by row then rule), a clear to the key's first rule.
+                first_hit_rows, first_hit = np.unique(key_rows, return_index=True)
+                first_rule = np.full(len(rows), table.key_rules[key][0], dtype=np.int64)
+                first_rule[first_hit_rows] = hit_rules[in_key][first_hit]
+
+                raised = transitions[changed] == RAISED
+                out_rows.append(rows[changed])
+                out_rules.append(table.positions[first_rule[changed]])
+                out_resolved.append(~raised)
+
+                # Still active after a raise in this batch: remember the latest raising Fault.
+                state = self.active_faults.get(sensor_id, fault_code)
+                if state is not None and state.active and raised[-1]:
+                    last_raise = changed[-1]
+                    rule = rules[int(table.positions[first_rule[last_raise]])]
+                    self.active_faults.set_fault(sensor_id, fault_code, Fault(
+                        fault_id=rule.fault_code,
+                        sensor_id=sensor_id,
+                        severity=rule.severity,
+                        description=rule.message,
+                        timestamp=timestamps[rows[last_raise]],
+                        status=Status.ACTIVE
+                    ))
+
+        if not out_rows:
+            return FaultBatch.empty(rules)
+
+        rows = np.concatenate(out_rows)
+        rule_positions = np.concatenate(out_rules)
+        resolved = np.concatenate(out_resolved)
+        order = np.lexsort((rule_positions, rows))
+        rows = rows[order]
+        rule_positions = rule_positions[order]
+
+        severity_codes = np.array([rule.severity.value for rule in rules], dtype=np.int8)
+        return FaultBatch(
+            row_index=rows,
+            rule_index=rule_positions,
+            severity=severity_codes[rule_positions],
+            timestamp=timestamps[rows],
+            resolved=resolved[order],
+            rules=rules
+        )
 
     def get_active_faults(self) -> List[Fault]:
-        # Return a list of all currently active faults.
-        return self.active_faults
\ No newline at end of file
+        # Return the raising Fault of every currently active (sensor_id, fault_code) key.
+        return list(self.active_faults.active_faults())
@@ -0,0 +1,258 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CACHE_DIR = ".ingest_cache"
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+META_FILE = "meta.json"
+
+def file_digest(path: Path) -> str:
+    """sha256 of a file's content."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+@dataclass
+class CachedFrame:
+    """A cleaned frame loaded from the cache, with the rows cleaning dropped from it."""
+    data: pd.DataFrame
+    reject_rows: np.ndarray     # File row numbers dropped while cleaning.
+    reject_reasons: np.ndarray  # Reason code of each dropped row.
+    checked: int                # Rows cleaning looked at.
+
+class IngestCache:
+    """
+    Sidecar cache of cleaned sensor frames stored as a set of .npy column files.
+
+    Each cached CSV gets a directory named after its path and ingest profile, holding one .npy
+    file per numeric column (codes and categories for text columns), the rows cleaning dropped
+    with their reason codes, and a meta.json recording the source file's size, mtime and
+    sha256. A lookup only stats the CSV while its size and mtime are unchanged; if the mtime
+    changed but the size did not, the content hash decides.
+    Hits are loaded with np.load(mmap_mode="r"), so the column data is paged in from the cache
+    on demand instead of being parsed.
+
+    The cache is capped at max_bytes; after each store the least recently used entries are
+    removed until it fits. Entries are written to a temporary directory and renamed into place,
+    so a reader never sees a partially written entry.
+
+    """
+
+    def __init__(self, cache_dir: str | os.PathLike[str] = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Args:
+            cache_dir: directory holding the cache entries, created if missing.
+            max_bytes: total size the cache is trimmed to after each store.
+
+        Raises:
+            ValueError: If max_bytes is not positive.
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks cannot be pickled; a copy sent to a worker process gets its own.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _entry_dir(self, file_path: Path, profile: str) -> Path:
+        key = hashlib.sha256(f"{file_path.resolve()}\0{profile}".encode()).hexdigest()[:32]
+        return self.cache_dir / key
+
+    @staticmethod
+    def _read_meta(entry: Path) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads((entry / META_FILE).read_text())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_meta(entry: Path, meta: Dict[str, Any]) -> None:
+        temp = entry / f"{META_FILE}.{uuid.uuid4().hex}"
+        temp.write_text(json.dumps(meta))
+        os.replace(temp, entry / META_FILE)
+
+    def load(self, file_path: str | os.PathLike[str], profile: str) -> Optional[pd.DataFrame]:
+        """
+        Return the cached cleaned frame for a CSV, or None if it is not cached or out of date.
+
+        Args:
+            file_path: the source CSV.
+            profile: SensorIntegration ingest profile the frame was cleaned with.
+
+        Returns:
+            pd.DataFrame | None: the frame, with its columns memory-mapped from the cache.
+        """
+        cached = self.load_entry(file_path, profile)
+        return cached.data if cached is not None else None
+
+    def load_entry(self, file_path: str | os.PathLike[str], profile: str) -> Optional[CachedFrame]:
+        """
+        Return the cached cleaned frame for a CSV and the rows cleaning dropped from it.
+
+        Returns None if the file is not cached or the entry is out of date.
+
+        Args:
+            file_path: the source CSV.
+            profile: SensorIntegration ingest profile the frame was cleaned with.
+
+        Returns:
+            CachedFrame | None: the frame, with its columns memory-mapped from the cache, and its rejects.
+        """
+        path = Path(file_path)
+        entry = self._entry_dir(path, profile)
+        meta = self._read_meta(entry)
+        # Entries written before rejects were cached can't say what cleaning dropped.
+        if meta is None or "checked" not in meta:
+            return None
+
+        stat = path.stat()
+        if stat.st_size != meta["size"]:
+            return None
+        if stat.st_mtime_ns != meta["mtime_ns"]:
+            # Touched but possibly unchanged: the content hash decides.
+            if file_digest(path) != meta["content_hash"]:
+                return None
+            meta["mtime_ns"] = stat.st_mtime_ns
+
+        try:
+            columns: Dict[str, Any] = {}
+            for column in meta["columns"]:
+                name, kind = column["name"], column["kind"]
+                if kind == "numeric":
+                    columns[name] = np.load(entry / f"{name}.npy", mmap_mode="r")
+                    continue
+                codes = np.load(entry / f"{name}.codes.npy", mmap_mode="r")
+                categories = np.load(entry / f"{name}.categories.npy").astype(object)
+                if kind == "category":
+                    columns[name] = pd.Categorical.from_codes(codes, categories=categories)
+                else:
+                    values = np.full(len(codes), None, dtype=object)
+                    present = codes >= 0
+                    values[present] = categories[codes[present]]
+                    columns[name] = pd.array(values, dtype=column["dtype"])
+            index = np.load(entry / "index.npy", mmap_mode="r") if meta["has_index"] else None
+            reject_rows = np.load(entry / "rejects.rows.npy")
+            reject_reasons = np.load(entry / "rejects.reasons.npy")
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Discarding unreadable ingest cache entry for {path}: {e}")
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+
+        meta["last_used"] = time.time()
+        self._write_meta(entry, meta)
+        return CachedFrame(pd.DataFrame(columns, index=index, copy=False), reject_rows, reject_reasons, meta["checked"])
+
+    def store(self, file_path: str | os.PathLike[str], profile: str, df: pd.DataFrame, stat: os.stat_result | None = None,
+              rejects: Tuple[np.ndarray, np.ndarray, int] | None = None) -> None:
+        """
+        Cache the cleaned frame of a CSV, then evict least recently used entries over the size cap.
+
+        Args:
+            file_path: the source CSV.
+            profile: SensorIntegration ingest profile the frame was cleaned with.
+            df: the cleaned frame.
+            stat: the CSV's stat from before it was parsed; nothing is stored if the file has changed since.
+            rejects: (rows, reason codes, rows checked) of the rows cleaning dropped; none by default.
+        """
+        path = Path(file_path)
+        current = path.stat()
+        if stat is not None and (stat.st_size, stat.st_mtime_ns) != (current.st_size, current.st_mtime_ns):
+            logging.info(f"{path} changed while it was being read, not caching it.")
+            return
+
+        entry = self._entry_dir(path, profile)
+        temp = self.cache_dir / f".{entry.name}.{uuid.uuid4().hex}"
+        temp.mkdir()
+        try:
+            columns: List[Dict[str, str]] = []
+            for name in df.columns:
+                column = df[name]
+                if pd.api.types.is_numeric_dtype(column.dtype) and not isinstance(column.dtype, pd.CategoricalDtype):
+                    np.save(temp / f"{name}.npy", column.to_numpy())
+                    columns.append({"name": name, "kind": "numeric"})
+                    continue
+                # Text is stored dictionary encoded: int codes (-1 for missing) and the distinct values.
+                if isinstance(column.dtype, pd.CategoricalDtype):
+                    codes, categories = column.cat.codes.to_numpy(), column.cat.categories
+                    columns.append({"name": name, "kind": "category"})
+                else:
+                    codes, categories = pd.factorize(column)
+                    columns.append({"name": name, "kind": "text", "dtype": str(column.dtype)})
+                np.save(temp / f"{name}.codes.npy", np.asarray(codes))
+                np.save(temp / f"{name}.categories.npy", np.asarray(categories, dtype=str))
+
+            reject_rows, reject_reasons, checked = rejects if rejects is not None else (np.empty(0), np.empty(0), len(df))
+            np.save(temp / "rejects.rows.npy", np.asarray(reject_rows, dtype=np.int64))
+            np.save(temp / "rejects.reasons.npy", np.asarray(reject_reasons, dtype=np.int8))
+
+            has_index = not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1
+            if has_index:
+                np.save(temp / "index.npy", df.index.to_numpy())
+
+            self._write_meta(temp, {
+                "source": str(path.resolve()),
+                "profile": profile,
+                "size": current.st_size,
+                "mtime_ns": current.st_mtime_ns,
+                "content_hash": file_digest(path),
+                "columns": columns,
+                "has_index": has_index,
+                "checked": int(checked),
+                "last_used": time.time(),
+            })
+
+            with self._lock:
+                shutil.rmtree(entry, ignore_errors=True)
+                os.replace(temp, entry)
+        except Exception:
+            shutil.rmtree(temp, ignore_errors=True)
+            raise
+
+        self.evict()
+
+    def entry_sizes(self) -> Dict[Path, int]:
+        """Bytes used on disk by each cache entry."""
+        return {
+            entry: sum(f.stat().st_size for f in entry.iterdir())
+            for entry in self.cache_dir.iterdir() if entry.is_dir() and not entry.name.startswith(".")
+        }
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits within max_bytes."""
+        with self._lock:
+            sizes = self.entry_sizes()
+            total = sum(sizes.values())
+            by_age = sorted(sizes, key=lambda entry: (self._read_meta(entry) or {}).get("last_used", 0.0))
+            for entry in by_age:
+                if total <= self.max_bytes:
+                    break
+                shutil.rmtree(entry, ignore_errors=True)
+                total -= sizes[entry]
+                logging.info(f"Evicted ingest cache entry {entry.name}")
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        with self._lock:
+            for entry in self.cache_dir.iterdir():
+                if entry.is_dir():
+                    shutil.rmtree(entry, ignore_errors=True)
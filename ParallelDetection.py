@@ -0,0 +1,303 @@
+import logging
+import os
+from dataclasses import replace
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from Abstractions import Fault, FaultBatch
+from CompiledRules import CompiledRuleSet
+from FaultDetection import FaultDetection
+from SensorIntegration import SensorIntegration
+from Timestamps import day_timestamps
+
+# Columns laid out back to back in the shared memory block, one entry per reading.
+_SHARED_COLUMNS = (("value", np.float64), ("seconds", np.float64), ("code", np.int32))
+_BYTES_PER_ROW = sum(np.dtype(dtype).itemsize for _, dtype in _SHARED_COLUMNS)
+
+# Per worker process state, created by _init_worker() and kept between calls.
+_worker_detection: Optional[FaultDetection] = None
+_worker_timestamps: Optional[np.ndarray] = None
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+
+def _init_worker(rules: List[Any]) -> None:
+    """Compile the rule list shipped to a new worker process and start with no active faults."""
+    global _worker_detection, _worker_timestamps
+    _worker_detection = FaultDetection()
+    _worker_detection.compiled_rules = CompiledRuleSet(rules)
+    _worker_timestamps = day_timestamps()
+
+def _load_worker_rules(rules: List[Any]) -> None:
+    """Swap in a reloaded rule list, keeping the active faults like FaultDetection.load_rules() does."""
+    _worker_detection.compiled_rules = CompiledRuleSet(rules)
+
+def _shared_columns(shm_name: str, length: int) -> Dict[str, np.ndarray]:
+    """Attach to the parent's shared memory block, reusing the attachment while the block is unchanged."""
+    global _worker_shm
+    if _worker_shm is None or _worker_shm.name != shm_name:
+        if _worker_shm is not None:
+            _worker_shm.close()
+        _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    columns = {}
+    offset = 0
+    for name, dtype in _SHARED_COLUMNS:
+        columns[name] = np.ndarray((length,), dtype=dtype, buffer=_worker_shm.buf, offset=offset)
+        offset += length * np.dtype(dtype).itemsize
+    return columns
+
+def _detect_shard(shm_name: str, length: int, sensors: np.ndarray, owner: np.ndarray, worker: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run the whole detection pipeline on the readings of the sensors this worker owns.
+
+    Args:
+        shm_name: name of the shared memory block written by ParallelDetection.detect_from_batch().
+        length: number of readings in the block.
+        sensors: distinct sensor ids, indexed by the code column.
+        owner: worker of each sensor code, -1 for sensors without rules; one extra -1 entry for missing ids.
+        worker: index of this worker.
+
+    Returns:
+        tuple: (row_index, rule_index, resolved) with row positions in the parent's DataFrame.
+    """
+    columns = _shared_columns(shm_name, length)
+    codes = columns["code"]
+    mine = np.flatnonzero(owner[codes] == worker)
+    seconds = columns["seconds"][mine]
+    # FaultDetection only copies the timestamp into fault records, so the seconds stand in
+    # for it here: the parent stamps the batch and _worker_active_faults() formats the rest.
+    data_frame = pd.DataFrame({
+        "timestamp": seconds,
+        "sensor_id": pd.Categorical.from_codes(codes[mine], categories=sensors),
+        "value": columns["value"][mine],
+        "seconds": seconds,
+    })
+    del columns, codes
+
+    batch = _worker_detection.detect_from_batch(data_frame)
+    return mine[batch.row_index], batch.rule_index, batch.resolved
+
+def _worker_active_faults() -> List[Fault]:
+    """The active faults of the sensors owned by this worker, with their seconds formatted as HH:MM:SS."""
+    faults = _worker_detection.get_active_faults()
+    # Invalid timestamps reach the workers as NaN and are left blank.
+    return [replace(fault, timestamp="" if np.isnan(fault.timestamp) else _worker_timestamps[int(fault.timestamp)])
+            for fault in faults]
+
+def _detect_file(file_path: str, compiled: Optional[CompiledRuleSet] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Read one CSV file and detect its faults with fresh state, returning the FaultBatch columns."""
+    fault_detection = FaultDetection()
+    fault_detection.compiled_rules = compiled if compiled is not None else _worker_detection.compiled_rules
+    data_frame = SensorIntegration().read_csv(file_path)
+    batch = fault_detection.detect_from_batch(data_frame)
+    return batch.row_index, batch.rule_index, batch.timestamp, batch.resolved
+
+class ParallelDetection():
+    """Runs FaultDetection over several long-lived worker processes.
+
+    Sensors are the unit of work: every sensor is assigned to one worker the first time it
+    is seen (the least loaded worker by rows so far) and stays there, so each worker runs
+    the whole per-sensor pipeline (grouping, temporal rule signals, rule evaluation and the
+    raise/clear state machine) and keeps that sensor's active faults and temporal history
+    between calls. The parent only encodes the readings into a shared memory block and
+    merges the hit positions the workers send back, so the result is identical to calling
+    FaultDetection.detect_from_batch() on the same sequence of DataFrames.
+
+    Each worker is its own single-process pool, created on first use and kept until close().
+    With workers=1 detection runs in-process on fault_detection instead.
+
+    Frames from SensorIntegration (categorical sensor_id and a seconds column) need no
+    conversion in the parent; other frames have their sensor ids factorized and their
+    timestamps parsed there first.
+
+    """
+
+    def __init__(self, fault_detection: FaultDetection, workers: Optional[int] = None) -> None:
+        """
+        Args:
+            fault_detection: detector whose rules are used; with workers=1 its fault state is used too.
+            workers: number of worker processes, os.cpu_count() by default.
+
+        Raises:
+            ValueError: If workers is below 1.
+        """
+        self.workers: int = workers if workers is not None else (os.cpu_count() or 1)
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.fault_detection = fault_detection
+        self._pools: List[ProcessPoolExecutor] = []
+        self._pool_rules: Optional[CompiledRuleSet] = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        # Worker of every sensor seen so far, and the rows sent to each worker.
+        self._owner: Dict[str, int] = {}
+        self._load: np.ndarray = np.zeros(self.workers, dtype=np.int64)
+
+    def close(self) -> None:
+        """Shut the worker processes down, discarding their fault state, and release the shared memory block."""
+        try:
+            for pool in self._pools:
+                pool.shutdown()
+        finally:
+            self._pools = []
+            self._owner.clear()
+            self._load[:] = 0
+            if self._shm is not None:
+                self._shm.close()
+                self._shm.unlink()
+                self._shm = None
+
+    def _worker_pools(self) -> List[ProcessPoolExecutor]:
+        """Start the worker processes on first use and send them the current rules."""
+        compiled = self.fault_detection.compiled_rules
+        if not self._pools:
+            self._pools = [ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(compiled.rules,))
+                           for _ in range(self.workers)]
+        elif self._pool_rules is not compiled:
+            # fault_detection.load_rules() swapped the compiled rules since the last call.
+            for future in [pool.submit(_load_worker_rules, compiled.rules) for pool in self._pools]:
+                future.result()
+        self._pool_rules = compiled
+        return self._pools
+
+    def _shared_block(self, length: int) -> shared_memory.SharedMemory:
+        """Return a shared memory block for length readings, growing the current one if needed."""
+        size = max(length, 1) * _BYTES_PER_ROW
+        if self._shm is None or self._shm.size < size:
+            if self._shm is not None:
+                self._shm.close()
+                self._shm.unlink()
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+        return self._shm
+
+    def _assign(self, sensors: np.ndarray, counts: np.ndarray, has_rules: np.ndarray) -> np.ndarray:
+        """
+        Return the worker of each sensor code, assigning new sensors to the least loaded worker.
+
+        Returns:
+            np.ndarray: worker per sensor code, -1 for sensors without rules, plus a trailing -1
+            that codes of -1 (missing sensor ids) index.
+        """
+        owner = np.full(len(sensors) + 1, -1, dtype=np.int64)
+        new = []
+        for code in np.flatnonzero(has_rules):
+            worker = self._owner.get(sensors[code])
+            if worker is None:
+                new.append(code)
+            else:
+                owner[code] = worker
+                self._load[worker] += counts[code]
+        # Largest first so the greedy split stays even.
+        for code in sorted(new, key=lambda code: -counts[code]):
+            owner[code] = self._owner[sensors[code]] = int(np.argmin(self._load))
+            self._load[owner[code]] += counts[code]
+        return owner
+
+    def detect_from_batch(self, data_frame: pd.DataFrame) -> FaultBatch:
+        """
+        Apply fault detection to all rows in a DataFrame using the worker processes.
+
+        Args:
+            data_frame: Sensor data with the required columns.
+
+        Returns:
+            FaultBatch: the same faults, in the same order, as FaultDetection.detect_from_batch().
+
+        Raises:
+            TypeError: If format other than a dataframe is supplied.
+        """
+        if not isinstance(data_frame, pd.DataFrame):
+            raise TypeError("Expected a pandas DataFrame for detect_from_batch()")
+        if self.workers == 1:
+            return self.fault_detection.detect_from_batch(data_frame)
+
+        compiled = self.fault_detection.compiled_rules
+        column = data_frame["sensor_id"]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            codes, sensors = column.cat.codes.to_numpy(), column.cat.categories.to_numpy(dtype=object)
+        else:
+            codes, sensors = pd.factorize(column.to_numpy(dtype=object))
+            sensors = np.asarray(sensors, dtype=object)
+        has_rules = compiled.table_codes(sensors) >= 0
+        if not has_rules.any():
+            return FaultBatch.empty(compiled.rules)
+        counts = np.bincount(codes[codes >= 0], minlength=len(sensors))
+        owner = self._assign(sensors, counts, has_rules)
+
+        pools = self._worker_pools()
+        length = len(data_frame)
+        shm = self._shared_block(length)
+        offset = 0
+        for name, dtype in _SHARED_COLUMNS:
+            shared = np.ndarray((length,), dtype=dtype, buffer=shm.buf, offset=offset)
+            if name == "value":
+                shared[:] = data_frame["value"].to_numpy(dtype=float)
+            elif name == "seconds":
+                shared[:] = self.fault_detection._reading_seconds(data_frame)
+            else:
+                shared[:] = codes
+            offset += length * np.dtype(dtype).itemsize
+        del shared
+
+        busy = np.unique(owner[:-1][(owner[:-1] >= 0) & (counts > 0)])
+        futures = [pools[worker].submit(_detect_shard, shm.name, length, sensors, owner, int(worker)) for worker in busy]
+        results = [future.result() for future in futures]
+        logging.info("Detected %d rows of %d sensor(s) on %d worker(s)", length, int(has_rules.sum()), len(busy))
+
+        if not results:
+            return FaultBatch.empty(compiled.rules)
+        row_index = np.concatenate([rows for rows, _, _ in results])
+        rule_index = np.concatenate([rules for _, rules, _ in results])
+        resolved = np.concatenate([flags for _, _, flags in results])
+        order = np.lexsort((rule_index, row_index))
+        row_index, rule_index, resolved = row_index[order], rule_index[order], resolved[order]
+        severity_codes = np.array([rule.severity.value for rule in compiled.rules], dtype=np.int8)
+        return FaultBatch(
+            row_index=row_index,
+            rule_index=rule_index,
+            severity=severity_codes[rule_index],
+            timestamp=data_frame["timestamp"].iloc[row_index].to_numpy(dtype=object),
+            resolved=resolved,
+            rules=compiled.rules
+        )
+
+    def get_active_faults(self) -> List[Fault]:
+        """The active faults held by the workers, grouped by worker, or by fault_detection with workers=1."""
+        if self.workers == 1 or not self._pools:
+            return self.fault_detection.get_active_faults()
+        futures = [pool.submit(_worker_active_faults) for pool in self._pools]
+        return [fault for future in futures for fault in future.result()]
+
+    def detect_files(self, file_paths: Sequence[str | os.PathLike[str]]) -> List[FaultBatch]:
+        """
+        Read and detect a list of CSV files, one file per task.
+
+        Each file is treated as an independent recording and detected with fresh fault state,
+        so the result does not depend on how files are distributed over workers. Neither the
+        workers' nor fault_detection's active faults are modified.
+
+        Args:
+            file_paths: CSV files to read with SensorIntegration.read_csv().
+
+        Returns:
+            list[FaultBatch]: the faults of each file, in the order the files were given.
+
+        Raises:
+            FileNotFoundError: If a file does not exist.
+            ValueError: If a file fails validation.
+        """
+        compiled = self.fault_detection.compiled_rules
+        paths = [str(path) for path in file_paths]
+        if self.workers == 1 or len(paths) <= 1:
+            columns = [_detect_file(path, compiled) for path in paths]
+        else:
+            pools = self._worker_pools()
+            futures = [pools[index % len(pools)].submit(_detect_file, path) for index, path in enumerate(paths)]
+            columns = [future.result() for future in futures]
+
+        # Rebuild the batches against the parent's rule objects rather than the workers' copies.
+        severity_codes = np.array([rule.severity.value for rule in compiled.rules], dtype=np.int8)
+        return [FaultBatch(row_index=row_index, rule_index=rule_index, severity=severity_codes[rule_index],
+                           timestamp=timestamp, resolved=resolved, rules=compiled.rules)
+                for row_index, rule_index, timestamp, resolved in columns]
@@ -0,0 +1,277 @@
+import logging
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from Timestamps import SECONDS_PER_DAY, day_timestamps, timestamp_seconds
+
+# Readings per stored block. A range query decompresses whole blocks, so this bounds the work of a narrow window.
+BLOCK_READINGS = 4096
+
+class ReadingStore:
+    """
+    SQLite store of raw sensor readings, kept so the readings around an alert can be looked up later.
+
+    Readings are stored per sensor in blocks of at most BLOCK_READINGS readings, sorted by time
+    of day. A block holds the seconds of its readings delta-encoded as int32 and the values as
+    float32, each compressed with zlib, along with the first and last second it covers. Blocks
+    are indexed by (sensor_code, start_seconds, end_seconds), so a range query only reads and
+    decompresses the blocks of one sensor that overlap the window.
+
+    The store is append-only: each append() adds new blocks in one transaction and never
+    rewrites existing ones. Every block belongs to a recording (an uploaded file, folder or
+    followed CSV, see start_recording()), and alerts raised from a recording are linked to it
+    with link_alerts(). Readings are times of day only, so different recordings overlap in
+    time; a range query given a recording_id returns only that recording's readings, and one
+    without returns them all, sorted by time.
+
+    """
+
+    def __init__(self, db_path: str = "readings.db") -> None:
+        self.db_path = db_path
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._con = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._sensor_codes: Dict[str, int] = {}
+        self._init_tables()
+
+    def close(self) -> None:
+        try:
+            self._con.close()
+        finally:
+            self._con = None
+
+    def _init_tables(self) -> None:
+        self._con.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sensors (
+                sensor_code     INTEGER PRIMARY KEY,
+                sensor_id       TEXT    NOT NULL UNIQUE,
+                sensor_type     TEXT    NOT NULL,
+                unit            TEXT    NOT NULL
+            )
+            """
+        )
+        self._con.execute(
+            """
+            CREATE TABLE IF NOT EXISTS recordings (
+                recording_id    INTEGER PRIMARY KEY,
+                source          TEXT    NOT NULL,
+                started         REAL    NOT NULL
+            )
+            """
+        )
+        self._con.execute(
+            """
+            CREATE TABLE IF NOT EXISTS alert_recordings (
+                alert_id        INTEGER PRIMARY KEY,
+                recording_id    INTEGER NOT NULL REFERENCES recordings(recording_id)
+            )
+            """
+        )
+        self._con.execute(
+            """
+            CREATE TABLE IF NOT EXISTS blocks (
+                block_id        INTEGER PRIMARY KEY,
+                sensor_code     INTEGER NOT NULL REFERENCES sensors(sensor_code),
+                start_seconds   INTEGER NOT NULL,
+                end_seconds     INTEGER NOT NULL,
+                readings        INTEGER NOT NULL,
+                seconds         BLOB    NOT NULL,
+                "values"        BLOB    NOT NULL,
+                recording_id    INTEGER REFERENCES recordings(recording_id)
+            )
+            """
+        )
+        # Stores from before recordings have blocks without one; they only show up in unfiltered queries.
+        if "recording_id" not in {row[1] for row in self._con.execute("PRAGMA table_info(blocks)")}:
+            self._con.execute("ALTER TABLE blocks ADD COLUMN recording_id INTEGER REFERENCES recordings(recording_id)")
+        self._con.execute("CREATE INDEX IF NOT EXISTS blocks_by_sensor_time ON blocks(sensor_code, start_seconds, end_seconds)")
+        self._con.execute(
+            "CREATE INDEX IF NOT EXISTS blocks_by_recording ON blocks(recording_id, sensor_code, start_seconds, end_seconds)"
+        )
+        self._con.commit()
+        self._load_sensor_codes()
+
+    def _load_sensor_codes(self) -> None:
+        self._sensor_codes = {sensor_id: code for code, sensor_id in self._con.execute("SELECT sensor_code, sensor_id FROM sensors")}
+
+    def _sensor_code(self, sensor_id: str, sensor_type: str, unit: str) -> int:
+        """Return the code of a sensor, adding it to the sensors table if it is new."""
+        code = self._sensor_codes.get(sensor_id)
+        if code is None:
+            code = self._con.execute(
+                "INSERT INTO sensors(sensor_id, sensor_type, unit) VALUES (?,?,?) RETURNING sensor_code",
+                (sensor_id, sensor_type, unit)
+            ).fetchone()[0]
+            self._sensor_codes[sensor_id] = code
+        return code
+
+    def start_recording(self, source: str = "") -> int:
+        """
+        Register a new recording that readings can be appended to.
+
+        Args:
+            source: where the readings come from, such as the uploaded file's path.
+
+        Returns:
+            int: the recording_id.
+        """
+        with self._con:
+            return self._con.execute(
+                "INSERT INTO recordings(source, started) VALUES (?, ?) RETURNING recording_id", (source, time.time())
+            ).fetchone()[0]
+
+    def link_alerts(self, alert_ids: Iterable[int], recording_id: int) -> None:
+        """Record that the alerts were raised from the readings of a recording."""
+        with self._con:
+            self._con.executemany(
+                "INSERT OR REPLACE INTO alert_recordings(alert_id, recording_id) VALUES (?, ?)",
+                ((int(alert_id), recording_id) for alert_id in alert_ids)
+            )
+
+    def recording_of(self, alert_id: int) -> Optional[int]:
+        """The recording an alert was raised from, or None if it isn't linked to one."""
+        row = self._con.execute("SELECT recording_id FROM alert_recordings WHERE alert_id = ?", (int(alert_id),)).fetchone()
+        return row[0] if row is not None else None
+
+    @staticmethod
+    def _encode_block(seconds: np.ndarray, values: np.ndarray) -> Tuple[int, int, int, bytes, bytes]:
+        """Pack one sensor's time-sorted readings as (start, end, count, seconds blob, values blob)."""
+        deltas = np.diff(seconds, prepend=np.int32(0)).astype("<i4")
+        return (
+            int(seconds[0]),
+            int(seconds[-1]),
+            len(seconds),
+            zlib.compress(deltas.tobytes()),
+            zlib.compress(values.astype("<f4").tobytes()),
+        )
+
+    @staticmethod
+    def _decode_block(seconds: bytes, values: bytes) -> Tuple[np.ndarray, np.ndarray]:
+        return (
+            np.cumsum(np.frombuffer(zlib.decompress(seconds), dtype="<i4"), dtype=np.int32),
+            np.frombuffer(zlib.decompress(values), dtype="<f4"),
+        )
+
+    def append(self, data_frame: pd.DataFrame, recording_id: Optional[int] = None) -> int:
+        """
+        Store cleaned sensor readings.
+
+        Args:
+            data_frame: readings with the SensorIntegration columns, as returned by read_csv().
+            recording_id: recording the readings belong to, from start_recording(). By default
+                they are stored as a new recording of their own.
+
+        Returns:
+            int: number of readings stored.
+
+        Raises:
+            ValueError: If a timestamp is not valid HH:MM:SS.
+        """
+        if data_frame.empty:
+            return 0
+        if "seconds" in data_frame.columns:
+            seconds = data_frame["seconds"].to_numpy(dtype=np.int32)
+        else:
+            seconds = timestamp_seconds(data_frame["timestamp"].to_numpy())
+        if (seconds < 0).any():
+            raise ValueError("Invalid timestamp format detected: Expected HH:MM:SS.")
+
+        sensor, sensor_ids = pd.factorize(data_frame["sensor_id"].astype(str).to_numpy())
+        values = data_frame["value"].to_numpy(dtype=np.float32)
+        # Sorted by sensor, then time; lexsort is stable so equal times keep their order.
+        order = np.lexsort((seconds, sensor))
+        sensor, seconds, values = sensor[order], seconds[order], values[order]
+        bounds = np.searchsorted(sensor, np.arange(len(sensor_ids) + 1))
+        sensor_types = data_frame["sensor_type"].astype(str).to_numpy()[order]
+        units = data_frame["unit"].astype(str).to_numpy()[order]
+        if recording_id is None:
+            recording_id = self.start_recording()
+
+        rows: List[tuple] = []
+        try:
+            with self._con:
+                for index, sensor_id in enumerate(sensor_ids):
+                    first, last = bounds[index], bounds[index + 1]
+                    code = self._sensor_code(sensor_id, sensor_types[first], units[first])
+                    for start in range(first, last, BLOCK_READINGS):
+                        stop = min(start + BLOCK_READINGS, last)
+                        rows.append((code, *self._encode_block(seconds[start:stop], values[start:stop]), recording_id))
+                self._con.executemany(
+                    'INSERT INTO blocks(sensor_code, start_seconds, end_seconds, readings, seconds, "values", recording_id) '
+                    'VALUES (?,?,?,?,?,?,?)',
+                    rows
+                )
+        except sqlite3.Error:
+            # Sensors added in the rolled back transaction are gone again.
+            self._load_sensor_codes()
+            raise
+
+        logging.info(f"Stored {len(seconds)} readings of {len(sensor_ids)} sensors in {len(rows)} blocks.")
+        return len(seconds)
+
+    @staticmethod
+    def _to_seconds(time_of_day: str | int) -> int:
+        if isinstance(time_of_day, str):
+            seconds = int(timestamp_seconds([time_of_day])[0])
+            if seconds < 0:
+                raise ValueError(f"Invalid timestamp {time_of_day!r}: Expected HH:MM:SS.")
+            return seconds
+        return int(time_of_day)
+
+    def range(self, sensor_id: str, start: str | int, end: str | int, recording_id: Optional[int] = None) -> pd.DataFrame:
+        """
+        Retrieve the readings of one sensor between two times of day, inclusive.
+
+        Args:
+            sensor_id: sensor to read.
+            start: first time, as HH:MM:SS or seconds of the day.
+            end: last time, as HH:MM:SS or seconds of the day.
+            recording_id: only readings of this recording; every recording by default.
+
+        Returns:
+            pd.DataFrame: the readings sorted by time, with the columns of SensorIntegration.read_csv()
+            (value as float32). Empty if the sensor has no readings in the window.
+
+        Raises:
+            ValueError: If start or end is not a valid time.
+        """
+        start, end = self._to_seconds(start), self._to_seconds(end)
+        sensor = self._con.execute("SELECT sensor_code, sensor_type, unit FROM sensors WHERE sensor_id = ?", (sensor_id,)).fetchone()
+        conditions = ["sensor_code = ?", "start_seconds <= ?", "end_seconds >= ?"]
+        params: List[int] = [] if sensor is None else [sensor[0], end, start]
+        if recording_id is not None:
+            conditions.append("recording_id = ?")
+            params.append(recording_id)
+        blocks = [] if sensor is None else self._con.execute(
+            f'SELECT seconds, "values" FROM blocks WHERE {" AND ".join(conditions)} ORDER BY block_id', params
+        ).fetchall()
+
+        seconds = np.empty(0, dtype=np.int32)
+        values = np.empty(0, dtype=np.float32)
+        if blocks:
+            decoded = [self._decode_block(*block) for block in blocks]
+            seconds = np.concatenate([block[0] for block in decoded])
+            values = np.concatenate([block[1] for block in decoded])
+            keep = (seconds >= start) & (seconds <= end)
+            order = np.argsort(seconds[keep], kind="stable")
+            seconds, values = seconds[keep][order], values[keep][order]
+
+        return pd.DataFrame({
+            "timestamp": day_timestamps()[seconds],
+            "sensor_id": sensor_id,
+            "sensor_type": sensor[1] if sensor is not None else None,
+            "value": values,
+            "unit": sensor[2] if sensor is not None else None,
+            "seconds": seconds,
+        })
+
+    def around(self, sensor_id: str, timestamp: str | int, window: int = 30, recording_id: Optional[int] = None) -> pd.DataFrame:
+        """Retrieve the readings of a sensor within window seconds either side of timestamp (such as an alert's), see range()."""
+        seconds = self._to_seconds(timestamp)
+        return self.range(sensor_id, max(seconds - window, 0), min(seconds + window, SECONDS_PER_DAY - 1), recording_id)
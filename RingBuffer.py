@@ -0,0 +1,90 @@
+import numpy as np
+
+class RingBuffer:
+    """
+    FIFO of fixed-width float rows backed by a preallocated NumPy array.
+
+    Appending and popping from the left are O(1). When the buffer is full, append() drops the
+    oldest row, unless grow is set, in which case the capacity doubles instead. Temporal fault
+    rules use it to carry the few samples they need from one detection call to the next.
+
+    """
+
+    def __init__(self, capacity: int, width: int = 1, grow: bool = False) -> None:
+        """
+        Args:
+            capacity: number of rows held before the oldest is dropped (or the buffer grows).
+            width: floats per row.
+            grow: double the capacity instead of dropping rows when full.
+
+        Raises:
+            ValueError: If capacity is below 1.
+        """
+        if capacity < 1:
+            raise ValueError(f"RingBuffer capacity must be at least 1, got {capacity}")
+        self._data = np.empty((capacity, width), dtype=float)
+        self._start = 0
+        self._count = 0
+        self.grow = grow
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return self._data.shape[0]
+
+    def append(self, row) -> None:
+        """Add a row at the right, dropping the oldest row if the buffer is full."""
+        if self._count == self.capacity:
+            if self.grow:
+                self.replace(self.to_array(), capacity=self.capacity * 2)
+            else:
+                self._start = (self._start + 1) % self.capacity
+                self._count -= 1
+        self._data[(self._start + self._count) % self.capacity] = row
+        self._count += 1
+
+    def popleft(self) -> np.ndarray:
+        """Remove and return the oldest row."""
+        if not self._count:
+            raise IndexError("pop from an empty RingBuffer")
+        row = self._data[self._start].copy()
+        self._start = (self._start + 1) % self.capacity
+        self._count -= 1
+        return row
+
+    def left(self) -> np.ndarray:
+        """Return the oldest row without removing it."""
+        if not self._count:
+            raise IndexError("RingBuffer is empty")
+        return self._data[self._start]
+
+    def right(self) -> np.ndarray:
+        """Return the newest row without removing it."""
+        if not self._count:
+            raise IndexError("RingBuffer is empty")
+        return self._data[(self._start + self._count - 1) % self.capacity]
+
+    def to_array(self) -> np.ndarray:
+        """Return a copy of the rows, oldest first, with shape (len, width)."""
+        return np.take(self._data, (self._start + np.arange(self._count)) % self.capacity, axis=0)
+
+    def replace(self, rows: np.ndarray, capacity: int | None = None) -> None:
+        """
+        Replace the contents with rows (oldest first), keeping only the newest that fit.
+
+        Args:
+            rows: array of shape (n, width).
+            capacity: new capacity, unchanged by default; a growing buffer widens to fit all rows.
+        """
+        rows = np.asarray(rows, dtype=float).reshape(-1, self._data.shape[1])
+        capacity = capacity or self.capacity
+        if self.grow:
+            capacity = max(capacity, len(rows))
+        if capacity != self.capacity:
+            self._data = np.empty((capacity, self._data.shape[1]), dtype=float)
+        rows = rows[len(rows) - min(len(rows), capacity):]
+        self._data[:len(rows)] = rows
+        self._start = 0
+        self._count = len(rows)
@@ -0,0 +1,79 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from CompiledRules import CompiledRuleSet
+
+@dataclass(frozen=True)
+class CachedRuleSet:
+    """A compiled rule set together with the file state it was built from."""
+    mtime_ns: int
+    size: int
+    content_hash: str
+    rule_set: CompiledRuleSet
+
+class RuleSetCache:
+    """
+    Cache of compiled rule sets keyed by rules file path, modification time and content hash.
+
+    get() only stats the file while its mtime and size are unchanged. When either changes the
+    file is read and hashed, and only re-parsed and re-compiled if the content actually differs.
+    A new CompiledRuleSet is fully built before it replaces the cached one, so callers always
+    receive either the previous or the new rule set, never a partially loaded one.
+
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, CachedRuleSet] = {}
+        self._lock = threading.Lock()
+
+    def get(self, file_path: str | os.PathLike[str], build: Callable[[List[Dict[str, Any]]], CompiledRuleSet]) -> CompiledRuleSet:
+        """
+        Return the compiled rule set for a rules file, rebuilding it only when the file changed.
+
+        Args:
+            file_path: location of JSON rules.
+            build: compiles the parsed JSON rule list into a CompiledRuleSet.
+
+        Returns:
+            CompiledRuleSet: the current rules for the file.
+
+        Raises:
+            FileNotFoundError: If the rules file does not exist.
+            json.JSONDecodeError: If the file is not valid JSON (the cached rules are kept).
+        """
+        path = Path(file_path)
+        key = str(path.resolve())
+        stat = path.stat()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+                return entry.rule_set
+
+            content = path.read_bytes()
+            content_hash = hashlib.sha256(content).hexdigest()
+            if entry is not None and entry.content_hash == content_hash:
+                rule_set = entry.rule_set
+            else:
+                rule_set = build(json.loads(content))
+                logging.info("Compiled %d fault rule(s) from %s", len(rule_set.rules), path)
+
+            self._entries[key] = CachedRuleSet(stat.st_mtime_ns, stat.st_size, content_hash, rule_set)
+            return rule_set
+
+    def invalidate(self, file_path: str | os.PathLike[str] | None = None) -> None:
+        """Drop the cached rule set for one file, or for all files when no path is given."""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(Path(file_path).resolve()), None)
+
+# Shared by every FaultDetection instance so a rules file is only compiled once per change.
+RULE_SET_CACHE = RuleSetCache()
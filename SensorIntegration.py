@@ -1,20 +1,157 @@
+import numpy as np
 import pandas as pd
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import IntEnum
+from importlib.util import find_spec
 from pathlib import Path
+from threading import Event
+from typing import BinaryIO, Dict, Iterable, Iterator, List
+import io
 import logging
 import os
+import time
 
-from Database import AlertDatabase
+from BinaryTelemetry import read_telemetry
+from IngestCache import IngestCache
+from SensorRegistry import SENSOR_REGISTRY, SensorRegistry
+from Timestamps import timestamp_seconds
+
+# pyarrow's multithreaded CSV parser is used by the typed profile when it is installed.
+HAS_PYARROW = find_spec("pyarrow") is not None
+
+class RejectReason(IntEnum):
+    """Why a row was dropped during cleaning. Checked in this order; a row gets the first that applies."""
+    MISSING_TIMESTAMP = 1
+    MISSING_SENSOR_ID = 2
+    MISSING_VALUE = 3
+    NON_NUMERIC_VALUE = 4
+    INVALID_TIMESTAMP = 5
+
+@dataclass
+class RejectReport:
+    """
+    Rows dropped while cleaning sensor data, with the reason code of each.
+
+    Rows are the 0-based data row numbers of the file (the header is not counted), kept as
+    int64 and int8 arrays so a report over a huge file stays small.
+    """
+    checked: int = 0                                                              # Rows cleaned so far.
+    _rows: List[np.ndarray] = field(default_factory=list, repr=False)
+    _reasons: List[np.ndarray] = field(default_factory=list, repr=False)
+
+    def add(self, rows: np.ndarray, reasons: np.ndarray, checked: int) -> None:
+        """Record the rejects of one cleaned frame of checked rows."""
+        self.checked += checked
+        if len(rows):
+            self._rows.append(np.asarray(rows, dtype=np.int64))
+            self._reasons.append(np.asarray(reasons, dtype=np.int8))
+
+    def __len__(self) -> int:
+        return sum(len(rows) for rows in self._rows)
+
+    @property
+    def rows(self) -> np.ndarray:
+        return np.concatenate(self._rows) if self._rows else np.empty(0, dtype=np.int64)
+
+    @property
+    def reasons(self) -> np.ndarray:
+        return np.concatenate(self._reasons) if self._reasons else np.empty(0, dtype=np.int8)
+
+    def counts(self) -> Dict[RejectReason, int]:
+        """Number of rejected rows per reason, for the reasons that occurred."""
+        counts = np.bincount(self.reasons, minlength=len(RejectReason) + 1)
+        return {reason: int(counts[reason]) for reason in RejectReason if counts[reason]}
+
+    def to_frame(self) -> pd.DataFrame:
+        """The rejects as a (row, reason) DataFrame with reason names."""
+        names = np.array([""] + [reason.name for reason in RejectReason], dtype=object)
+        return pd.DataFrame({"row": self.rows, "reason": names[self.reasons]})
+
+@dataclass
+class IngestReport:
+    """Result of loading several sensor CSV files with SensorIntegration.read_many()."""
+    data: pd.DataFrame
+    loaded: List[str] = field(default_factory=list)                  # Files that were read, in input order.
+    errors: Dict[str, str] = field(default_factory=dict)             # Error message per file that failed.
+    rejects: Dict[str, RejectReport] = field(default_factory=dict)   # Rows dropped while cleaning, per file loaded.
+
+def _read_one(file_path: str, profile: str, cache: IngestCache | None, max_rejects: int | None,
+              max_reject_fraction: float | None) -> tuple[pd.DataFrame, RejectReport]:
+    """Read one file in a pool worker."""
+    sensor_integration = SensorIntegration(profile, cache, max_rejects=max_rejects, max_reject_fraction=max_reject_fraction)
+    return sensor_integration.read_csv(file_path), sensor_integration.rejects
 
 class SensorIntegration():
+    """Reads, validates and cleans sensor CSV files.
+
+    Two ingest profiles are available. "default" parses every column with pandas' inferred
+    dtypes. "typed" loads the string columns as categoricals and value as float32, uses the
+    pyarrow parser when it is installed, and cleans the categories rather than every row, so
+    a large file takes a fraction of the memory. float32 keeps about 7 significant digits, so
+    a reading within that precision of a rule threshold may compare differently than with the
+    default profile.
+
+    With either profile, sensor_id, sensor_type and unit come back as categoricals whose
+    codes are the SensorRegistry codes of the values, so a sensor has the same code in every
+    frame and detection can look its rules up by code.
+
+    Cleaning drops rows with a missing timestamp, sensor_id or value, or a value that is not
+    a number, and records each dropped row in self.rejects. A malformed timestamp makes the
+    whole load fail unless an error budget is set (max_rejects, max_reject_fraction or both);
+    with one, rows with bad timestamps are dropped and recorded too, and the load only fails
+    once more rows are rejected, for any reason, than the budget allows.
+
+    """
 
     REQUIRED_COLS = ["timestamp", "sensor_id", "sensor_type", "value", "unit"]
+    DEFAULT_CHUNK_SIZE = 100_000
+    FOLLOW_READ_BYTES = 16 * 1024 * 1024
+    PROFILES = ("default", "typed")
+    TYPED_DTYPES = {"timestamp": "category", "sensor_id": "category", "sensor_type": "category",
+                    "unit": "category", "value": "float32"}
+
+    def __init__(self, profile: str = "default", cache: IngestCache | None = None, registry: SensorRegistry | None = None,
+                 max_rejects: int | None = None, max_reject_fraction: float | None = None) -> None:
+        """
+        Args:
+            profile: ingest profile, "default" or "typed".
+            cache: optional IngestCache; read_csv() then reuses the cleaned frames of files it has seen.
+            registry: dictionary the sensor columns are encoded with, the shared SENSOR_REGISTRY by default.
+            max_rejects: most rows a load may reject.
+            max_reject_fraction: most rows a load may reject, as a fraction from 0 to 1 of the
+                rows in the file (see read_csv_chunks() and follow_csv() for when it is checked).
+                With neither, a load fails on the first malformed timestamp.
 
-    def __init__(self) -> None:
+        Raises:
+            ValueError: If the profile is unknown, max_rejects is not a non-negative int or
+                max_reject_fraction is not a number from 0 to 1.
+        """
+        if profile not in self.PROFILES:
+            raise ValueError(f"Unknown ingest profile {profile!r}, expected one of {self.PROFILES}")
+        if max_rejects is not None and (isinstance(max_rejects, bool) or not isinstance(max_rejects, int) or max_rejects < 0):
+            raise ValueError(f"max_rejects must be a non-negative int, got {max_rejects!r}")
+        if max_reject_fraction is not None and (
+            isinstance(max_reject_fraction, bool) or not isinstance(max_reject_fraction, (int, float))
+            or not 0 <= max_reject_fraction <= 1
+        ):
+            raise ValueError(f"max_reject_fraction must be a number from 0 to 1, got {max_reject_fraction!r}")
+        self.profile = profile
+        self.cache = cache
+        self.registry = registry if registry is not None else SENSOR_REGISTRY
+        self.max_rejects = max_rejects
+        self.max_reject_fraction = max_reject_fraction
         self.data: pd.DataFrame | None = None
+        self.rejects = RejectReport()
 
     def read_csv(self, file_path: str | os.PathLike[str]) -> pd.DataFrame:
         """
         Load and preprocess a CSV file containing sensor readings.
+
+        With a cache, a file whose cleaned frame is already cached is loaded from it without
+        being parsed, validated or cleaned again. The rows dropped while cleaning are left in
+        self.rejects; for a cache hit they come from the entry, and this instance's error
+        budget is applied to them as if the file had been cleaned again.
         
         Args:
             file_path (str): Path to the CSV file.
@@ -25,22 +162,269 @@ class SensorIntegration():
         Raises:
             FileNotFoundError: If the file path does not exist.
             ValueError: If required columns are missing or data is invalid.
+            ValueError: If more rows were rejected than the error budget allows.
         """
 
         file = Path(file_path)
         if not file.exists():
             logging.error(f"File not found: {file_path}")
             raise FileNotFoundError(f"File not found: {file_path}")
+        self.rejects = RejectReport()
+        if self.cache is not None:
+            cached = self.cache.load_entry(file, self.profile)
+            if cached is not None:
+                # The entry may have been cleaned under a looser budget than this load's.
+                self.rejects.add(cached.reject_rows, cached.reject_reasons, cached.checked)
+                self._check_budget(self.rejects, self.rejects.reasons)
+                self._check_reject_fraction(self.rejects)
+                # Cached frames were validated and cleaned when they were stored; only the codes are remapped.
+                df = self.registry.encode_frame(cached.data)
+                self.data = df
+                logging.info(f"Sensor data loaded from cache with: {len(df)} records.")
+                return df
+            stat = file.stat()
+
         logging.info(f"Loading sensor data from: {file_path}")
-        df = pd.read_csv(file)
+        if self.profile == "typed":
+            self._validate_data(pd.read_csv(file, nrows=0))
+            df = self._read_typed(file)
+        else:
+            df = pd.read_csv(file)
 
         self._validate_data(df)
         df = self._clean_data(df)
+        self._check_reject_fraction(self.rejects)
+        if self.cache is not None:
+            self.cache.store(file, self.profile, df, stat, (self.rejects.rows, self.rejects.reasons, self.rejects.checked))
 
         self.data = df
+        if self.rejects:
+            logging.warning(f"Dropped {len(self.rejects)} invalid rows from {file_path}: {self._describe_rejects()}")
         logging.info(f"Sensor data loaded successfully with: {len(df)} records.")
         return df
     
+    def read_binary(self, file_path: str | os.PathLike[str]) -> pd.DataFrame:
+        """
+        Load a packed binary telemetry file written by BinaryTelemetry.write_telemetry().
+
+        The readings are memory-mapped rather than parsed, and come back with the same columns
+        as read_csv() (text columns as categoricals and value as float32, like the typed
+        profile), so the frame goes through fault detection and get_sensor_data() unchanged.
+
+        Args:
+            file_path: Path to the telemetry file.
+
+        Returns:
+            pd.DataFrame: the readings, ready for fault detection.
+
+        Raises:
+            FileNotFoundError: If the file path does not exist.
+            ValueError: If the file is not a valid binary telemetry file.
+        """
+        file = Path(file_path)
+        if not file.exists():
+            logging.error(f"File not found: {file_path}")
+            raise FileNotFoundError(f"File not found: {file_path}")
+        # Binary files hold cleaned readings, so nothing is rejected.
+        self.rejects = RejectReport()
+        try:
+            df = self.registry.encode_frame(read_telemetry(file))
+        except ValueError as e:
+            logging.error(f"Invalid binary telemetry file {file_path}: {e}")
+            raise
+
+        self.data = df
+        logging.info(f"Sensor data loaded successfully with: {len(df)} records.")
+        return df
+
+    def read_csv_chunks(self, file_path: str | os.PathLike[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """
+        Load a CSV file of sensor readings lazily, one cleaned chunk at a time.
+
+        The header is validated once before any rows are parsed, then each chunk of at most
+        chunk_size rows is cleaned on its own, so memory use is bounded by the chunk size
+        rather than the file size. Unlike read_csv(), the chunks are not kept in self.data.
+
+        max_rejects is checked after every chunk, as the count only grows, but
+        max_reject_fraction applies to the whole file, so it is checked once the last chunk
+        has been yielded: an early dirty chunk does not fail a file that is within budget
+        overall, and a file over budget fails only after all its chunks were yielded.
+
+        Args:
+            file_path: Path to the CSV file.
+            chunk_size: maximum number of rows parsed per chunk.
+
+        Yields:
+            pd.DataFrame: A cleaned and validated chunk ready for fault detection.
+
+        Raises:
+            FileNotFoundError: If the file path does not exist.
+            ValueError: If chunk_size is not positive, required columns are missing or data is invalid.
+            ValueError: If more rows were rejected than the error budget allows.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        file = Path(file_path)
+        if not file.exists():
+            logging.error(f"File not found: {file_path}")
+            raise FileNotFoundError(f"File not found: {file_path}")
+        logging.info(f"Streaming sensor data from: {file_path} in chunks of {chunk_size} rows")
+
+        self._validate_data(pd.read_csv(file, nrows=0))
+
+        # The typed profile parses value per chunk, as a bad number cannot be retried mid-stream.
+        dtype = {col: t for col, t in self.TYPED_DTYPES.items() if col != "value"} if self.profile == "typed" else None
+
+        self.rejects = RejectReport()
+        records = 0
+        with pd.read_csv(file, chunksize=chunk_size, dtype=dtype) as reader:
+            for chunk in reader:
+                chunk = self._clean_data(chunk)
+                records += len(chunk)
+                yield chunk
+        self._check_reject_fraction(self.rejects)
+
+        if self.rejects:
+            logging.warning(f"Dropped {len(self.rejects)} invalid rows from {file_path}: {self._describe_rejects()}")
+        logging.info(f"Sensor data streamed successfully with: {records} records.")
+
+    def follow_csv(self, file_path: str | os.PathLike[str], poll_interval: float = 0.2, from_start: bool = True,
+                   stop: Event | None = None, idle_timeout: float | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Follow a CSV file that is still being written, yielding each batch of newly appended rows.
+
+        The file is kept open and polled every poll_interval seconds. Only complete lines are
+        parsed: a trailing line without its newline is held back until the rest of it is
+        written, and the byte offset of the last complete line is tracked so nothing is parsed
+        twice. Each batch is cleaned like a read_csv_chunks() chunk, so it can be passed
+        straight to FaultDetection.detect_from_batch() or detect_stream(). If the file is
+        truncated or replaced, it is followed again from its header. With from_start=False the
+        rows already in the file are skipped without being parsed (see _skip_to_last_line()),
+        but still counted, so rejects keep their row numbers in the file. A followed file has
+        no end, so max_reject_fraction is checked after every batch against the rows parsed so
+        far.
+
+        Args:
+            file_path: Path to the CSV file.
+            poll_interval: seconds to wait for new data once the end of the file is reached.
+            from_start: parse the rows already in the file first; otherwise start at its end.
+            stop: optional event; following ends once it is set.
+            idle_timeout: optional seconds without new data after which following ends.
+
+        Yields:
+            pd.DataFrame: A cleaned and validated batch of the rows appended since the last one.
+
+        Raises:
+            FileNotFoundError: If the file path does not exist.
+            ValueError: If poll_interval is not positive, required columns are missing or data is invalid.
+        """
+        if poll_interval <= 0:
+            raise ValueError(f"poll_interval must be positive, got {poll_interval}")
+
+        file = Path(file_path)
+        if not file.exists():
+            logging.error(f"File not found: {file_path}")
+            raise FileNotFoundError(f"File not found: {file_path}")
+        logging.info(f"Following sensor data in: {file_path}")
+
+        dtype = {col: t for col, t in self.TYPED_DTYPES.items() if col != "value"} if self.profile == "typed" else None
+        f: BinaryIO = open(file, "rb")
+        header = b""
+        pending = b""
+        offset = 0
+        rows = 0     # Data rows parsed so far, so rejects are numbered by their row in the file.
+        records = 0
+        self.rejects = RejectReport()
+        last_data = time.monotonic()
+        try:
+            if not from_start:
+                header, offset, rows = self._skip_to_last_line(f)
+                if header:
+                    self._validate_data(pd.read_csv(io.BytesIO(header), nrows=0))
+            while stop is None or not stop.is_set():
+                if self._follow_restarted(file, f, offset + len(pending)):
+                    logging.warning(f"{file_path} was truncated or replaced, following it from the start.")
+                    f.close()
+                    f = open(file, "rb")
+                    header, pending, offset, rows = b"", b"", 0, 0
+
+                data = f.read(self.FOLLOW_READ_BYTES)
+                if not data:
+                    if idle_timeout is not None and time.monotonic() - last_data >= idle_timeout:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+                last_data = time.monotonic()
+
+                pending += data
+                end = pending.rfind(b"\n") + 1
+                if end == 0:
+                    continue
+                lines, pending = pending[:end], pending[end:]
+                offset += end
+
+                if not header:
+                    header, _, lines = lines.partition(b"\n")
+                    header += b"\n"
+                    self._validate_data(pd.read_csv(io.BytesIO(header), nrows=0))
+                if not lines.strip():
+                    continue
+
+                raw = pd.read_csv(io.BytesIO(header + lines), dtype=dtype)
+                raw.index += rows
+                rows += len(raw)
+                batch = self._clean_data(raw)
+                self._check_reject_fraction(self.rejects)
+                if len(batch):
+                    records += len(batch)
+                    yield batch
+        finally:
+            f.close()
+            if pending:
+                logging.warning(f"Stopped following {file_path} with an incomplete last line of {len(pending)} bytes.")
+            if self.rejects:
+                logging.warning(f"Dropped {len(self.rejects)} invalid rows from {file_path}: {self._describe_rejects()}")
+            logging.info(f"Stopped following sensor data after: {records} records.")
+
+    @classmethod
+    def _skip_to_last_line(cls, f: BinaryIO) -> tuple[bytes, int, int]:
+        """
+        Move a followed file past its last complete line, returning (header, offset, data rows skipped).
+
+        The file is scanned in FOLLOW_READ_BYTES blocks, only counting newlines. If the header
+        line is not complete yet nothing is skipped and the header is empty, as every row
+        after it will be new.
+        """
+        header = f.readline()
+        if not header.endswith(b"\n"):
+            f.seek(0)
+            return b"", 0, 0
+
+        position = offset = len(header)
+        rows = 0
+        while True:
+            data = f.read(cls.FOLLOW_READ_BYTES)
+            if not data:
+                break
+            last = data.rfind(b"\n")
+            if last >= 0:
+                rows += data.count(b"\n")
+                offset = position + last + 1
+            position += len(data)
+        f.seek(offset)
+        return header, offset, rows
+
+    @staticmethod
+    def _follow_restarted(file: Path, f: BinaryIO, position: int) -> bool:
+        """True if the followed file was truncated below position or replaced by another file."""
+        try:
+            current = file.stat()
+        except FileNotFoundError:
+            return False
+        opened = os.fstat(f.fileno())
+        return (current.st_dev, current.st_ino) != (opened.st_dev, opened.st_ino) or opened.st_size < position
+
     def _validate_data(self, df: pd.DataFrame) -> None:
         """
         Ensure the DataFrame contains all required columns.
@@ -69,52 +453,246 @@ class SensorIntegration():
             logging.error(f"Unexpected extra columns in sensor data: {', '.join(extra)}")
             raise ValueError(f"Unexpected extra columns in sensor data: {', '.join(extra)}")
 
-    def _clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _read_typed(self, file: Path) -> pd.DataFrame:
+        """
+        Parse a CSV with the typed profile's dtypes.
+
+        If value holds anything that is not a number, the file is parsed again with value as
+        text so that _clean_data() can drop those rows like the default profile does.
+        """
+        engine = "pyarrow" if HAS_PYARROW else "c"
+        try:
+            return pd.read_csv(file, dtype=self.TYPED_DTYPES, engine=engine)
+        except ValueError:
+            logging.warning(f"Non-numeric sensor values in {file}, parsing the value column as text.")
+            dtype = {col: t for col, t in self.TYPED_DTYPES.items() if col != "value"}
+            return pd.read_csv(file, dtype=dtype, engine=engine)
+
+    def _clean_data(self, df: pd.DataFrame, rejects: RejectReport | None = None) -> pd.DataFrame:
         """
         Clean and preprocess the sensor data.
 
+        Every row is checked in one pass and given a RejectReason or kept; the rejected rows
+        are recorded by their index in rejects (self.rejects by default) and dropped together.
+        Adds an int32 "seconds" column holding each timestamp as seconds of the day, so later
+        stages can sort and bucket by time without parsing the strings again, and encodes the
+        sensor columns with the registry.
+
         Args:
             df: dataframe of data to clean.
+            rejects: report the rejected rows are added to.
 
         Returns:
             df: dataframe of cleaned data.
 
         Raises:
-            ValueError: If timestamp format is invalid (HH:MM:SS)
+            ValueError: If timestamp format is invalid (HH:MM:SS) and no error budget is set.
+            ValueError: If more rows are rejected than the error budget allows.
             ValueError: If error occurs during data cleaning.
         
         """
+        if self.profile == "typed":
+            return self.registry.encode_frame(self._clean_typed(df, rejects))
+
         try:
             for col in ["sensor_id", "sensor_type", "unit"]:
               if col in df.columns:
                    df[col] = df[col].astype(str).str.strip()
 
             df = df.replace({"": pd.NA, " ": pd.NA, "NA": pd.NA})
-            df = df.dropna(subset=["sensor_id", "value", "timestamp"])
-
-            df["value"] = pd.to_numeric(df["value"], errors='coerce')
-            df = df.dropna(subset=["value"])
-
-            # Reuse AlertDatabase's timestamp validation
-            def _verify(ts: str) -> bool:
-                try:
-                    AlertDatabase._validate_timestamp(str(ts))
-                    return True
-                except ValueError:
-                    return False
-                
-            bad_timestamps = ~df["timestamp"].astype(str).map(_verify)
-
-            if bad_timestamps.any():
-                logging.error("Invalid timestamp format detected: Expected HH:MM:SS.")
-                raise ValueError("Invalid timestamp format detected: Expected HH:MM:SS.")
+            missing_value = df["value"].isna().to_numpy()
+            values = pd.to_numeric(df["value"], errors='coerce')
+            seconds = timestamp_seconds(df["timestamp"].to_numpy())
 
-            return df
+            reasons = self._reject_reasons(df["timestamp"].isna().to_numpy(), df["sensor_id"].isna().to_numpy(),
+                                           missing_value, values.isna().to_numpy() & ~missing_value, seconds < 0)
+            df = df.assign(value=values, seconds=seconds)
+            return self.registry.encode_frame(self._drop_rejected(df, reasons, rejects))
         
         except Exception as e:
             logging.error(f"Error during data cleaning: {e}")
             raise ValueError(f"Error during data cleaning: {e}")
     
+    def _clean_typed(self, df: pd.DataFrame, rejects: RejectReport | None = None) -> pd.DataFrame:
+        """
+        Clean a frame read with the typed profile (see _clean_data()).
+
+        Stripping and blank checks run on the categories rather than on every row, timestamps
+        are parsed once per distinct value, and rows are only copied when some are dropped.
+        """
+        try:
+            for col in ["sensor_id", "sensor_type", "unit"]:
+                df[col] = self._clean_categories(df[col])
+            df["timestamp"] = self._clean_categories(df["timestamp"], strip=False)
+
+            missing_value = df["value"].isna().to_numpy()
+            if df["value"].dtype != np.float32:
+                df["value"] = pd.to_numeric(df["value"], errors="coerce").astype(np.float32)
+
+            timestamps = df["timestamp"].cat
+            codes = timestamps.codes.to_numpy()
+            # Missing timestamps (code -1) pick the appended -1.
+            seconds = np.append(timestamp_seconds(timestamps.categories.to_numpy()), np.int32(-1))[codes]
+            df["seconds"] = seconds
+
+            reasons = self._reject_reasons(codes < 0, df["sensor_id"].isna().to_numpy(), missing_value,
+                                           df["value"].isna().to_numpy() & ~missing_value, seconds < 0)
+            return self._drop_rejected(df, reasons, rejects)
+
+        except Exception as e:
+            logging.error(f"Error during data cleaning: {e}")
+            raise ValueError(f"Error during data cleaning: {e}")
+
+    @staticmethod
+    def _reject_reasons(missing_timestamp: np.ndarray, missing_sensor_id: np.ndarray, missing_value: np.ndarray,
+                        non_numeric_value: np.ndarray, invalid_timestamp: np.ndarray) -> np.ndarray:
+        """Combine per-row checks into an int8 RejectReason per row (0 for rows kept), the first failing check winning."""
+        checks = [missing_timestamp, missing_sensor_id, missing_value, non_numeric_value, invalid_timestamp]
+        reasons = [RejectReason.MISSING_TIMESTAMP, RejectReason.MISSING_SENSOR_ID, RejectReason.MISSING_VALUE,
+                   RejectReason.NON_NUMERIC_VALUE, RejectReason.INVALID_TIMESTAMP]
+        return np.select(checks, reasons, default=0).astype(np.int8)
+
+    def _drop_rejected(self, df: pd.DataFrame, reasons: np.ndarray, rejects: RejectReport | None) -> pd.DataFrame:
+        """Record the rejected rows of df in the report, enforce max_rejects and return the rows kept."""
+        report = rejects if rejects is not None else self.rejects
+        rejected = reasons > 0
+        report.add(df.index.to_numpy()[rejected], reasons[rejected], len(df))
+        self._check_budget(report, reasons)
+        return df[~rejected] if rejected.any() else df
+
+    def _check_budget(self, report: RejectReport, reasons: np.ndarray) -> None:
+        """
+        Raise if the rejects in report break max_rejects; reasons are the codes of the latest rows checked.
+
+        Without an error budget a malformed timestamp fails the load. The fraction is checked
+        separately, once the rows it applies to are all in (see _check_reject_fraction()).
+        """
+        if self.max_rejects is None and self.max_reject_fraction is None:
+            if (reasons == RejectReason.INVALID_TIMESTAMP).any():
+                logging.error("Invalid timestamp format detected: Expected HH:MM:SS.")
+                raise ValueError("Invalid timestamp format detected: Expected HH:MM:SS.")
+        elif self.max_rejects is not None and len(report) > self.max_rejects:
+            message = f"{len(report)} of {report.checked} rows rejected, over max_rejects={self.max_rejects}"
+            logging.error(message)
+            raise ValueError(message)
+
+    def _check_reject_fraction(self, report: RejectReport) -> None:
+        """Raise if more than max_reject_fraction of the rows checked in report were rejected."""
+        if self.max_reject_fraction is not None and len(report) > self.max_reject_fraction * report.checked:
+            message = f"{len(report)} of {report.checked} rows rejected, over max_reject_fraction={self.max_reject_fraction}"
+            logging.error(message)
+            raise ValueError(message)
+
+    @staticmethod
+    def _clean_categories(column: pd.Series, strip: bool = True) -> pd.Series:
+        """Strip the categories of a column and turn blank or "NA" ones into missing values."""
+        if not isinstance(column.dtype, pd.CategoricalDtype):
+            column = column.astype("category")
+        categories = column.cat.categories
+        stripped = categories.astype(str)
+        if strip:
+            stripped = stripped.str.strip()
+        missing = stripped.isin(["", " ", "NA"])
+        if not missing.any() and stripped.equals(categories):
+            return column
+
+        # Categories that strip to the same text are merged into one.
+        new_code_of, new_categories = pd.factorize(stripped.where(~missing))
+        codes = column.cat.codes.to_numpy()
+        codes = np.where(codes >= 0, new_code_of[np.maximum(codes, 0)], -1)
+        return pd.Series(pd.Categorical.from_codes(codes, categories=new_categories), index=column.index, name=column.name)
+
+    def read_many(self, paths: str | os.PathLike[str] | Iterable[str | os.PathLike[str]], workers: int | None = None,
+                  pool: str = "process", pattern: str = "*.csv") -> IngestReport:
+        """
+        Load several sensor CSV files, or every CSV in a directory, into one frame.
+
+        Files are read and cleaned in a process (or thread) pool with read_csv(). A file that
+        cannot be read or fails validation is recorded in the report's errors and skipped, and
+        the others are still loaded. The frames are merged in input order into one frame,
+        stably sorted by timestamp, with a categorical source column naming the file each
+        row came from.
+
+        Args:
+            paths: a directory, a file, or a list of files and directories.
+            workers: pool size, os.cpu_count() by default; 1 reads the files in this thread.
+            pool: "process" or "thread".
+            pattern: glob used to list the files of a directory.
+
+        Returns:
+            IngestReport: the merged frame (also kept in self.data), the files loaded, the errors
+            and the RejectReport of each file loaded.
+
+        Raises:
+            ValueError: If pool is unknown.
+        """
+        if pool not in ("process", "thread"):
+            raise ValueError(f"pool must be 'process' or 'thread', got {pool!r}")
+
+        files: List[str] = []
+        for path in [paths] if isinstance(paths, (str, os.PathLike)) else paths:
+            path = Path(path)
+            if path.is_dir():
+                files.extend(str(p) for p in sorted(path.glob(pattern)))
+            else:
+                files.append(str(path))
+        logging.info(f"Loading sensor data from {len(files)} file(s)")
+
+        workers = min(workers or os.cpu_count() or 1, max(len(files), 1))
+        frames: Dict[str, pd.DataFrame] = {}
+        errors: Dict[str, str] = {}
+        rejects: Dict[str, RejectReport] = {}
+        if workers == 1:
+            for file_path in files:
+                try:
+                    frames[file_path], rejects[file_path] = _read_one(file_path, self.profile, self.cache, self.max_rejects, self.max_reject_fraction)
+                except (OSError, ValueError) as e:
+                    errors[file_path] = str(e)
+        else:
+            executor: Executor = ProcessPoolExecutor(workers) if pool == "process" else ThreadPoolExecutor(workers)
+            with executor:
+                futures = {
+                    file_path: executor.submit(_read_one, file_path, self.profile, self.cache, self.max_rejects, self.max_reject_fraction)
+                    for file_path in files
+                }
+                for file_path, future in futures.items():
+                    try:
+                        frames[file_path], rejects[file_path] = future.result()
+                    except (OSError, ValueError) as e:
+                        errors[file_path] = str(e)
+
+        for file_path, message in errors.items():
+            logging.error(f"Failed to load {file_path}: {message}")
+
+        data = self._merge_frames(frames)
+        self.data = data
+        logging.info(f"Sensor data loaded with: {len(data)} records from {len(frames)} file(s), {len(errors)} failed.")
+        return IngestReport(data=data, loaded=list(frames), errors=errors, rejects=rejects)
+
+    def _merge_frames(self, frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """Concatenate cleaned frames keyed by source file and stably sort them by time of day."""
+        if not frames:
+            return pd.DataFrame(columns=SensorIntegration.REQUIRED_COLS + ["seconds", "source"])
+
+        # Frames read in worker processes were encoded with the workers' registries.
+        parts = self.registry.encode_frames(list(frames.values()))
+        # Categorical columns only stay categorical through concat if every part has the same categories.
+        for col in parts[0].columns:
+            if all(isinstance(part[col].dtype, pd.CategoricalDtype) for part in parts):
+                categories = pd.api.types.union_categoricals([part[col] for part in parts]).categories
+                parts = [part.assign(**{col: part[col].cat.set_categories(categories)}) for part in parts]
+
+        data = pd.concat(parts, ignore_index=True)
+        data["source"] = pd.Categorical.from_codes(
+            np.repeat(np.arange(len(parts)), [len(part) for part in parts]), categories=list(frames)
+        )
+        order = np.argsort(data["seconds"].to_numpy(), kind="stable")
+        return data.take(order).reset_index(drop=True)
+
+    def _describe_rejects(self) -> str:
+        """The reject counts of self.rejects as "REASON: count" text for the log."""
+        return ", ".join(f"{reason.name}: {count}" for reason, count in self.rejects.counts().items())
+
     def get_sensor_data(self) -> pd.DataFrame:
         if self.data is None:
             logging.error("No sensor data has been loaded yet.")
@@ -0,0 +1,108 @@
+import threading
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+class SensorRegistry:
+    """
+    Dictionary encoding of sensor identifiers.
+
+    Every distinct sensor_id, sensor_type and unit string is given a small integer code the
+    first time it is seen, and keeps it for the life of the registry. Ingested frames hold
+    these columns as categoricals whose categories are the registry's names, so each cell is
+    stored as its code and the code of a value is the same in every frame. Strings are only
+    built again where they are displayed or exported.
+
+    Encoding works on the distinct values of a column (pd.factorize), so the per-row cost is
+    one hash of each value, or none when the column is already categorical.
+
+    """
+
+    FIELDS = ("sensor_id", "sensor_type", "unit")
+
+    def __init__(self) -> None:
+        self._codes: Dict[str, Dict[str, int]] = {field: {} for field in self.FIELDS}
+        self._names: Dict[str, List[str]] = {field: [] for field in self.FIELDS}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of registered sensor ids."""
+        return len(self._names["sensor_id"])
+
+    def codes_for(self, field: str, names: Iterable[str]) -> np.ndarray:
+        """
+        Return the codes of names, registering the ones not seen before.
+
+        Args:
+            field: "sensor_id", "sensor_type" or "unit".
+            names: distinct strings to encode.
+
+        Returns:
+            np.ndarray: int32 code per name.
+        """
+        codes = self._codes[field]
+        with self._lock:
+            result = []
+            for name in names:
+                code = codes.get(name)
+                if code is None:
+                    code = codes[name] = len(self._names[field])
+                    self._names[field].append(name)
+                result.append(code)
+        return np.array(result, dtype=np.int32)
+
+    def names(self, field: str) -> np.ndarray:
+        """Every registered name of a field, indexed by code."""
+        with self._lock:
+            return np.array(self._names[field], dtype=object)
+
+    def encode(self, field: str, values: Sequence[str] | pd.Series | np.ndarray) -> np.ndarray:
+        """
+        Encode a column of strings as registry codes.
+
+        Returns:
+            np.ndarray: int32 code per value, -1 where the value is missing.
+        """
+        if isinstance(getattr(values, "dtype", None), pd.CategoricalDtype):
+            # Already dictionary encoded: only the categories are looked up.
+            categorical = pd.Categorical(values)
+            mapping = self.codes_for(field, [str(name) for name in categorical.categories])
+            mapping = np.append(mapping, np.int32(-1))
+            return mapping[categorical.codes]
+        if not isinstance(values, (pd.Series, pd.Index, np.ndarray, pd.api.extensions.ExtensionArray)):
+            values = np.array(values, dtype=object)
+        row_codes, uniques = pd.factorize(values)
+        if len(uniques) == 0:
+            return np.full(len(row_codes), -1, dtype=np.int32)
+        mapping = self.codes_for(field, [str(name) for name in np.asarray(uniques, dtype=object)])
+        return np.where(row_codes >= 0, mapping[np.maximum(row_codes, 0)], -1).astype(np.int32)
+
+    def decode(self, field: str, codes: np.ndarray) -> np.ndarray:
+        """Turn registry codes back into strings (None for -1)."""
+        names = np.append(self.names(field), None)
+        return names[np.where(codes >= 0, codes, len(names) - 1)]
+
+    def encode_frames(self, frames: Sequence[pd.DataFrame]) -> List[pd.DataFrame]:
+        """
+        Replace the sensor_id, sensor_type and unit columns of frames with registry-coded categoricals.
+
+        All frames get the same categories, so they concatenate without losing the encoding.
+        """
+        encoded = {field: [self.encode(field, df[field]) for df in frames] for field in self.FIELDS if all(field in df.columns for df in frames)}
+        categories = {field: pd.Index(self.names(field), dtype=object) for field in encoded}
+        result = []
+        for index, df in enumerate(frames):
+            columns = {
+                field: pd.Categorical.from_codes(codes[index], dtype=pd.CategoricalDtype(categories[field]))
+                for field, codes in encoded.items()
+            }
+            result.append(df.assign(**columns) if columns else df)
+        return result
+
+    def encode_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Replace the sensor_id, sensor_type and unit columns of one frame with registry-coded categoricals."""
+        return self.encode_frames([df])[0]
+
+# Shared by every SensorIntegration by default, so codes agree across files and streams.
+SENSOR_REGISTRY = SensorRegistry()
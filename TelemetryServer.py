@@ -0,0 +1,362 @@
+import asyncio
+import logging
+import re
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from Abstractions import FaultBatch
+from FaultDetection import FaultDetection
+from SensorIntegration import RejectReport, SensorIntegration
+from Timestamps import HOUR_MINUTE_SECOND
+
+TRANSPORTS = ("tcp", "udp")
+READ_BYTES = 64 * 1024
+
+# Raw record fields, in SensorIntegration.REQUIRED_COLS order.
+Record = Tuple[str, str, str, str, str]
+
+# Spaces and commas inside line protocol names are escaped with a backslash.
+_UNESCAPED_SPACE = re.compile(r"(?<!\\) ")
+_UNESCAPED_COMMA = re.compile(r"(?<!\\),")
+
+def _unescape(text: str) -> str:
+    return text.replace("\\ ", " ").replace("\\,", ",")
+
+def parse_record(line: str) -> Optional[Record]:
+    """
+    Parse one CSV or line protocol sensor record into its raw fields.
+
+    CSV records hold the SensorIntegration columns in order:
+        00:00:02,ENG_OILTEMP,Temperature,230,C
+    Line protocol records carry the sensor type as the measurement, the sensor id and unit as
+    tags, the reading as the value field and the HH:MM:SS timestamp last:
+        Temperature,sensor_id=ENG_OILTEMP,unit=C value=230 00:00:02
+
+    Returns:
+        tuple | None: (timestamp, sensor_id, sensor_type, value, unit), or None if the record is
+        malformed or its timestamp is not a valid HH:MM:SS time.
+    """
+    if "=" in line:
+        parts = _UNESCAPED_SPACE.split(line)
+        if len(parts) != 3:
+            return None
+        series, fields, timestamp = parts
+        sensor_type, *tag_pairs = _UNESCAPED_COMMA.split(series)
+        tags = dict(pair.split("=", 1) for pair in tag_pairs if "=" in pair)
+        if not fields.startswith("value=") or "sensor_id" not in tags:
+            return None
+        record = (timestamp, _unescape(tags["sensor_id"]), _unescape(sensor_type), fields[6:], _unescape(tags.get("unit", "")))
+    else:
+        fields = line.split(",")
+        if len(fields) != 5:
+            return None
+        record = tuple(fields)
+
+    if not HOUR_MINUTE_SECOND.match(record[0]):
+        return None
+    return record
+
+def format_line_protocol(timestamp: str, sensor_id: str, sensor_type: str, value: float, unit: str) -> str:
+    """Format one reading as a line protocol record (without the newline)."""
+    def escape(text: str) -> str:
+        return text.replace(" ", "\\ ").replace(",", "\\,")
+    return f"{escape(sensor_type)},sensor_id={escape(sensor_id)},unit={escape(unit)} value={value} {timestamp}"
+
+@dataclass
+class TelemetryStats:
+    """Counters of a TelemetryServer."""
+    received: int = 0   # Records parsed and queued.
+    rejected: int = 0   # Malformed records and rows dropped by cleaning.
+    dropped: int = 0    # UDP records discarded because the queue was full.
+    batches: int = 0    # Batches run through fault detection.
+    faults: int = 0     # Faults detected, raised and cleared.
+    failed: int = 0     # Batches abandoned because detection or on_faults raised.
+
+class TelemetryServer():
+    """Receives live sensor records over TCP and UDP and runs fault detection on them in batches.
+
+    Each line is one CSV or line protocol record (see parse_record()). A CSV header line is
+    checked with SensorIntegration._validate_data(), and every batch is cleaned with
+    SensorIntegration._clean_data() before detection, so live records follow the same rules
+    as uploaded files. Records are queued and cut into batches of batch_size records, or
+    fewer once batch_interval seconds have passed since the first record of the batch.
+
+    The queue is bounded. A full queue stops the server reading from TCP connections, so
+    the senders are held back by TCP flow control. UDP has no flow control, so datagrams that
+    arrive while the queue is full are dropped and counted in stats.dropped.
+
+    A batch whose detection or on_faults callback raises is logged, counted in stats.failed
+    and skipped; the server keeps reading and detecting the batches after it.
+
+    """
+
+    def __init__(self, fault_detection: FaultDetection, host: str = "127.0.0.1", tcp_port: Optional[int] = 0,
+                 udp_port: Optional[int] = 0, batch_size: int = 1000, batch_interval: float = 0.2, queue_size: int = 10_000,
+                 on_faults: Optional[Callable[[FaultBatch, pd.DataFrame], None]] = None) -> None:
+        """
+        Args:
+            fault_detection: detector with its rules loaded; its fault state carries across batches.
+            host: address to listen on.
+            tcp_port: TCP port, 0 for any free port or None to not listen on TCP.
+            udp_port: UDP port, 0 for any free port or None to not listen on UDP.
+            batch_size: most records per detection batch.
+            batch_interval: seconds a partial batch waits for more records.
+            queue_size: most records waiting for detection.
+            on_faults: called with the faults and cleaned rows of each batch that detected any,
+                on a worker thread. Exceptions it raises fail only that batch.
+
+        Raises:
+            ValueError: If batch_size, batch_interval or queue_size is not positive, or both ports are None.
+        """
+        if batch_size <= 0 or batch_interval <= 0 or queue_size <= 0:
+            raise ValueError("batch_size, batch_interval and queue_size must be positive")
+        if tcp_port is None and udp_port is None:
+            raise ValueError("At least one of tcp_port and udp_port is required")
+        self.fault_detection = fault_detection
+        # Bad rows are dropped and counted instead of discarding the whole batch.
+        self.sensor_integration = SensorIntegration(max_reject_fraction=1.0)
+        self.host = host
+        self.tcp_port = tcp_port
+        self.udp_port = udp_port
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.queue_size = queue_size
+        self.on_faults = on_faults
+        self.stats = TelemetryStats()
+        self._queue: Optional[asyncio.Queue] = None
+        self._tcp_server: Optional[asyncio.base_events.Server] = None
+        self._udp_transport: Optional[asyncio.DatagramTransport] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._connections: Set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Start listening; tcp_port and udp_port are then the bound ports."""
+        loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(self.queue_size)
+        if self.tcp_port is not None:
+            self._tcp_server = await asyncio.start_server(self._handle_connection, self.host, self.tcp_port)
+            self.tcp_port = self._tcp_server.sockets[0].getsockname()[1]
+        if self.udp_port is not None:
+            self._udp_transport, _ = await loop.create_datagram_endpoint(
+                lambda: _DatagramProtocol(self), local_addr=(self.host, self.udp_port)
+            )
+            self.udp_port = self._udp_transport.get_extra_info("sockname")[1]
+        self._batcher = asyncio.create_task(self._run_batches())
+        logging.info(f"Telemetry server listening on {self.host} (tcp {self.tcp_port}, udp {self.udp_port})")
+
+    async def stop(self, drain_timeout: float = 1.0) -> None:
+        """
+        Stop listening, then detect faults in the records still queued.
+
+        Args:
+            drain_timeout: seconds open TCP connections get to finish sending before they are closed.
+        """
+        if self._tcp_server is not None:
+            self._tcp_server.close()
+            if self._connections:
+                _, still_open = await asyncio.wait(self._connections, timeout=drain_timeout)
+                for task in still_open:
+                    task.cancel()
+                await asyncio.gather(*still_open, return_exceptions=True)
+            await self._tcp_server.wait_closed()
+        if self._udp_transport is not None:
+            self._udp_transport.close()
+        if self._batcher is not None:
+            if not self._batcher.done():
+                await self._queue.put(None)
+            await self._batcher
+        logging.info(f"Telemetry server stopped: {asdict(self.stats)}")
+
+    async def serve_forever(self) -> None:
+        """Start the server and run until cancelled."""
+        await self.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.stop()
+
+    def _parse_lines(self, lines: Iterable[str]) -> Tuple[List[Record], bool]:
+        """Parse received lines, returning the records and False if a bad CSV header was seen."""
+        records: List[Record] = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("timestamp,"):
+                try:
+                    self.sensor_integration._validate_data(pd.DataFrame(columns=line.split(",")))
+                except ValueError:
+                    self.stats.rejected += 1
+                    return records, False
+                continue
+            record = parse_record(line)
+            if record is None:
+                self.stats.rejected += 1
+            else:
+                records.append(record)
+        return records, True
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Queue the records of one TCP connection, waiting whenever the queue is full."""
+        peer = writer.get_extra_info("peername")
+        task = asyncio.current_task()
+        self._connections.add(task)
+        pending = b""
+        try:
+            while data := await reader.read(READ_BYTES):
+                pending += data
+                end = pending.rfind(b"\n") + 1
+                if end == 0:
+                    continue
+                lines, pending = pending[:end], pending[end:]
+                records, header_ok = self._parse_lines(lines.decode(errors="replace").splitlines())
+                for record in records:
+                    await self._queue.put(record)
+                self.stats.received += len(records)
+                if not header_ok:
+                    logging.error(f"Closing telemetry connection from {peer}: invalid CSV header.")
+                    break
+            if pending.strip():
+                records, _ = self._parse_lines([pending.decode(errors="replace")])
+                for record in records:
+                    await self._queue.put(record)
+                self.stats.received += len(records)
+        except ConnectionError as e:
+            logging.warning(f"Telemetry connection from {peer} lost: {e}")
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    def _queue_datagram(self, data: bytes) -> None:
+        """Queue the records of one UDP datagram, dropping them if the queue is full."""
+        records, _ = self._parse_lines(data.decode(errors="replace").splitlines())
+        for position, record in enumerate(records):
+            try:
+                self._queue.put_nowait(record)
+            except asyncio.QueueFull:
+                self.stats.dropped += len(records) - position
+                break
+            self.stats.received += 1
+
+    async def _run_batches(self) -> None:
+        """Cut the queue into batches and run fault detection on each until a None is queued."""
+        running = True
+        while running:
+            record = await self._queue.get()
+            if record is None:
+                break
+            batch = [record]
+            deadline = time.monotonic() + self.batch_interval
+            while len(batch) < self.batch_size:
+                try:
+                    record = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        record = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if record is None:
+                    running = False
+                    break
+                batch.append(record)
+            # Detection runs in a thread so the event loop keeps reading sockets meanwhile.
+            try:
+                rejected, faults = await asyncio.to_thread(self._detect, batch)
+            except Exception:
+                # One bad batch (e.g. the consumer's database failing) must not stop ingestion.
+                logging.exception(f"Telemetry batch of {len(batch)} records failed")
+                self.stats.failed += 1
+                continue
+            self.stats.rejected += rejected
+            self.stats.faults += faults
+            self.stats.batches += 1
+
+    def _detect(self, records: List[Record]) -> Tuple[int, int]:
+        """Clean one batch of records and run fault detection on it, returning the rows rejected and the faults found."""
+        data_frame = pd.DataFrame.from_records(records, columns=SensorIntegration.REQUIRED_COLS)
+        try:
+            data_frame = self.sensor_integration._clean_data(data_frame, RejectReport()).reset_index(drop=True)
+        except ValueError as e:
+            logging.error(f"Discarding telemetry batch of {len(records)} records: {e}")
+            return len(records), 0
+        if data_frame.empty:
+            return len(records), 0
+
+        faults = self.fault_detection.detect_from_batch(data_frame)
+        if len(faults) and self.on_faults is not None:
+            self.on_faults(faults, data_frame)
+        return len(records) - len(data_frame), len(faults)
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    """Hands UDP datagrams to a TelemetryServer."""
+
+    def __init__(self, server: TelemetryServer) -> None:
+        self.server = server
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        self.server._queue_datagram(data)
+
+async def send_records(host: str, port: int, lines: Iterable[str], transport: str = "tcp",
+                       rate: Optional[float] = None, lines_per_send: int = 100) -> int:
+    """
+    Load generator: send sensor records to a TelemetryServer.
+
+    Args:
+        host: server address.
+        port: server TCP or UDP port.
+        lines: records to send, without newlines.
+        transport: "tcp" or "udp".
+        rate: records per second to pace sending at, or None to send as fast as possible.
+        lines_per_send: records per write (per datagram for UDP).
+
+    Returns:
+        int: number of records sent.
+
+    Raises:
+        ValueError: If transport is unknown.
+    """
+    if transport not in TRANSPORTS:
+        raise ValueError(f"transport must be one of {TRANSPORTS}, got {transport!r}")
+
+    loop = asyncio.get_running_loop()
+    if transport == "tcp":
+        _, writer = await asyncio.open_connection(host, port)
+        send = writer.write
+    else:
+        udp, _ = await loop.create_datagram_endpoint(asyncio.DatagramProtocol, remote_addr=(host, port))
+        send = udp.sendto
+
+    sent = 0
+    start = time.monotonic()
+    chunk: List[str] = []
+    try:
+        for line in lines:
+            chunk.append(line)
+            if len(chunk) < lines_per_send:
+                continue
+            send(("\n".join(chunk) + "\n").encode())
+            sent += len(chunk)
+            chunk = []
+            if transport == "tcp":
+                await writer.drain()
+            if rate is not None:
+                await asyncio.sleep(max(0.0, start + sent / rate - time.monotonic()))
+            else:
+                await asyncio.sleep(0)
+        if chunk:
+            send(("\n".join(chunk) + "\n").encode())
+            sent += len(chunk)
+    finally:
+        if transport == "tcp":
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        else:
+            udp.close()
+    return sent
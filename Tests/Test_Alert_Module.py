@@ -2,10 +2,11 @@ import sys, os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from unittest.mock import patch
+import pandas as pd
 
 from Abstractions import AlertCreation, Alert, Status
 from Database import AlertDatabase
-from AlertModule import AlertModule
+from AlertModule import EXPORT_COLUMNS, AlertModule
 from Test_Base import TestBase
 
 class TestAlertModule(TestBase):
@@ -46,6 +47,43 @@ class TestAlertModule(TestBase):
         self.assertEqual(len(refreshed), 1)
         self.assertEqual(refreshed[0].alert_id, self.alert_module.alerts[0].alert_id)
 
+    def test_create_alerts_batch(self) -> None:
+        """(FR2) Test creating a batch of alerts from AlertCreation records."""
+        creations = [
+            AlertCreation(sensor_id=f"sensor_{i}", fault_code="F010", severity="Moderate", message="Batch fault", timestamp=f"00:00:0{i}")
+            for i in range(3)
+        ]
+        created = self.alert_module.create_alerts(iter(creations))
+
+        self.assertEqual([a.sensor_id for a in created], ["sensor_0", "sensor_1", "sensor_2"])
+        # Batches are only kept in the database, so repeated uploads don't grow the module.
+        self.assertEqual(self.alert_module.alerts, [])
+        self.assertEqual([a.alert_id for a in self.alert_module.get_all_alerts()], [a.alert_id for a in created])
+
+    def test_export_and_statistics_stream_alerts(self) -> None:
+        """(FR7, NFR5) Test that alerts are exported to CSV and counted straight from the database without being kept."""
+        self.alert_module.create_alerts(
+            AlertCreation(f"sensor_{i % 2}", "F010", "Critical" if i % 2 else "Advisory", "Batch, fault", f"{i:02d}:30:00")
+            for i in range(5)
+        )
+        self.alert_module.resolve_alert(2)
+
+        export_path = self.tmp_path / "alerts.csv"
+        self.assertEqual(self.alert_module.export_csv(export_path, severity="Critical"), 2)
+        exported = pd.read_csv(export_path)
+        self.assertEqual(exported.columns.tolist(), EXPORT_COLUMNS)
+        self.assertEqual(exported["alert_id"].tolist(), [2, 4])
+        self.assertEqual(exported["message"].tolist(), ["Batch, fault"] * 2)
+        self.assertEqual(exported["status"].tolist(), ["Resolved", "Active"])
+
+        stats = self.alert_module.alert_statistics()
+        self.assertEqual(stats.total, 5)
+        self.assertEqual(stats.by_severity, {"Advisory": 3, "Critical": 2})
+        self.assertEqual(stats.by_status, {"Active": 4, "Resolved": 1})
+        self.assertEqual(stats.per_hour[:6], [1, 1, 1, 1, 1, 0])
+        self.assertEqual(self.alert_module.alert_statistics(sensor_id="sensor_1").total, 2)
+        self.assertEqual(self.alert_module.alerts, [])
+
     def test_create_alert_invalid_timestamp(self) -> None:
         """(FR2, NFR3) Test creating an alert with an invalid timestamp fails alert creation."""
         with patch("AlertModule.logging") as mock_log:
@@ -118,4 +156,24 @@ class TestAlertModule(TestBase):
         db_after_unresolve = self.database.get(created.alert_id)
         self.assertIsNotNone(db_after_unresolve)
         assert db_after_unresolve is not None
-        self.assertEqual(db_after_unresolve.status, Status.ACTIVE)
\ No newline at end of file
+        self.assertEqual(db_after_unresolve.status, Status.ACTIVE)
+
+    def test_bulk_resolve_and_delete(self) -> None:
+        """(FR4, FR5) Test resolving, reactivating and deleting many alerts by id list or filter."""
+        created = self.alert_module.create_alerts(
+            AlertCreation(f"sensor_{i % 2}", "F005", "Critical" if i < 2 else "Advisory", "Bulk fault", f"00:00:0{i}") for i in range(6)
+        )
+        ids = [a.alert_id for a in created]
+
+        self.assertEqual(self.alert_module.resolve_alerts(ids[:3]), 3)
+        self.assertEqual(self.alert_module.unresolve_alerts(severity="Critical"), 2)
+        self.assertEqual([a.status for a in self.database.get_all()], [Status.ACTIVE] * 2 + [Status.RESOLVED] + [Status.ACTIVE] * 3)
+
+        # Deleted alerts are dropped from the loaded list too.
+        self.alert_module.get_all_alerts()
+        self.assertEqual(self.alert_module.delete_alerts(severity="Advisory", sensor_id="sensor_1"), 2)
+        self.assertEqual(self.alert_module.delete_alerts([ids[0], 9999]), 1)
+        self.assertEqual([a.alert_id for a in self.alert_module.alerts], [ids[1], ids[2], ids[4]])
+        self.assertEqual([a.alert_id for a in self.database.get_all()], [ids[1], ids[2], ids[4]])
+        with self.assertRaises(ValueError):
+            self.alert_module.delete_alerts()
@@ -0,0 +1,87 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+
+from BinaryTelemetry import RECORD_DTYPE, read_telemetry, write_telemetry
+from FaultDetection import FaultDetection
+from SensorIntegration import SensorIntegration
+from Test_Base import TestBase
+
+def _is_memory_mapped(array: np.ndarray) -> bool:
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = getattr(array, "base", None)
+    return False
+
+class TestBinaryTelemetry(TestBase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.csv_path = self.write_csv(pd.DataFrame({
+            "timestamp": ["00:00:01", "00:00:02", "00:00:03", "12:00:00", "23:59:59"],
+            "sensor_id": ["ENG_OILTEMP", "ELEC_BUS", "ENG_OILTEMP", "FUEL_FLOW", "ELEC_BUS"],
+            "sensor_type": ["Temperature", "Voltage", "Temperature", "Flow Rate", "Voltage"],
+            "value": [230.5, 18.25, 100.0, 50.0, 24.0],
+            "unit": ["C", "V", "C", "kg/h", "V"],
+        }), "sensors.csv")
+        self.bin_path = self.tmp_path / "sensors.bin"
+        self.expected = SensorIntegration().read_csv(self.csv_path)
+
+    def test_round_trip_matches_csv_ingest(self) -> None:
+        """(FR3, NFR5) Test that a binary file reads back the same readings as the CSV, memory-mapped."""
+        self.assertEqual(write_telemetry(self.bin_path, self.expected), 5)
+
+        sensor_integration = SensorIntegration()
+        df = sensor_integration.read_binary(self.bin_path)
+
+        self.assertIs(sensor_integration.get_sensor_data(), df)
+        self.assertEqual(list(df.columns), SensorIntegration.REQUIRED_COLS + ["seconds"])
+        for col in ["timestamp", "sensor_id", "sensor_type", "unit"]:
+            self.assertEqual(df[col].astype(str).tolist(), self.expected[col].tolist())
+        self.assertEqual(df["seconds"].tolist(), self.expected["seconds"].tolist())
+        np.testing.assert_array_equal(df["value"].to_numpy(), self.expected["value"].to_numpy(dtype=np.float32))
+        self.assertTrue(_is_memory_mapped(df["value"].to_numpy()))
+        self.assertTrue(_is_memory_mapped(df["seconds"].to_numpy()))
+
+    def test_binary_feeds_fault_detection(self) -> None:
+        """(FR1) Test that readings loaded from a binary file give the same faults as the CSV."""
+        write_telemetry(self.bin_path, self.expected)
+        detected = []
+        for df in [self.expected, SensorIntegration().read_binary(self.bin_path)]:
+            fault_detection = FaultDetection()
+            fault_detection.load_rules("fault_rules.json")
+            detected.append(list(fault_detection.detect_from_batch(df)))
+        self.assertEqual(detected[1], detected[0])
+        self.assertEqual(len(detected[0]), 5)
+
+    def test_incomplete_last_record_is_ignored(self) -> None:
+        """(FR3) Test that a partially written last record is left out of the frame."""
+        write_telemetry(self.bin_path, self.expected)
+        with open(self.bin_path, "ab") as f:
+            f.write(b"\x01" * (RECORD_DTYPE.itemsize - 1))
+        with patch("BinaryTelemetry.logging") as mock_log:
+            self.assertEqual(len(read_telemetry(self.bin_path)), 5)
+            self.assertTrue(mock_log.warning.called)
+
+    def test_invalid_files_raise(self) -> None:
+        """(FR3, NFR3) Test that files that are not valid telemetry files are rejected."""
+        self.bin_path.write_bytes(b"timestamp,sensor_id\n")
+        with patch("SensorIntegration.logging") as mock_log:
+            with self.assertRaises(ValueError):
+                SensorIntegration().read_binary(self.bin_path)
+            self.assertTrue(mock_log.error.called)
+
+        write_telemetry(self.bin_path, self.expected)
+        records = np.memmap(self.bin_path, dtype=RECORD_DTYPE, mode="r+", offset=os.path.getsize(self.bin_path) - RECORD_DTYPE.itemsize)
+        records["sensor"][0] = 99
+        records.flush()
+        del records
+        with self.assertRaises(ValueError):
+            read_telemetry(self.bin_path)
+
+        with self.assertRaises(FileNotFoundError):
+            SensorIntegration().read_binary(self.tmp_path / "missing.bin")
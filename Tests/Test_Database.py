@@ -1,8 +1,13 @@
 import sys, os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 from Database import AlertDatabase
-from Abstractions import AlertCreation
+from Abstractions import AlertCreation, Status
 from Test_Base import TestBase
 
 class TestDatabase(TestBase):
@@ -84,4 +89,227 @@ class TestDatabase(TestBase):
             created_ids.append(created.alert_id)
 
         all_alerts = self.database.get_all()
-        self.assertEqual([a.alert_id for a in all_alerts], created_ids)
\ No newline at end of file
+        self.assertEqual([a.alert_id for a in all_alerts], created_ids)
+
+    def test_create_many_inserts_batch_in_one_transaction(self) -> None:
+        """(FR2, NFR5) Test that create_many stores a batch with consecutive ids and stores nothing if any alert is invalid."""
+        self.database.create(AlertCreation("ENG_OILTEMP", "F000", "Advisory", "first", "00:00:00"))
+        creations = [AlertCreation(f"sensor_{i % 2}", f"F00{i}", "Moderate", f"Test fault {i}", f"00:00:0{i}") for i in range(1, 4)]
+
+        statements = []
+        self.database._con.set_trace_callback(statements.append)
+        created = self.database.create_many(iter(creations))
+        self.database._con.set_trace_callback(None)
+
+        self.assertEqual(sum(statement == "COMMIT" for statement in statements), 1)
+        self.assertEqual(created, self.database.get_all()[1:])
+        self.assertEqual([a.alert_id for a in created], [2, 3, 4])
+        self.assertEqual([a.sensor_id for a in created], ["sensor_1", "sensor_0", "sensor_1"])
+        self.assertEqual(self.database.create_many([]), [])
+
+        with self.assertRaises(ValueError):
+            self.database.create_many([AlertCreation("NEW_SENSOR", "F1", "Critical", "m", "00:00:09"),
+                                       AlertCreation("NEW_SENSOR", "F1", "Critical", "m", "24:00:00")])
+        with self.assertRaises(ValueError):
+            self.database.create_many([AlertCreation("NEW_SENSOR", "F1", "Critical", "m", "00:00:09"),
+                                       AlertCreation("NEW_SENSOR", "F1", "Critical", None, "00:00:10")])
+        self.assertEqual(len(self.database.get_all()), 4)
+        # The sensor added by the rolled back batch is registered again when next used.
+        self.assertEqual(self.database.create_many(creations[:1] + [AlertCreation("NEW_SENSOR", "F1", "Critical", "m", "00:00:09")])[1].alert_id, 6)
+        self.assertEqual(self.database.get(6).sensor_id, "NEW_SENSOR")
+
+    def test_query_filters_and_pages(self) -> None:
+        """(FR7, NFR5) Test that query() filters in the database and pages through every match once."""
+        severities = ["Critical", "Moderate", "Advisory"]
+        self.database.create_many(
+            AlertCreation(f"sensor_{i % 2}", "F001", severities[i % 3], f"fault {i}", f"00:00:{59 - i:02d}") for i in range(30)
+        )
+        for alert_id in (1, 4, 5):
+            self.database.update_status(alert_id, Status.RESOLVED)
+
+        page = self.database.query(severity="Critical", status=Status.ACTIVE, limit=4)
+        self.assertEqual([a.alert_id for a in page.alerts], [7, 10, 13, 16])
+        self.assertEqual(page.next_cursor, (16,))
+        page = self.database.query(severity="Critical", status=Status.ACTIVE, limit=4, after=page.next_cursor)
+        self.assertEqual([a.alert_id for a in page.alerts], [19, 22, 25, 28])
+        self.assertIsNone(page.next_cursor)
+
+        self.assertEqual([a.alert_id for a in self.database.query(status=Status.RESOLVED).alerts], [1, 4, 5])
+        self.assertEqual({a.sensor_id for a in self.database.query(sensor_id="sensor_1").alerts}, {"sensor_1"})
+        self.assertEqual(self.database.query(sensor_id="unknown").alerts, [])
+
+        # Paging by timestamp, newest first, with a time window.
+        seen, cursor = [], None
+        while True:
+            page = self.database.query(start="00:00:35", end="00:00:50", order_by="timestamp", descending=True, limit=5, after=cursor)
+            seen.extend(a.timestamp for a in page.alerts)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        self.assertEqual(seen, [f"00:00:{s:02d}" for s in range(50, 34, -1)])
+
+        for bad in [{"order_by": "severity"}, {"limit": 0}, {"start": "9:00"}, {"after": (1, 2)}]:
+            with self.subTest(bad=bad):
+                with self.assertRaises(ValueError):
+                    self.database.query(**bad)
+
+    def test_iter_alerts_streams_in_batches(self) -> None:
+        """(NFR5) Test that iter_alerts yields every matching alert once, in id order, one batch query at a time."""
+        self.database.create_many(
+            AlertCreation(f"sensor_{i % 2}", "F001", "Critical" if i % 3 else "Advisory", "m", f"00:00:{i:02d}") for i in range(25)
+        )
+        with patch.object(self.database, "_select", wraps=self.database._select) as select:
+            alerts = self.database.iter_alerts(batch_size=10)
+            select.assert_not_called()
+            self.assertEqual([a.alert_id for a in alerts], list(range(1, 26)))
+        self.assertEqual([call.args[1][-2:] for call in select.call_args_list], [(0, 10), (10, 10), (20, 10)])
+
+        critical = list(self.database.iter_alerts(severity="Critical", sensor_id="sensor_1", batch_size=2))
+        self.assertEqual([a.alert_id for a in critical], [2, 6, 8, 12, 14, 18, 20, 24])
+        self.assertTrue(all(isinstance(a.status, Status) for a in critical))
+        self.assertEqual(self.database.count(severity="Critical", sensor_id="sensor_1"), 8)
+        with self.assertRaises(ValueError):
+            self.database.iter_alerts(batch_size=0)
+
+    def test_bulk_updates_and_deletes_run_in_one_transaction(self) -> None:
+        """(FR4, FR5, NFR5) Test that bulk status changes and deletes by ids or filter commit once and report the alerts changed."""
+        self.database.create_many(
+            AlertCreation(f"sensor_{i % 2}", "F001", "Advisory" if i % 3 else "Critical", "m", f"00:00:{i:02d}") for i in range(30)
+        )
+        statements = []
+        self.database._con.set_trace_callback(statements.append)
+        with patch("Database.BULK_CHUNK", 4):
+            resolved = self.database.update_status_many(Status.RESOLVED, alert_ids=range(1, 13), severity="Advisory")
+        self.database._con.set_trace_callback(None)
+        self.assertEqual(sum(statement == "COMMIT" for statement in statements), 1)
+        self.assertEqual(resolved, [2, 3, 5, 6, 8, 9, 11, 12])
+        self.assertEqual(self.database.count(status=Status.RESOLVED), 8)
+
+        # Alerts that already have the status are not reported again.
+        self.assertEqual(self.database.update_status_many(Status.RESOLVED, [1, 2, 99]), [1])
+        self.assertEqual(self.database.update_status_many(Status.ACTIVE, sensor_id="sensor_0", end="00:00:05"), [1, 3, 5])
+
+        deleted = self.database.delete_many(severity="Advisory", status=Status.RESOLVED)
+        self.assertEqual(deleted, [2, 6, 8, 9, 11, 12])
+        self.assertEqual(self.database.count(), 24)
+        self.assertEqual(self.database.delete_many([1, 2, 30]), [1, 30])
+        self.assertEqual(self.database.delete_many([]), [])
+        self.assertIsNone(self.database.get(30))
+
+        with self.assertRaises(ValueError):
+            self.database.delete_many()
+        with self.assertRaises(ValueError):
+            self.database.update_status_many(Status.RESOLVED)
+        with self.assertRaises(ValueError):
+            self.database.delete_many(start="25:00:00")
+        self.assertEqual(self.database.count(), 22)
+
+    def test_query_filters_use_indexes(self) -> None:
+        """(NFR5) Test that status/severity, sensor and time filters are planned as index searches, not table scans."""
+        plans = {
+            "status": "SELECT alert_id FROM alerts WHERE status = 'Active' AND severity = 'Critical'",
+            "sensor": "SELECT alert_id FROM alerts WHERE sensor_code = 1",
+            "timestamp": "SELECT alert_id FROM alerts WHERE timestamp >= '12:00:00'",
+        }
+        for name, sql in plans.items():
+            with self.subTest(filter=name):
+                plan = " ".join(row[3] for row in self.database._con.execute(f"EXPLAIN QUERY PLAN {sql}"))
+                self.assertIn("USING COVERING INDEX", plan)
+
+    def test_reads_do_not_wait_for_a_write_transaction(self) -> None:
+        """(NFR5) Test that reads use read-only WAL connections that see committed alerts while a write is in progress."""
+        self.database.create(AlertCreation("ENG_OILTEMP", "F001", "Critical", "committed", "00:00:01"))
+        self.assertEqual(self.database._con.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+        with self.database._write_lock:
+            self.database._con.execute(
+                "INSERT INTO alerts(sensor_code, fault_code, severity, message, timestamp) VALUES (1, 'F002', 'Advisory', 'pending', '00:00:02')"
+            )
+            results = []
+            reader = threading.Thread(target=lambda: results.append(self.database.get_all()))
+            reader.start()
+            reader.join(timeout=5)
+            self.assertFalse(reader.is_alive())
+            self.assertEqual([a.message for a in results[0]], ["committed"])
+            self.database._con.rollback()
+
+        with self.database._reader() as con:
+            with self.assertRaises(sqlite3.OperationalError):
+                con.execute("DELETE FROM alerts")
+
+    def test_concurrent_writers_and_readers(self) -> None:
+        """(NFR5) Test that alerts created from several threads while others read are all stored once."""
+        def write(worker: int) -> list:
+            return [self.database.create_many([AlertCreation(f"sensor_{worker}", "F001", "Moderate", "m", "00:00:01")] * 5)
+                    for _ in range(10)]
+
+        def read(_: int) -> int:
+            return max(len(self.database.get_all()) for _ in range(20))
+
+        with ThreadPoolExecutor(8) as pool:
+            writes = [pool.submit(write, worker) for worker in range(4)]
+            reads = [pool.submit(read, worker) for worker in range(4)]
+            ids = [alert.alert_id for future in writes for batch in future.result() for alert in batch]
+            self.assertTrue(all(future.result() <= 200 for future in reads))
+
+        self.assertEqual(sorted(ids), list(range(1, 201)))
+        self.assertEqual([a.alert_id for a in self.database.get_all()], list(range(1, 201)))
+        self.assertLessEqual(len(self.database._reader_connections), self.database.readers)
+
+    def test_memory_database_reads_on_writer(self) -> None:
+        """(NFR5) Test that an in-memory database, which cannot use WAL, runs reads on its one connection."""
+        database = AlertDatabase(":memory:")
+        try:
+            self.assertEqual(database.readers, 0)
+            created = database.create(AlertCreation("ENG_OILTEMP", "F001", "Critical", "m", "00:00:01"))
+            self.assertEqual(database.get(created.alert_id), created)
+        finally:
+            database.close()
+
+    def test_sensor_ids_are_normalized(self) -> None:
+        """(FR2, NFR5) Test that alerts store a sensor code and share one sensors row per sensor_id."""
+        for i in range(3):
+            self.database.create(AlertCreation(
+                sensor_id="ENG_OILTEMP" if i < 2 else "ELEC_BUS",
+                fault_code="F001",
+                severity="Critical",
+                message="Test fault",
+                timestamp=f"00:00:0{i}",
+            ))
+
+        sensors = self.database._con.execute("SELECT sensor_code, sensor_id FROM sensors ORDER BY sensor_code").fetchall()
+        self.assertEqual([row["sensor_id"] for row in sensors], ["ENG_OILTEMP", "ELEC_BUS"])
+        codes = [row[0] for row in self.database._con.execute("SELECT sensor_code FROM alerts ORDER BY alert_id")]
+        self.assertEqual(codes, [sensors[0]["sensor_code"]] * 2 + [sensors[1]["sensor_code"]])
+        self.assertEqual([a.sensor_id for a in self.database.get_all()], ["ENG_OILTEMP", "ENG_OILTEMP", "ELEC_BUS"])
+
+    def test_text_sensor_id_table_is_migrated(self) -> None:
+        """(FR2) Test that a database created with sensor_id text columns is migrated with its alert ids kept."""
+        db_path = self.tmp_path / "old_alerts.db"
+        con = sqlite3.connect(db_path)
+        con.execute(
+            """
+            CREATE TABLE alerts (
+                alert_id INTEGER PRIMARY KEY AUTOINCREMENT, sensor_id TEXT NOT NULL, fault_code TEXT NOT NULL,
+                severity TEXT NOT NULL, message TEXT NOT NULL,
+                timestamp TEXT NOT NULL CHECK (timestamp GLOB '??:??:??'), status TEXT NOT NULL DEFAULT 'Active'
+            )
+            """
+        )
+        con.executemany(
+            "INSERT INTO alerts(alert_id, sensor_id, fault_code, severity, message, timestamp, status) VALUES (?,?,?,?,?,?,?)",
+            [(3, "ENG_OILTEMP", "F1", "Critical", "m", "00:00:01", "Resolved"), (7, "ELEC_BUS", "F2", "Moderate", "m", "00:00:02", "Active")],
+        )
+        con.commit()
+        con.close()
+
+        database = AlertDatabase(str(db_path))
+        try:
+            alerts = database.get_all()
+            self.assertEqual([(a.alert_id, a.sensor_id, a.status) for a in alerts],
+                             [(3, "ENG_OILTEMP", Status.RESOLVED), (7, "ELEC_BUS", Status.ACTIVE)])
+            created = database.create(AlertCreation("ELEC_BUS", "F2", "Moderate", "m", "00:00:03"))
+            self.assertGreater(created.alert_id, 7)
+            self.assertEqual(database.get(created.alert_id).sensor_id, "ELEC_BUS")
+        finally:
+            database.close()
@@ -1,8 +1,11 @@
 import sys, os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import json
+
 import pandas as pd
 
+from Abstractions import AlertCreation, FaultBatch, Severity, Status
 from FaultDetection import FaultDetection
 from Test_Base import TestBase
 
@@ -50,6 +53,356 @@ class TestFaultDetection(TestBase):
         # Verify that active faults are tracked
         self.assertEqual(len(self.fault_detection.get_active_faults()), 7)
     
+    def test_vectorized_batch_matches_row_path(self) -> None:
+        """(FR1, NFR5) Test that vectorized detection returns the same faults in the same order as the row path."""
+        df = pd.DataFrame([
+            {"timestamp": "00:00:01", "sensor_id": "ENG_OILTEMP", "sensor_type": "Temperature", "value": 230, "unit": "C"},
+            {"timestamp": "00:00:02", "sensor_id": "ENG_OILTEMP", "sensor_type": "Temperature", "value": 200, "unit": "C"},
+            {"timestamp": "00:00:03", "sensor_id": "ELEC_BUS", "sensor_type": "Voltage", "value": 18, "unit": "V"},
+            {"timestamp": "00:00:04", "sensor_id": "UNKNOWN", "sensor_type": "Voltage", "value": -5, "unit": "V"},
+            {"timestamp": "00:00:05", "sensor_id": "FUEL_FLOW", "sensor_type": "Flow Rate", "value": 50, "unit": "kg/h"},
+            {"timestamp": "00:00:06", "sensor_id": "ENG_OILTEMP", "sensor_type": "Temperature", "value": 221, "unit": "C"},
+        ])
+
+        row_faults = FaultDetection()
+        row_faults.load_rules("fault_rules.json")
+        expected = row_faults.detect_from_batch(df, vectorized=False)
+        self.assertIsInstance(expected, FaultBatch)
+
+        detected = self.fault_detection.detect_from_batch(df)
+        self.assertEqual(list(detected), list(expected))
+        self.assertEqual(detected.row_index.tolist(), expected.row_index.tolist())
+        self.assertEqual(list(detected.to_alert_creations()), list(expected.to_alert_creations()))
+        self.assertEqual(
+            [(f.timestamp, f.status) for f in detected],
+            [("00:00:01", Status.ACTIVE), ("00:00:02", Status.RESOLVED), ("00:00:03", Status.ACTIVE),
+             ("00:00:05", Status.ACTIVE), ("00:00:06", Status.ACTIVE)]
+        )
+
+    def test_rule_index_groups_rules_by_sensor(self) -> None:
+        """(FR1, NFR5) Test that load_rules indexes rules by sensor_id and records only see their own sensor's rules."""
+        rules = [
+            {"sensor_id": "ENG_OILTEMP", "condition": ">", "threshold": 220, "fault_code": "HOT", "severity": "Critical", "message": "Hot"},
+            {"sensor_id": "ELEC_BUS", "condition": "<", "threshold": 20, "fault_code": "LOW_V", "severity": "Moderate", "message": "Low"},
+            {"sensor_id": "ENG_OILTEMP", "condition": ">", "threshold": 210, "fault_code": "WARM", "severity": "Advisory", "message": "Warm"},
+        ]
+        rules_path = self.tmp_path / "rules.json"
+        rules_path.write_text(json.dumps(rules))
+
+        fault_detection = FaultDetection()
+        fault_detection.load_rules(str(rules_path))
+        self.assertEqual(sorted(fault_detection.rule_index), ["ELEC_BUS", "ENG_OILTEMP"])
+        self.assertEqual([r.fault_code for r in fault_detection.rule_index["ENG_OILTEMP"]], ["HOT", "WARM"])
+
+        single = FaultDetection()
+        single.load_rules(str(rules_path))
+        faults = single.detect_faults({"timestamp": "00:00:01", "sensor_id": "ENG_OILTEMP", "value": 230})
+        self.assertEqual([f.fault_id for f in faults], ["HOT", "WARM"])
+
+        df = pd.DataFrame([
+            {"timestamp": "00:00:01", "sensor_id": "ELEC_BUS", "sensor_type": "Voltage", "value": 5, "unit": "V"},
+            {"timestamp": "00:00:02", "sensor_id": "UNRULED", "sensor_type": "Voltage", "value": 5, "unit": "V"},
+            {"timestamp": "00:00:03", "sensor_id": "ENG_OILTEMP", "sensor_type": "Temperature", "value": 215, "unit": "C"},
+            {"timestamp": "00:00:04", "sensor_id": "ENG_OILTEMP", "sensor_type": "Temperature", "value": 225, "unit": "C"},
+        ])
+        detected = fault_detection.detect_from_batch(df)
+        self.assertEqual([(f.timestamp, f.fault_id) for f in detected],
+                         [("00:00:01", "LOW_V"), ("00:00:03", "WARM"), ("00:00:04", "HOT")])
+
+        row_path = FaultDetection()
+        row_path.load_rules(str(rules_path))
+        self.assertEqual(list(detected), list(row_path.detect_from_batch(df, vectorized=False)))
+
+    def test_band_rules_and_compiled_tables_match_rule_objects(self) -> None:
+        """(FR1, NFR5) Test that inside/outside band rules load and compiled tables agree with is_triggered()."""
+        rules = [
+            {"sensor_id": "S1", "condition": "outside", "min": 10, "max": 20, "fault_code": "OUT", "severity": "Critical", "message": "Out"},
+            {"sensor_id": "S1", "condition": ">", "threshold": 15, "fault_code": "GT15", "severity": "Moderate", "message": "Gt"},
+            {"sensor_id": "S1", "condition": "inside", "min": 12, "max": 14, "fault_code": "IN", "severity": "Advisory", "message": "In"},
+            {"sensor_id": "S1", "condition": "<", "threshold": 12, "fault_code": "LT12", "severity": "Moderate", "message": "Lt"},
+            {"sensor_id": "S1", "condition": "=", "threshold": 13, "fault_code": "EQ13", "severity": "Advisory", "message": "Eq"},
+            {"sensor_id": "S1", "condition": ">", "threshold": 5, "fault_code": "GT5", "severity": "Advisory", "message": "Gt"},
+            {"sensor_id": "S2", "condition": "<", "threshold": 12, "fault_code": "S2_LOW", "severity": "Critical", "message": "Lt"},
+        ]
+        rules_path = self.tmp_path / "rules.json"
+        rules_path.write_text(json.dumps(rules))
+
+        fault_detection = FaultDetection()
+        fault_detection.load_rules(str(rules_path))
+        self.assertEqual(len(fault_detection.detection_rules), len(rules))
+
+        values = [4, 5, 9.5, 10, 11, 12, 13, 14, 15, 15.5, 20, 21, float("nan")]
+        df = pd.DataFrame({
+            "timestamp": [f"00:00:{i:02d}" for i in range(2 * len(values))],
+            "sensor_id": ["S1", "S2"] * len(values),
+            "sensor_type": ["Pressure"] * (2 * len(values)),
+            "value": [v for v in values for _ in range(2)],
+            "unit": ["psi"] * (2 * len(values)),
+        })
+
+        # Raw classification by the compiled table matches evaluating every rule object.
+        table = fault_detection.compiled_rules.get("S1")
+        hit_rows, hit_rules = table.evaluate(values)
+        expected_hits = [(row, pos) for row, v in enumerate(values) for pos, rule in enumerate(table.rules) if rule.is_triggered(v)]
+        self.assertEqual(list(zip(hit_rows.tolist(), hit_rules.tolist())), expected_hits)
+        self.assertEqual([table.rules[p].fault_code for r, p in expected_hits if r == 6], ["IN", "EQ13", "GT5"])
+
+        row_path = FaultDetection()
+        row_path.load_rules(str(rules_path))
+        detected = fault_detection.detect_from_batch(df)
+        self.assertEqual(list(detected), list(row_path.detect_from_batch(df, vectorized=False)))
+
+    def test_band_rules_on_sensor_with_only_nan_values(self) -> None:
+        """(FR1, NFR4) Test that a sensor whose readings are all NaN raises no faults instead of failing band evaluation."""
+        rules_path = self.tmp_path / "rules.json"
+        rules_path.write_text(json.dumps([
+            {"sensor_id": "S1", "condition": "inside", "min": 10, "max": 20, "fault_code": "IN", "severity": "Advisory", "message": "In"},
+            {"sensor_id": "S1", "condition": "outside", "min": 0, "max": 30, "fault_code": "OUT", "severity": "Critical", "message": "Out"},
+        ]))
+        fault_detection = FaultDetection()
+        fault_detection.load_rules(str(rules_path))
+        rows, rules = fault_detection.compiled_rules.get("S1").evaluate([float("nan")] * 3)
+        self.assertEqual((rows.tolist(), rules.tolist()), ([], []))
+
+        df = pd.DataFrame({
+            "timestamp": ["00:00:01", "00:00:02"], "sensor_id": ["S1", "S1"], "sensor_type": ["Pressure"] * 2,
+            "value": [float("nan")] * 2, "unit": ["psi"] * 2,
+        })
+        self.assertEqual(len(fault_detection.detect_from_batch(df)), 0)
+        self.assertEqual(len(fault_detection.detect_from_batch(df, vectorized=False)), 0)
+
+    def test_band_rule_with_inverted_limits_raises(self) -> None:
+        """(NFR4) Test that a band rule with min greater than max is rejected."""
+        rules_path = self.tmp_path / "rules.json"
+        rules_path.write_text(json.dumps([
+            {"sensor_id": "S1", "condition": "inside", "min": 20, "max": 10, "fault_code": "BAD", "severity": "Advisory", "message": "Bad"},
+        ]))
+        with self.assertRaises(ValueError):
+            FaultDetection().load_rules(str(rules_path))
+
+    def test_detect_stream_matches_batch(self) -> None:
+        """(FR1, NFR5) Test that detect_stream yields per-chunk faults matching a single batch run."""
+        records = [
+            {"timestamp": f"00:00:{i:02d}", "sensor_id": sensor, "sensor_type": "x", "value": value, "unit": "u"}
+            for i, (sensor, value) in enumerate([
+                ("ENG_OILTEMP", 230), ("ELEC_BUS", 24), ("ELEC_BUS", 18),
+                ("FUEL_FLOW", 50), ("ENG_OILTEMP", 100), ("FUEL_QUANT", 400),
+            ])
+        ]
+        expected = FaultDetection()
+        expected.load_rules("fault_rules.json")
+        batch_faults = expected.detect_from_batch(pd.DataFrame(records))
+
+        chunks = [pd.DataFrame(records[:2]), records[2:5], pd.DataFrame(records[5:])]
+        streamed = list(self.fault_detection.detect_stream(iter(chunks)))
+
+        self.assertEqual([len(faults) for faults in streamed], [1, 3, 1])
+        self.assertEqual([f for faults in streamed for f in faults], list(batch_faults))
+
+    def test_fault_batch_is_columnar_and_lazy(self) -> None:
+        """(FR1, NFR5) Test that detect_from_batch returns a columnar FaultBatch usable for alert creation."""
+        df = pd.DataFrame([
+            {"timestamp": "00:00:01", "sensor_id": "ENG_OILTEMP", "sensor_type": "Temperature", "value": 230, "unit": "C"},
+            {"timestamp": "00:00:02", "sensor_id": "ENG_OILTEMP", "sensor_type": "Temperature", "value": 200, "unit": "C"},
+            {"timestamp": "00:00:03", "sensor_id": "ELEC_BUS", "sensor_type": "Voltage", "value": 18, "unit": "V"},
+            {"timestamp": "00:00:04", "sensor_id": "FUEL_FLOW", "sensor_type": "Flow Rate", "value": 50, "unit": "kg/h"},
+        ])
+        batch = self.fault_detection.detect_from_batch(df)
+
+        self.assertIsInstance(batch, FaultBatch)
+        self.assertEqual(batch.row_index.tolist(), [0, 1, 2, 3])
+        self.assertEqual(batch.timestamp.tolist(), ["00:00:01", "00:00:02", "00:00:03", "00:00:04"])
+        self.assertEqual(batch.resolved.tolist(), [False, True, False, False])
+        self.assertEqual(batch.severity.tolist(), [Severity.Critical.value] * 2 + [Severity.Moderate.value, Severity.Advisory.value])
+        self.assertEqual(batch.severity_counts(), {Severity.Advisory: 1, Severity.Moderate: 1, Severity.Critical: 2})
+
+        self.assertEqual(batch[1].status, Status.RESOLVED)
+        self.assertEqual(batch[2].fault_id, "VOLTAGE_LOW")
+        page = batch[2:]
+        self.assertIsInstance(page, FaultBatch)
+        self.assertEqual([f.fault_id for f in page], ["VOLTAGE_LOW", "LOW_FUEL_FLOW"])
+        self.assertEqual(len(batch.raised()), 3)
+
+        creations = list(batch.to_alert_creations())
+        self.assertEqual(creations[0], AlertCreation(
+            sensor_id="ENG_OILTEMP",
+            fault_code="ENGINE_OVERHEAT",
+            severity="Critical",
+            message="Engine oil temperature exceeds safe limit",
+            timestamp="00:00:01",
+        ))
+
+    def test_active_faults_only_report_transitions(self) -> None:
+        """(FR1, NFR5) Test that repeated triggers of an active fault are deduplicated and the table stays bounded."""
+        df = pd.DataFrame({
+            "timestamp": [f"00:00:{i:02d}" for i in range(50)],
+            "sensor_id": ["ENG_OILTEMP"] * 50,
+            "sensor_type": ["Temperature"] * 50,
+            "value": [230] * 20 + [200] * 10 + [240] * 20,
+            "unit": ["C"] * 50,
+        })
+        detected = self.fault_detection.detect_from_batch(df)
+
+        self.assertEqual([(f.timestamp, f.status) for f in detected],
+                         [("00:00:00", Status.ACTIVE), ("00:00:20", Status.RESOLVED), ("00:00:30", Status.ACTIVE)])
+        active = self.fault_detection.get_active_faults()
+        self.assertEqual(len(active), 1)
+        self.assertEqual(active[0].timestamp, "00:00:30")
+
+        # A later batch of the same still-active fault produces no new records.
+        self.assertEqual(len(self.fault_detection.detect_from_batch(df.iloc[40:])), 0)
+
+    def test_hysteresis_and_debounce(self) -> None:
+        """(FR1) Test that hysteresis holds a raised fault near the threshold and debounce needs consecutive samples."""
+        rules_path = self.tmp_path / "rules.json"
+        rules_path.write_text(json.dumps([
+            {"sensor_id": "S1", "condition": ">", "threshold": 100, "hysteresis": 10, "debounce": 2,
+             "fault_code": "HIGH", "severity": "Critical", "message": "High"},
+        ]))
+        values = [101, 95, 101, 102, 103, 95, 85, 101, 85, 85]
+        df = pd.DataFrame({
+            "timestamp": [f"00:00:{i:02d}" for i in range(len(values))],
+            "sensor_id": ["S1"] * len(values),
+            "sensor_type": ["Pressure"] * len(values),
+            "value": values,
+            "unit": ["psi"] * len(values),
+        })
+
+        vectorized = FaultDetection()
+        vectorized.load_rules(str(rules_path))
+        detected = list(vectorized.detect_from_batch(df))
+
+        # Raised on the second consecutive trigger; 95 and a single 85 sit inside the hysteresis/debounce margin.
+        self.assertEqual([(f.timestamp, f.status) for f in detected],
+                         [("00:00:03", Status.ACTIVE), ("00:00:09", Status.RESOLVED)])
+
+        row_path = FaultDetection()
+        row_path.load_rules(str(rules_path))
+        self.assertEqual(detected, [f for record in df.to_dict("records") for f in row_path.detect_faults(record)])
+        self.assertEqual(vectorized.get_active_faults(), [])
+
+    def test_temporal_rules(self) -> None:
+        """(FR1) Test rate-of-change, persistence and rolling-mean rules in batch, chunked and row-by-row detection."""
+        rules_path = self.tmp_path / "rules.json"
+        rules_path.write_text(json.dumps([
+            {"sensor_id": "T1", "condition": "rate", "threshold": 5,
+             "fault_code": "FAST_RISE", "severity": "Critical", "message": "Rising too fast"},
+            {"sensor_id": "P1", "condition": "persistence", "operator": "<", "threshold": 50, "samples": 3,
+             "fault_code": "LOW_PRESS", "severity": "Moderate", "message": "Low for 3 samples"},
+            {"sensor_id": "M1", "condition": "rolling_mean", "threshold": 10, "window": 3,
+             "fault_code": "HIGH_MEAN", "severity": "Advisory", "message": "3 s mean too high"},
+        ]))
+        series = {
+            "T1": [100, 102, 110, 111, 111, 100],
+            "P1": [49, 48, 60, 49, 48, 47, 46, 55],
+            "M1": [9, 12, 12, 6, 6, 6],
+        }
+        df = pd.DataFrame([
+            {"timestamp": f"00:00:{i:02d}", "sensor_id": sensor_id, "sensor_type": "Generic", "value": value, "unit": "u"}
+            for sensor_id, values in series.items() for i, value in enumerate(values)
+        ])
+
+        batch = FaultDetection()
+        batch.load_rules(str(rules_path))
+        detected = list(batch.detect_from_batch(df))
+
+        self.assertEqual([(f.sensor_id, f.timestamp, f.status) for f in detected], [
+            ("T1", "00:00:02", Status.ACTIVE), ("T1", "00:00:03", Status.RESOLVED),
+            ("P1", "00:00:05", Status.ACTIVE), ("P1", "00:00:07", Status.RESOLVED),
+            ("M1", "00:00:01", Status.ACTIVE), ("M1", "00:00:03", Status.RESOLVED),
+        ])
+
+        # Streamed chunks carry the windows over, and the row path uses the incremental update().
+        chunked = FaultDetection()
+        chunked.load_rules(str(rules_path))
+        streamed = [f for part in chunked.detect_stream(df.iloc[i:i + 4] for i in range(0, len(df), 4)) for f in part]
+        self.assertEqual(streamed, detected)
+
+        row_path = FaultDetection()
+        row_path.load_rules(str(rules_path))
+        self.assertEqual([f for record in df.to_dict("records") for f in row_path.detect_faults(record)], detected)
+
+    def test_temporal_rules_follow_file_order_across_midnight(self) -> None:
+        """(FR1) Test that each sensor's readings are processed in file order, with temporal windows continuing past midnight."""
+        rules_path = self.tmp_path / "rules.json"
+        rules_path.write_text(json.dumps([
+            {"sensor_id": "M1", "condition": "rolling_mean", "threshold": 10, "window": 3,
+             "fault_code": "HIGH_MEAN", "severity": "Advisory", "message": "3 s mean too high"},
+            {"sensor_id": "T1", "condition": "rate", "threshold": 5,
+             "fault_code": "FAST_RISE", "severity": "Critical", "message": "Rising too fast"},
+        ]))
+        df = pd.DataFrame({
+            "timestamp": ["23:59:58", "23:59:59", "23:59:59", "00:00:00", "00:00:01", "00:00:01"],
+            "sensor_id": ["M1", "T1", "M1", "M1", "T1", "M1"],
+            "sensor_type": "Generic",
+            "value": [20, 100, 20, 0, 120, 0],
+            "unit": "u",
+        })
+
+        # M1's 3 s mean is 20, 20, 13.3 and then 6.7 at 00:00:01, which clears it. T1 rises 20 units
+        # in the two seconds from 23:59:59 to 00:00:01.
+        expected = [("M1", "23:59:58", Status.ACTIVE), ("T1", "00:00:01", Status.ACTIVE), ("M1", "00:00:01", Status.RESOLVED)]
+        for vectorized in (True, False):
+            with self.subTest(vectorized=vectorized):
+                detector = FaultDetection()
+                detector.load_rules(str(rules_path))
+                detected = detector.detect_from_batch(df, vectorized=vectorized)
+                self.assertEqual([(f.sensor_id, f.timestamp, f.status) for f in detected], expected)
+
+        # Streaming in chunks split at midnight carries the windows over.
+        streamed = FaultDetection()
+        streamed.load_rules(str(rules_path))
+        faults = [(f.sensor_id, f.timestamp, f.status) for batch in streamed.detect_stream([df.iloc[:3], df.iloc[3:]]) for f in batch]
+        self.assertEqual(faults, expected)
+
+        # A reading earlier than the one before it (a restarted recording) starts a new window.
+        restarted = df.iloc[:0].assign(timestamp=["00:00:05", "00:00:06", "00:00:02"], sensor_id="M1", value=[20, 20, 0])
+        for vectorized in (True, False):
+            with self.subTest(restarted=True, vectorized=vectorized):
+                detector = FaultDetection()
+                detector.load_rules(str(rules_path))
+                detected = detector.detect_from_batch(restarted, vectorized=vectorized)
+                self.assertEqual([(f.timestamp, f.status) for f in detected], [("00:00:05", Status.ACTIVE), ("00:00:02", Status.RESOLVED)])
+
+    def test_temporal_rules_with_invalid_parameters_raise(self) -> None:
+        """Test that temporal rules reject a non-positive window, zero samples and an unknown operator."""
+        base = {"sensor_id": "S1", "threshold": 1, "fault_code": "F", "severity": "Critical", "message": "m"}
+        for rule in (dict(base, condition="rolling_mean", window=0),
+                     dict(base, condition="persistence", samples=0),
+                     dict(base, condition="rate", operator=">=")):
+            with self.subTest(rule=rule), self.assertRaises(ValueError):
+                FaultDetection._compile_rules([rule])
+
+    def test_rule_sets_are_cached_and_hot_reloaded(self) -> None:
+        """(FR1, NFR5) Test that unchanged rules files reuse the compiled rules and changed files are swapped in."""
+        rule = {"sensor_id": "S1", "condition": ">", "threshold": 10, "fault_code": "HIGH", "severity": "Critical", "message": "High"}
+        rules_path = self.tmp_path / "rules.json"
+        rules_path.write_text(json.dumps([rule]))
+
+        first, second = FaultDetection(), FaultDetection()
+        first.load_rules(str(rules_path))
+        second.load_rules(str(rules_path))
+        self.assertIs(first.compiled_rules, second.compiled_rules)
+
+        # Touching the file without changing its content keeps the compiled rules.
+        stat = rules_path.stat()
+        os.utime(rules_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertFalse(first.refresh_rules())
+
+        # A content change is picked up by refresh_rules() as a complete new rule set.
+        rules_path.write_text(json.dumps([rule, dict(rule, threshold=20, fault_code="VERY_HIGH")]))
+        os.utime(rules_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000))
+        self.assertTrue(first.refresh_rules())
+        self.assertEqual([r.fault_code for r in first.detection_rules], ["HIGH", "VERY_HIGH"])
+        self.assertEqual(len(second.detection_rules), 1)
+
+        # A broken file is rejected and the previous rules stay in use.
+        rules_path.write_text("[{")
+        os.utime(rules_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 3_000_000))
+        with self.assertRaises(ValueError):
+            first.refresh_rules()
+        self.assertEqual(len(first.detection_rules), 2)
+
     def test_detect_from_batch_no_faults(self) -> None:
         """(FR1) Test that detect_from_batch does not identify false positives."""
         normal_sensor_data = {"timestamp": "00:00:02", "sensor_id": "ENG_OILTEMP", "sensor_type": "Temperature", "value": 200, "unit": "C"}
@@ -0,0 +1,98 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+
+from IngestCache import IngestCache
+from SensorIntegration import SensorIntegration
+from Test_Base import TestBase
+
+def _sensor_frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "timestamp": [f"00:{i // 60 % 60:02d}:{i % 60:02d}" for i in range(rows)],
+        "sensor_id": ["A1", "A2", " ", "A3"] * (rows // 4),  # Every fourth row is dropped.
+        "sensor_type": ["temp"] * rows,
+        "value": np.arange(rows) * 1.5,
+        "unit": ["C"] * rows,
+    })
+
+def _is_memory_mapped(array: np.ndarray) -> bool:
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = getattr(array, "base", None)
+    return False
+
+class TestIngestCache(TestBase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache = IngestCache(self.tmp_path / "cache")
+        self.csv_path = self.write_csv(_sensor_frame(40), "sensors.csv")
+
+    def test_hit_skips_validation_and_cleaning(self) -> None:
+        """(NFR5) Test that a cached file loads the same frame without being validated or cleaned again."""
+        for profile in SensorIntegration.PROFILES:
+            with self.subTest(profile=profile):
+                expected = SensorIntegration(profile, cache=self.cache).read_csv(self.csv_path)
+
+                with patch.object(SensorIntegration, "_validate_data") as validate, \
+                     patch.object(SensorIntegration, "_clean_data") as clean:
+                    cached = SensorIntegration(profile, cache=self.cache).read_csv(self.csv_path)
+                    validate.assert_not_called()
+                    clean.assert_not_called()
+
+                # Numeric columns stay memory-mapped from the cache.
+                self.assertTrue(_is_memory_mapped(cached["value"].to_numpy()))
+                pd.testing.assert_frame_equal(cached.copy(), expected)
+
+    def test_hit_keeps_rejects_and_applies_error_budget(self) -> None:
+        """(FR3) Test that a cache hit reports the rows cleaning dropped and still fails a stricter error budget."""
+        frame = _sensor_frame(12)
+        frame.loc[3, "timestamp"] = "BAD"
+        frame.loc[5, "value"] = None
+        csv_path = self.write_csv(frame, "rejects.csv")
+
+        loose = SensorIntegration(cache=self.cache, max_rejects=5)
+        expected = loose.read_csv(csv_path)
+        cached = SensorIntegration(cache=self.cache, max_rejects=5)
+        pd.testing.assert_frame_equal(cached.read_csv(csv_path).copy(), expected)
+        self.assertEqual(cached.rejects.rows.tolist(), [2, 3, 5, 6, 10])
+        pd.testing.assert_frame_equal(cached.rejects.to_frame(), loose.rejects.to_frame())
+        self.assertEqual(cached.rejects.checked, 12)
+
+        # The entry was cleaned with a budget of 5; loads allowing fewer rejects fail as they would uncached.
+        for budget in ({}, {"max_rejects": 4}, {"max_reject_fraction": 0.4}):
+            with self.subTest(budget=budget), self.assertRaises(ValueError):
+                SensorIntegration(cache=self.cache, **budget).read_csv(csv_path)
+
+    def test_changed_file_is_reloaded(self) -> None:
+        """(FR3) Test that a changed CSV misses the cache, while a touched but identical one still hits."""
+        SensorIntegration(cache=self.cache).read_csv(self.csv_path)
+
+        stat = self.csv_path.stat()
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertIsNotNone(self.cache.load(self.csv_path, "default"))
+
+        self.write_csv(_sensor_frame(80), "sensors.csv")
+        self.assertIsNone(self.cache.load(self.csv_path, "default"))
+        self.assertEqual(len(SensorIntegration(cache=self.cache).read_csv(self.csv_path)), 60)
+
+    def test_least_recently_used_entries_are_evicted(self) -> None:
+        """(NFR5) Test that the cache is trimmed to its size cap, least recently used entry first."""
+        paths = [self.write_csv(_sensor_frame(400), f"file_{i}.csv") for i in range(3)]
+        loader = SensorIntegration(cache=self.cache)
+        loader.read_csv(paths[0])
+        loader.read_csv(paths[1])
+        entry_size = max(self.cache.entry_sizes().values())
+
+        # Room for two entries: using file_0 again makes file_1 the one evicted for file_2.
+        self.cache.max_bytes = int(entry_size * 2.5)
+        self.assertIsNotNone(self.cache.load(paths[0], "default"))
+        loader.read_csv(paths[2])
+
+        self.assertIsNotNone(self.cache.load(paths[0], "default"))
+        self.assertIsNone(self.cache.load(paths[1], "default"))
+        self.assertIsNotNone(self.cache.load(paths[2], "default"))
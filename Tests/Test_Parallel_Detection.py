@@ -0,0 +1,91 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+
+from FaultDetection import FaultDetection
+from ParallelDetection import ParallelDetection
+from Test_Base import TestBase
+
+def _sample_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Readings spread around the fault_rules.json thresholds so faults raise and clear."""
+    rng = np.random.default_rng(seed)
+    sensors = np.array(["ENG_OILTEMP", "ENG_OILPRESS", "CABIN_PRESS", "ELEC_BUS", "APU_EGT"], dtype=object)
+    centres = np.array([220.0, 1000.0, 9000.0, 22.0, 450.0])
+    picks = rng.integers(0, len(sensors), size=rows)
+    seconds = np.arange(rows)
+    return pd.DataFrame({
+        "timestamp": [f"{s // 3600:02d}:{s % 3600 // 60:02d}:{s % 60:02d}" for s in seconds.tolist()],
+        "sensor_id": sensors[picks],
+        "sensor_type": "Generic",
+        "value": np.round(rng.normal(centres[picks], centres[picks] * 0.1), 1),
+        "unit": "u",
+    })
+
+class TestParallelDetection(TestBase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.df = _sample_frame(2000)
+
+    def _detector(self) -> FaultDetection:
+        fault_detection = FaultDetection()
+        fault_detection.load_rules("fault_rules.json")
+        return fault_detection
+
+    def _parallel(self, workers: int) -> ParallelDetection:
+        parallel = ParallelDetection(self._detector(), workers=workers)
+        self.addCleanup(parallel.close)
+        return parallel
+
+    def test_sharded_detection_matches_serial(self) -> None:
+        """(FR1, NFR5) Test that consecutive batches return the same faults, in order, as serial detection."""
+        serial = self._detector()
+        parallel = self._parallel(3)
+        # Later batches depend on the active faults and temporal history the workers kept.
+        for start in range(0, len(self.df), 500):
+            batch = self.df.iloc[start:start + 500].reset_index(drop=True)
+            with self.subTest(start=start):
+                expected = serial.detect_from_batch(batch)
+                result = parallel.detect_from_batch(batch)
+
+                np.testing.assert_array_equal(result.row_index, expected.row_index)
+                np.testing.assert_array_equal(result.rule_index, expected.rule_index)
+                np.testing.assert_array_equal(result.resolved, expected.resolved)
+                np.testing.assert_array_equal(result.timestamp, expected.timestamp)
+                self.assertEqual(
+                    sorted((f.sensor_id, f.fault_id, f.timestamp) for f in parallel.get_active_faults()),
+                    sorted((f.sensor_id, f.fault_id, f.timestamp) for f in serial.get_active_faults())
+                )
+        self.assertGreater(len(serial.get_active_faults()), 0)
+
+    def test_sensors_stay_on_one_worker(self) -> None:
+        """(NFR5) Test that every sensor is owned by one worker and the rows are spread over all of them."""
+        parallel = self._parallel(2)
+        parallel.detect_from_batch(self.df)
+        owner = dict(parallel._owner)
+        parallel.detect_from_batch(self.df)
+
+        self.assertEqual(parallel._owner, owner)
+        self.assertEqual(set(owner.values()), {0, 1})
+        # Sensors without rules are never sent to a worker.
+        self.assertEqual(parallel._load.sum(), 2 * self.df["sensor_id"].isin(list(owner)).sum())
+
+    def test_detect_files_keeps_input_order(self) -> None:
+        """(FR1) Test that each file is detected independently and returned in input order."""
+        frames = [_sample_frame(300, seed) for seed in range(3)]
+        paths = [self.write_csv(frame, f"part_{i}.csv") for i, frame in enumerate(frames)]
+
+        batches = self._parallel(2).detect_files(paths)
+
+        self.assertEqual(len(batches), 3)
+        for frame, batch in zip(frames, batches):
+            expected = self._detector().detect_from_batch(frame)
+            np.testing.assert_array_equal(batch.row_index, expected.row_index)
+            np.testing.assert_array_equal(batch.rule_index, expected.rule_index)
+
+    def test_invalid_arguments_raise(self) -> None:
+        """Test that worker counts below one are rejected."""
+        with self.assertRaises(ValueError):
+            ParallelDetection(self._detector(), workers=0)
@@ -0,0 +1,82 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+
+import ReadingStore as reading_store_module
+from ReadingStore import ReadingStore
+from SensorIntegration import SensorIntegration
+from Test_Base import TestBase
+
+class TestReadingStore(TestBase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.db_path = str(self.tmp_path / "readings.db")
+        self.store = ReadingStore(self.db_path)
+        self.readings = SensorIntegration().read_csv(self.write_csv(pd.DataFrame({
+            "timestamp": ["00:00:05", "00:00:01", "00:00:03", "00:01:00", "00:00:02", "00:00:04"],
+            "sensor_id": ["ENG_OILTEMP", "ENG_OILTEMP", "ENG_OILTEMP", "ENG_OILTEMP", "ELEC_BUS", "ENG_OILTEMP"],
+            "sensor_type": ["Temperature", "Temperature", "Temperature", "Temperature", "Voltage", "Temperature"],
+            "value": [105.0, 101.0, 103.0, 160.0, 24.0, 104.0],
+            "unit": ["C", "C", "C", "C", "V", "C"],
+        })))
+
+    def tearDown(self) -> None:
+        try:
+            self.store.close()
+        finally:
+            super().tearDown()
+
+    def test_range_returns_sensor_readings_in_time_order(self) -> None:
+        """(FR3, NFR5) Test that a range query returns only the sensor's readings in the window, sorted by time."""
+        self.assertEqual(self.store.append(self.readings), 6)
+
+        window = self.store.range("ENG_OILTEMP", "00:00:02", 4)
+        self.assertEqual(window["timestamp"].tolist(), ["00:00:03", "00:00:04"])
+        self.assertEqual(window["value"].tolist(), [103.0, 104.0])
+        self.assertEqual(window["unit"].tolist(), ["C", "C"])
+        self.assertEqual(window["value"].dtype, np.float32)
+
+        around = self.store.around("ENG_OILTEMP", "00:00:02", window=3)
+        self.assertEqual(around["seconds"].tolist(), [1, 3, 4, 5])
+        self.assertTrue(self.store.range("FUEL_FLOW", 0, 100).empty)
+        with self.assertRaises(ValueError):
+            self.store.range("ENG_OILTEMP", "24:00:00", 5)
+
+    def test_appends_span_blocks_and_persist(self) -> None:
+        """(NFR5) Test that readings split over many blocks and appends are all found again after reopening."""
+        with patch.object(reading_store_module, "BLOCK_READINGS", 2):
+            self.store.append(self.readings)
+            later = self.readings[self.readings["sensor_id"] == "ENG_OILTEMP"].assign(value=np.float32(0))
+            self.store.append(later)
+        self.assertEqual(self.store._con.execute("SELECT COUNT(*) FROM blocks").fetchone()[0], 7)
+
+        self.store.close()
+        self.store = ReadingStore(self.db_path)
+        readings = self.store.range("ENG_OILTEMP", "00:00:00", "23:59:59")
+        self.assertEqual(readings["seconds"].tolist(), [1, 1, 3, 3, 4, 4, 5, 5, 60, 60])
+        # Readings at the same time keep the order they were appended in.
+        self.assertEqual(readings["value"].tolist()[:2], [101.0, 0.0])
+        self.assertEqual(self.store.range("ELEC_BUS", 0, 10)["value"].tolist(), [24.0])
+
+    def test_recordings_keep_uploads_apart(self) -> None:
+        """(FR3) Test that the same readings stored by two uploads are kept apart by recording and linked to their alerts."""
+        first, second = self.store.start_recording("first.csv"), self.store.start_recording("second.csv")
+        self.store.append(self.readings, first)
+        self.store.append(self.readings, second)
+        self.store.link_alerts([1, 2], first)
+        self.store.link_alerts([3], second)
+
+        self.assertEqual(len(self.store.around("ELEC_BUS", "00:00:02")), 2)
+        self.assertEqual(self.store.around("ELEC_BUS", "00:00:02", recording_id=self.store.recording_of(3))["value"].tolist(), [24.0])
+        self.assertEqual(self.store.range("ENG_OILTEMP", 0, 10, recording_id=first)["seconds"].tolist(), [1, 3, 4, 5])
+        self.assertEqual(self.store.recording_of(2), first)
+        self.assertIsNone(self.store.recording_of(4))
+
+        # Appending without a recording stores the readings as a new one of their own.
+        self.store.append(self.readings)
+        self.assertEqual(len(self.store.range("ENG_OILTEMP", 0, 10, recording_id=second)), 4)
+        self.assertEqual(len(self.store.range("ENG_OILTEMP", 0, 10)), 12)
@@ -2,10 +2,15 @@ import sys, os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from unittest.mock import patch
+import threading
+import time
+import numpy as np
 import pandas as pd
 
 from Test_Base import TestBase
-from SensorIntegration import SensorIntegration
+from SensorIntegration import RejectReason, SensorIntegration
+from FaultDetection import FaultDetection
+from Timestamps import HOUR_MINUTE_SECOND, timestamp_seconds
 
 class TestSensorIntegration(TestBase):
 
@@ -95,6 +100,27 @@ class TestSensorIntegration(TestBase):
                 self.sensor_integration.read_csv(csv_path)
             self.assertTrue(mock_log.error.called)
 
+    def test_timestamps_validated_and_converted_to_seconds(self) -> None:
+        """(FR3) Test that timestamps are validated like the HH:MM:SS pattern and converted to int32 seconds of day."""
+        samples = ["00:00:00", "23:59:59", "12:34:56", "24:00:00", "12:60:00", "12:00:60",
+                   "1:00:00", "12:00:000", "12-00-00", "", "ab:cd:ef", "12:00:0"]
+        seconds = timestamp_seconds(samples)
+
+        self.assertEqual(seconds.dtype, np.int32)
+        self.assertEqual(seconds[:3].tolist(), [0, 86_399, 45_296])
+        self.assertEqual([bool(s >= 0) for s in seconds], [bool(HOUR_MINUTE_SECOND.match(t)) for t in samples])
+
+        csv_path = self.write_csv(pd.DataFrame({
+            "timestamp": ["00:00:05", "01:00:00"],
+            "sensor_id": ["A1", "A2"],
+            "sensor_type": ["temp", "temp"],
+            "value": [1, 2],
+            "unit": ["C", "C"],
+        }))
+        df = self.sensor_integration.read_csv(csv_path)
+        self.assertEqual(df["seconds"].dtype, np.int32)
+        self.assertEqual(df["seconds"].tolist(), [5, 3600])
+
     def test_rows_missing_required_fields_dropped(self) -> None:
         """(FR3) Test that rows with missing required fields are dropped during cleaning."""
         raw_data = pd.DataFrame({
@@ -114,6 +140,36 @@ class TestSensorIntegration(TestBase):
         self.assertEqual(len(cleaned_data), 1)
         self.assertEqual(cleaned_data.iloc[0]["sensor_id"], "A1")
 
+    def test_read_csv_chunks_cleans_each_chunk(self) -> None:
+        """(FR3, NFR5) Test that read_csv_chunks yields cleaned chunks covering the whole file."""
+        raw_data = pd.DataFrame({
+            "timestamp": [f"00:00:{i:02d}" for i in range(7)],
+            "sensor_id": ["A1", "A2", " ", "A4", "A5", "A6", "A7"],  # Third row invalid
+            "sensor_type": ["temp"] * 7,
+            "value": ["10", "20", "30", "not_a_number", "50", "60", "70"],  # Fourth row invalid
+            "unit": ["C"] * 7,
+        })
+        csv_path = self.write_csv(raw_data, "chunked.csv")
+
+        chunks = list(self.sensor_integration.read_csv_chunks(csv_path, chunk_size=3))
+
+        self.assertEqual([len(c) for c in chunks], [2, 2, 1])
+        combined = pd.concat(chunks)
+        self.assertEqual(combined["sensor_id"].tolist(), ["A1", "A2", "A5", "A6", "A7"])
+        self.assertTrue(pd.api.types.is_numeric_dtype(combined["value"]))
+
+        # Streaming does not keep the data around.
+        with self.assertRaises(ValueError):
+            self.sensor_integration.get_sensor_data()
+
+    def test_read_csv_chunks_validates_header_before_parsing(self) -> None:
+        """(FR3, NFR3) Test that read_csv_chunks rejects a bad header before yielding any rows."""
+        csv_path = self.write_csv(pd.DataFrame({"timestamp": ["00:00:00"], "sensor_id": ["A1"]}), "bad_header.csv")
+        with patch("SensorIntegration.logging") as mock_log:
+            with self.assertRaises(ValueError):
+                next(self.sensor_integration.read_csv_chunks(csv_path))
+            self.assertTrue(mock_log.error.called)
+
     def test_read_csv_performance(self):
         """(FR8, NFR5) Ensure CSV reading and cleaning completes within 5 seconds."""
         import time
@@ -135,6 +191,230 @@ class TestSensorIntegration(TestBase):
         self.assertLess(elapsed, 5, f"CSV load took {elapsed:.2f}s, exceeding 5s limit.")
         self.assertEqual(len(df), rows)
 
+    def test_typed_profile_matches_default_cleaning(self) -> None:
+        """(FR3, NFR5) Test that the typed profile keeps the same rows as the default one with compact dtypes."""
+        raw_data = pd.DataFrame({
+            "timestamp": ["00:00:00", "01:00:00", "02:00:00", "03:00:00", "04:00:00"],
+            "sensor_id": ["A1", " A2 ", " ", "A1", "NA"],
+            "sensor_type": ["temp", "temp ", "temp", "temp", "temp"],
+            "value": ["10", "20.5", "30", "not_a_number", "50"],
+            "unit": ["C", "C", "C", "C", "C"],
+        })
+        csv_path = self.write_csv(raw_data, "dirty.csv")
+
+        default = SensorIntegration().read_csv(csv_path)
+        typed = SensorIntegration("typed").read_csv(csv_path)
+
+        self.assertEqual(typed["sensor_id"].tolist(), default["sensor_id"].tolist())
+        self.assertEqual(typed["sensor_type"].tolist(), default["sensor_type"].tolist())
+        self.assertEqual(typed["value"].tolist(), default["value"].tolist())
+        self.assertEqual(typed["seconds"].tolist(), default["seconds"].tolist())
+        for col in ["timestamp", "sensor_id", "sensor_type", "unit"]:
+            self.assertIsInstance(typed[col].dtype, pd.CategoricalDtype)
+        self.assertEqual(typed["value"].dtype, np.float32)
+
+        chunks = list(SensorIntegration("typed").read_csv_chunks(csv_path, chunk_size=2))
+        self.assertEqual(pd.concat([c["sensor_id"].astype(str) for c in chunks]).tolist(), default["sensor_id"].tolist())
+
+    def test_reject_report_lists_dropped_rows(self) -> None:
+        """(FR3, NFR3) Test that every profile reports each dropped row with its file row number and reason."""
+        raw_data = pd.DataFrame({
+            "timestamp": ["00:00:00", "", "02:00:00", "03:00:00", "25:00:00", "05:00:00", "06:00:00"],
+            "sensor_id": ["A1", "A2", " ", "A4", "A5", "A6", "A7"],
+            "sensor_type": ["temp"] * 7,
+            "value": ["10", "20", "30", "not_a_number", "50", "", "70"],
+            "unit": ["C"] * 7,
+        })
+        csv_path = self.write_csv(raw_data, "dirty.csv")
+        expected = [(1, RejectReason.MISSING_TIMESTAMP), (2, RejectReason.MISSING_SENSOR_ID), (3, RejectReason.NON_NUMERIC_VALUE),
+                    (4, RejectReason.INVALID_TIMESTAMP), (5, RejectReason.MISSING_VALUE)]
+
+        for profile in SensorIntegration.PROFILES:
+            with self.subTest(profile=profile):
+                sensor_integration = SensorIntegration(profile, max_rejects=5)
+                df = sensor_integration.read_csv(csv_path)
+                self.assertEqual(df["sensor_id"].astype(str).tolist(), ["A1", "A7"])
+                rejects = sensor_integration.rejects
+                self.assertEqual(list(zip(rejects.rows.tolist(), rejects.reasons.tolist())), expected)
+                self.assertEqual(rejects.checked, 7)
+                self.assertEqual(rejects.counts()[RejectReason.INVALID_TIMESTAMP], 1)
+                self.assertEqual(rejects.to_frame()["reason"].tolist()[0], "MISSING_TIMESTAMP")
+
+                chunked = SensorIntegration(profile, max_rejects=5)
+                self.assertEqual(sum(len(c) for c in chunked.read_csv_chunks(csv_path, chunk_size=3)), 2)
+                self.assertEqual(chunked.rejects.rows.tolist(), [row for row, _ in expected])
+
+    def test_error_budget_limits_rejected_rows(self) -> None:
+        """(FR3, NFR3) Test that a load fails once more rows are rejected than the error budget allows."""
+        raw_data = pd.DataFrame({
+            "timestamp": ["00:00:00", "bad", "02:00:00", "03:00:00"],
+            "sensor_id": ["A1", "A2", "A3", "A4"],
+            "sensor_type": ["temp"] * 4,
+            "value": ["10", "20", "not_a_number", "40"],
+            "unit": ["C"] * 4,
+        })
+        csv_path = self.write_csv(raw_data, "budget.csv")
+
+        self.assertEqual(len(SensorIntegration(max_rejects=2).read_csv(csv_path)), 2)
+        self.assertEqual(len(SensorIntegration("typed", max_reject_fraction=0.5).read_csv(csv_path)), 2)
+        self.assertEqual(len(SensorIntegration(max_rejects=2, max_reject_fraction=1).read_csv(csv_path)), 2)
+        with patch("SensorIntegration.logging") as mock_log:
+            for budget in [{"max_rejects": 1}, {"max_reject_fraction": 0.25}, {"max_rejects": 1, "max_reject_fraction": 1.0}]:
+                with self.subTest(budget=budget), self.assertRaises(ValueError):
+                    SensorIntegration(**budget).read_csv(csv_path)
+            self.assertTrue(mock_log.error.called)
+        for budget in [{"max_rejects": -1}, {"max_rejects": True}, {"max_rejects": 1.0},
+                       {"max_reject_fraction": -0.1}, {"max_reject_fraction": 1.5}, {"max_reject_fraction": True}]:
+            with self.subTest(budget=budget), self.assertRaises(ValueError):
+                SensorIntegration(**budget)
+
+    def test_reject_fraction_applies_to_the_whole_chunked_file(self) -> None:
+        """(FR3, NFR3) Test that read_csv_chunks checks max_reject_fraction over the whole file, not each chunk."""
+        raw_data = pd.DataFrame({
+            "timestamp": ["bad", "bad"] + [f"00:00:0{i}" for i in range(8)],
+            "sensor_id": [f"A{i}" for i in range(10)],
+            "sensor_type": ["temp"] * 10,
+            "value": [10] * 10,
+            "unit": ["C"] * 10,
+        })
+        csv_path = self.write_csv(raw_data, "dirty_start.csv")
+
+        # The first chunk is all rejects, but 2 of 10 rows is within 20 %.
+        chunks = list(SensorIntegration(max_reject_fraction=0.2).read_csv_chunks(csv_path, chunk_size=2))
+        self.assertEqual(sum(len(c) for c in chunks), 8)
+
+        # Over the fraction the load fails once the whole file has been read.
+        strict = SensorIntegration(max_reject_fraction=0.1).read_csv_chunks(csv_path, chunk_size=2)
+        with patch("SensorIntegration.logging"), self.assertRaises(ValueError):
+            for _ in strict:
+                pass
+        # A count is exceeded as soon as a chunk rejects too many rows.
+        with patch("SensorIntegration.logging"), self.assertRaises(ValueError):
+            next(SensorIntegration(max_rejects=1).read_csv_chunks(csv_path, chunk_size=2))
+
+    def test_unknown_profile_raises(self) -> None:
+        """Test that an unknown ingest profile is rejected."""
+        with self.assertRaises(ValueError):
+            SensorIntegration("fast")
+
+    def test_read_many_merges_directory_sorted_by_time(self) -> None:
+        """(FR3, NFR5) Test that read_many loads every CSV of a folder into one frame sorted by timestamp."""
+        folder = self.tmp_path / "recordings"
+        folder.mkdir()
+        for name, times in [("b.csv", ["00:00:02", "00:00:04"]), ("a.csv", ["00:00:01", "00:00:04"])]:
+            pd.DataFrame({
+                "timestamp": times,
+                "sensor_id": [name[0].upper()] * 2,
+                "sensor_type": ["temp"] * 2,
+                "value": [1, 2],
+                "unit": ["C"] * 2,
+            }).to_csv(folder / name, index=False)
+        (folder / "notes.txt").write_text("not sensor data")
+
+        for pool in ("thread", "process"):
+            with self.subTest(pool=pool):
+                report = SensorIntegration().read_many(folder, workers=2, pool=pool)
+
+                self.assertEqual([os.path.basename(p) for p in report.loaded], ["a.csv", "b.csv"])
+                self.assertEqual(report.errors, {})
+                self.assertEqual(report.data["seconds"].tolist(), [1, 2, 4, 4])
+                # Ties keep the input order of the files.
+                self.assertEqual(report.data["sensor_id"].tolist(), ["A", "B", "A", "B"])
+                self.assertEqual([os.path.basename(s) for s in report.data["source"]], ["a.csv", "b.csv", "a.csv", "b.csv"])
+
+    def test_read_many_reports_failed_files(self) -> None:
+        """(FR3, NFR3) Test that a file that fails validation is reported without stopping the others loading."""
+        good = self.write_csv(pd.DataFrame({
+            "timestamp": ["00:00:00"],
+            "sensor_id": ["A1"],
+            "sensor_type": ["temp"],
+            "value": [10],
+            "unit": ["C"],
+        }), "good.csv")
+        bad = self.write_csv(pd.DataFrame({"timestamp": ["00:00:00"], "sensor_id": ["A1"]}), "bad.csv")
+        missing = self.tmp_path / "missing.csv"
+
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                sensor_integration = SensorIntegration("typed")
+                with patch("SensorIntegration.logging"):
+                    report = sensor_integration.read_many([good, bad, missing], workers=workers, pool="thread")
+
+                self.assertEqual(report.loaded, [str(good)])
+                self.assertEqual(set(report.errors), {str(bad), str(missing)})
+                self.assertEqual(report.data["sensor_id"].tolist(), ["A1"])
+                self.assertIs(sensor_integration.get_sensor_data(), report.data)
+
+    def test_follow_csv_parses_only_complete_appended_lines(self) -> None:
+        """(FR3, NFR5) Test that follow_csv yields newly appended complete rows and holds back a partial last line."""
+        csv_path = self.tmp_path / "live.csv"
+        csv_path.write_bytes(b"timestamp,sensor_id,sensor_type,value,unit\n00:00:01,A1,temp,1,C\n00:00:02,A2,te")
+        batches = self.sensor_integration.follow_csv(csv_path, poll_interval=0.01, idle_timeout=0.2)
+
+        self.assertEqual(next(batches)["sensor_id"].tolist(), ["A1"])
+
+        with open(csv_path, "ab") as f:
+            f.write(b"mp,2,C\n00:00:03,A3,temp,3,C\n")
+        batch = next(batches)
+        self.assertEqual(batch["sensor_id"].tolist(), ["A2", "A3"])
+        self.assertEqual(batch["seconds"].tolist(), [2, 3])
+
+        # A truncated file is followed again from its header.
+        csv_path.write_bytes(b"timestamp,sensor_id,sensor_type,value,unit\n00:00:04,A4,temp,4,C\n")
+        self.assertEqual(next(batches)["sensor_id"].tolist(), ["A4"])
+
+        # Following ends once no data arrives for idle_timeout seconds.
+        self.assertEqual(list(batches), [])
+
+    def test_follow_csv_from_end_skips_existing_rows(self) -> None:
+        """(FR3, NFR5) Test that follow_csv(from_start=False) skips existing rows larger than one read and numbers later rows after them."""
+        csv_path = self.tmp_path / "live.csv"
+        existing = "".join(f"00:00:{i % 60:02d},OLD{i},temp,{i},C\n" for i in range(200))
+        csv_path.write_text("timestamp,sensor_id,sensor_type,value,unit\n" + existing + "00:01:00,PAR")
+        self.sensor_integration.FOLLOW_READ_BYTES = 256
+        self.assertGreater(len(existing), 4 * self.sensor_integration.FOLLOW_READ_BYTES)
+
+        def append() -> None:
+            with open(csv_path, "ab") as f:
+                f.write(b"TIAL,temp,1,C\n00:01:01,,temp,2,C\n00:01:02,NEW,temp,3,C\n")
+
+        # Rows are appended once following has started; the partial line at the end was not complete then, so it is new.
+        appender = threading.Timer(0.2, append)
+        appender.start()
+        batches = list(self.sensor_integration.follow_csv(csv_path, poll_interval=0.01, from_start=False, idle_timeout=1))
+        appender.join()
+        self.assertEqual([b["sensor_id"].tolist() for b in batches], [["PARTIAL", "NEW"]])
+        self.assertEqual(self.sensor_integration.rejects.rows.tolist(), [201])
+
+    def test_follow_csv_faults_detected_within_a_second(self) -> None:
+        """(FR1, NFR5) Test that a faulty reading appended to a followed CSV is detected within a second."""
+        csv_path = self.tmp_path / "live.csv"
+        csv_path.write_text("timestamp,sensor_id,sensor_type,value,unit\n00:00:01,ENG_OILTEMP,Temperature,100,C\n")
+        fault_detection = FaultDetection()
+        fault_detection.load_rules(os.path.join(os.path.dirname(__file__), "..", "fault_rules.json"))
+        stop = threading.Event()
+        written = []
+
+        def append_fault() -> None:
+            time.sleep(0.2)
+            written.append(time.monotonic())
+            with open(csv_path, "a") as f:
+                f.write("00:00:02,ENG_OILTEMP,Temperature,230,C\n")
+
+        writer = threading.Thread(target=append_fault)
+        writer.start()
+        try:
+            for faults in fault_detection.detect_stream(self.sensor_integration.follow_csv(csv_path, poll_interval=0.05, stop=stop, idle_timeout=5)):
+                if len(faults):
+                    latency = time.monotonic() - written[0]
+                    break
+        finally:
+            stop.set()
+            writer.join()
+
+        self.assertEqual(faults[0].sensor_id, "ENG_OILTEMP")
+        self.assertLess(latency, 1.0)
+
     def test_module_is_independently_instantiable(self) -> None:
         """(NFR4) Test that SensorIntegration can be instantiated independently."""
         self.assertIsInstance(self.sensor_integration, SensorIntegration)
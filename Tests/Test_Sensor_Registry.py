@@ -0,0 +1,73 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+
+from FaultDetection import FaultDetection
+from SensorIntegration import SensorIntegration
+from SensorRegistry import SensorRegistry
+from Test_Base import TestBase
+
+class TestSensorRegistry(TestBase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.registry = SensorRegistry()
+
+    def test_codes_are_stable_across_columns(self) -> None:
+        """(NFR5) Test that a value keeps the code it was first given, whatever column it appears in."""
+        first = self.registry.encode("sensor_id", ["ENG_OILTEMP", "ELEC_BUS", "ENG_OILTEMP", None])
+        second = self.registry.encode("sensor_id", pd.Series(["FUEL_FLOW", "ELEC_BUS"], dtype="category"))
+
+        self.assertEqual(first.dtype, np.int32)
+        self.assertEqual(first.tolist(), [0, 1, 0, -1])
+        self.assertEqual(second.tolist(), [2, 1])
+        self.assertEqual(self.registry.decode("sensor_id", np.array([2, -1, 0])).tolist(), ["FUEL_FLOW", None, "ENG_OILTEMP"])
+        # Each field has its own codes.
+        self.assertEqual(self.registry.encode("unit", ["C"]).tolist(), [0])
+        self.assertEqual(len(self.registry), 3)
+
+    def test_ingested_frames_share_registry_codes(self) -> None:
+        """(FR3, NFR5) Test that both ingest profiles encode sensor columns with the same registry codes in every file."""
+        paths = [
+            self.write_csv(pd.DataFrame({
+                "timestamp": ["00:00:01", "00:00:02"],
+                "sensor_id": sensors,
+                "sensor_type": ["Temperature", "Voltage"],
+                "value": [230, 18],
+                "unit": ["C", "V"],
+            }), name)
+            for name, sensors in [("a.csv", ["ENG_OILTEMP", "ELEC_BUS"]), ("b.csv", ["ELEC_BUS", "ENG_OILTEMP"])]
+        ]
+
+        for profile in SensorIntegration.PROFILES:
+            with self.subTest(profile=profile):
+                sensor_integration = SensorIntegration(profile, registry=self.registry)
+                frames = [sensor_integration.read_csv(path) for path in paths]
+                for df in frames:
+                    for field in SensorRegistry.FIELDS:
+                        self.assertIsInstance(df[field].dtype, pd.CategoricalDtype)
+                        np.testing.assert_array_equal(df[field].cat.codes.to_numpy(), self.registry.encode(field, df[field].astype(str)))
+                self.assertEqual(frames[0]["sensor_id"].cat.codes.tolist(), frames[1]["sensor_id"].cat.codes.tolist()[::-1])
+
+                merged = sensor_integration.read_many(paths, workers=1)
+                self.assertEqual(merged.data["sensor_id"].tolist(), ["ENG_OILTEMP", "ELEC_BUS", "ELEC_BUS", "ENG_OILTEMP"])
+                self.assertIsInstance(merged.data["sensor_id"].dtype, pd.CategoricalDtype)
+
+    def test_encoded_frames_detect_like_text_frames(self) -> None:
+        """(FR1) Test that detection on dictionary-encoded sensor ids matches detection on plain strings."""
+        text = pd.DataFrame({
+            "timestamp": [f"00:00:{i:02d}" for i in range(6)],
+            "sensor_id": ["ENG_OILTEMP", "UNKNOWN", "ELEC_BUS", "ENG_OILTEMP", "ELEC_BUS", "FUEL_FLOW"],
+            "sensor_type": ["x"] * 6,
+            "value": [230.0, 1.0, 18.0, 100.0, 24.0, 50.0],
+            "unit": ["u"] * 6,
+        })
+        detected = []
+        for df in [text, self.registry.encode_frame(text)]:
+            fault_detection = FaultDetection()
+            fault_detection.load_rules("fault_rules.json")
+            detected.append(list(fault_detection.detect_from_batch(df)))
+        self.assertEqual(detected[1], detected[0])
+        self.assertEqual(len(detected[0]), 5)
@@ -0,0 +1,138 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import time
+from unittest.mock import patch
+
+from FaultDetection import FaultDetection
+from TelemetryServer import TelemetryServer, format_line_protocol, parse_record, send_records
+from Test_Base import TestBase
+
+def _readings(count: int) -> list[str]:
+    """CSV records alternating between a normal and an overheating engine oil temperature."""
+    return [f"00:{i // 60 % 60:02d}:{i % 60:02d},ENG_OILTEMP,Temperature,{230 if i % 2 else 100},C" for i in range(count)]
+
+class TestTelemetryServer(TestBase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.fault_detection = FaultDetection()
+        self.fault_detection.load_rules("fault_rules.json")
+        self.detected = []
+
+    def _server(self, **kwargs) -> TelemetryServer:
+        return TelemetryServer(self.fault_detection, on_faults=lambda faults, _: self.detected.extend(faults), **kwargs)
+
+    def _run(self, coroutine) -> None:
+        asyncio.run(asyncio.wait_for(coroutine, timeout=30))
+
+    def test_parse_record_formats(self) -> None:
+        """(FR3) Test that CSV and line protocol records parse to the same fields and malformed ones are rejected."""
+        expected = ("00:00:02", "FUEL_FLOW", "Flow Rate", "50.0", "kg/h")
+        self.assertEqual(parse_record("00:00:02,FUEL_FLOW,Flow Rate,50.0,kg/h"), expected)
+        self.assertEqual(parse_record(format_line_protocol("00:00:02", "FUEL_FLOW", "Flow Rate", 50.0, "kg/h")), expected)
+        for line in ["00:00:02,FUEL_FLOW,50.0", "25:00:00,FUEL_FLOW,Flow,50,kg/h", "Flow sensor_id=A value=1", "Flow,unit=C value=1 00:00:01"]:
+            with self.subTest(line=line):
+                self.assertIsNone(parse_record(line))
+
+    def test_tcp_records_are_batched_and_detected(self) -> None:
+        """(FR1, FR3) Test that records sent over TCP in both formats are cleaned, batched and run through detection."""
+        lines = ["timestamp,sensor_id,sensor_type,value,unit", "00:00:01,ENG_OILTEMP,Temperature,230,C",
+                 format_line_protocol("00:00:02", "ELEC_BUS", "Voltage", 18, "V"),
+                 "00:00:03,ELEC_BUS,Voltage,not_a_number,V", "garbage"]
+
+        async def scenario() -> None:
+            server = self._server(udp_port=None, batch_size=2, batch_interval=0.05)
+            await server.start()
+            await send_records("127.0.0.1", server.tcp_port, lines)
+            await asyncio.sleep(0.2)
+            await server.stop()
+
+            self.assertEqual(server.stats.received, 3)
+            self.assertEqual(server.stats.rejected, 2)
+            self.assertEqual(server.stats.batches, 2)
+            self.assertEqual(server.stats.dropped, 0)
+
+        self._run(scenario())
+        self.assertEqual([(f.sensor_id, f.fault_id) for f in self.detected], [("ENG_OILTEMP", "ENGINE_OVERHEAT"), ("ELEC_BUS", "VOLTAGE_LOW")])
+
+    def test_tcp_backpressure_loses_nothing(self) -> None:
+        """(NFR5) Test that a TCP sender is held back by a full queue instead of records being dropped."""
+        lines = _readings(2000)
+
+        async def scenario() -> None:
+            server = self._server(udp_port=None, batch_size=50, queue_size=20)
+            await server.start()
+            await send_records("127.0.0.1", server.tcp_port, lines, lines_per_send=500)
+            await server.stop(drain_timeout=20)
+
+            self.assertEqual(server.stats.received, len(lines))
+            self.assertEqual(server.stats.dropped, 0)
+            self.assertEqual(server.stats.rejected, 0)
+            # Every other reading raises or clears the overheat fault.
+            self.assertEqual(server.stats.faults, len(lines) - 1)
+
+        self._run(scenario())
+
+    def test_udp_overflow_is_counted_as_dropped(self) -> None:
+        """(NFR5) Test that UDP records arriving while the queue is full are dropped and counted."""
+        lines = _readings(400)
+        original = TelemetryServer._detect
+
+        def slow_detect(server, records):
+            time.sleep(0.05)
+            return original(server, records)
+
+        async def scenario() -> None:
+            server = self._server(tcp_port=None, batch_size=10, queue_size=20)
+            await server.start()
+            with patch.object(TelemetryServer, "_detect", slow_detect):
+                await send_records("127.0.0.1", server.udp_port, lines, transport="udp", lines_per_send=10)
+                await asyncio.sleep(0.2)
+                await server.stop()
+
+            self.assertGreater(server.stats.dropped, 0)
+            self.assertEqual(server.stats.received + server.stats.dropped, len(lines))
+
+        self._run(scenario())
+
+    def test_failing_batch_does_not_stop_ingestion(self) -> None:
+        """(NFR5) Test that a batch whose on_faults callback raises is counted as failed and later batches still run."""
+        calls = []
+
+        def on_faults(faults, _) -> None:
+            calls.append(len(faults))
+            if len(calls) == 1:
+                raise RuntimeError("database is locked")
+            self.detected.extend(faults)
+
+        async def scenario() -> None:
+            server = TelemetryServer(self.fault_detection, udp_port=None, batch_size=10, queue_size=5, on_faults=on_faults)
+            await server.start()
+            await send_records("127.0.0.1", server.tcp_port, _readings(100), lines_per_send=20)
+            await server.stop(drain_timeout=20)
+
+            self.assertEqual(server.stats.received, 100)
+            self.assertEqual(server.stats.failed, 1)
+            # Every batch has faults, so each one reached on_faults; only the first failed.
+            self.assertEqual(server.stats.batches + server.stats.failed, len(calls))
+
+        self._run(scenario())
+        self.assertGreater(len(calls), 1)
+        self.assertEqual(len(self.detected), sum(calls[1:]))
+
+    def test_invalid_csv_header_closes_connection(self) -> None:
+        """(FR3, NFR3) Test that a TCP stream with a header missing required columns is rejected."""
+        async def scenario() -> None:
+            server = self._server(udp_port=None)
+            await server.start()
+            await send_records("127.0.0.1", server.tcp_port, ["timestamp,sensor_id,value", *_readings(2)])
+            await asyncio.sleep(0.1)
+            await server.stop()
+
+            self.assertEqual(server.stats.received, 0)
+            self.assertEqual(server.stats.rejected, 1)
+
+        with patch("SensorIntegration.logging"):
+            self._run(scenario())
@@ -6,6 +6,9 @@ from unittest.mock import patch, MagicMock
 import tkinter as tk
 
 from Test_Base import TestBase
+from Abstractions import Status
+from FaultDetection import FaultDetection
+from SensorIntegration import SensorIntegration
 from UserInterface import UserInterface
 from Database import AlertDatabase
 from AlertModule import AlertModule
@@ -145,6 +148,106 @@ class TestUserInterface(TestBase):
             self.assertEqual(u[3].lower(), d.severity.lower())
             self.assertEqual(u[6].lower(), d.status.name.lower())
 
+    def test_uploads_do_not_share_fault_state(self) -> None:
+        """(FR1, FR2) Test that each upload raises its own alerts while batches of one follow session share fault state."""
+        readings = SensorIntegration().read_csv(os.path.join(os.path.dirname(__file__), "..", "sensor_data_test.csv"))
+        first = self.ui.raise_alerts(readings)
+        self.assertGreater(first, 0)
+        self.assertEqual(self.ui.raise_alerts(readings), first)
+
+        # Within one session, faults still active from the previous batch are not raised again.
+        session = FaultDetection()
+        self.assertEqual(self.ui.raise_alerts(readings, fault_detection=session), first)
+        self.assertLess(self.ui.raise_alerts(readings, fault_detection=session), first)
+
+    def test_pages_show_newest_alerts_first(self) -> None:
+        """(FR4, FR7) Test that after an upload the first page shows the new alerts, and Next Page continues to older ones."""
+        self.ui.ALERT_PAGE_SIZE = 2
+        for second in range(3):
+            self.alert_module.create_alert("A1", "OLD", "Critical", "Old fault", f"12:00:0{second}")
+        newest = self.alert_module.create_alert("A2", "NEW", "Moderate", "New fault", "13:00:00")
+
+        with patch.object(self.ui, "display_alerts") as mock_display:
+            self.ui.show_all_alerts()
+            self.assertEqual([row[0] for row in mock_display.call_args[0][0]], [newest.alert_id, newest.alert_id - 1])
+            self.ui.show_next_page()
+            self.assertEqual([row[0] for row in mock_display.call_args[0][0]], [newest.alert_id - 2, newest.alert_id - 3])
+            self.assertIsNone(self.ui.next_cursor)
+
+    def select_alert_rows(self, alerts: list) -> list[str]:
+        """Show alerts as table rows in a stand-in table, select them all and return their row ids."""
+        rows = {f"I{i}": list(self.ui.alert_row(alert)) for i, alert in enumerate(alerts)}
+
+        def item(row_id, option=None, **changes):
+            if changes:
+                rows[row_id] = list(changes["values"])
+                return None
+            return tuple(rows[row_id]) if option == "values" else {"values": tuple(rows[row_id])}
+
+        self.ui.table.item.side_effect = item
+        self.ui.table.selection.return_value = tuple(rows)
+        self.ui.table.get_children.return_value = list(rows)
+        self.ui.all_alerts = [tuple(values) for values in rows.values()]
+        self.rows = rows
+        return list(rows)
+
+    @patch("UserInterface.messagebox.showinfo")
+    def test_selected_actions_resolve_reactivate_and_delete(self, mock_info) -> None:
+        """(FR5, FR6, NFR1) Test that the Selected actions change every selected alert in the table and the database."""
+        alerts = [self.alert_module.create_alert(f"S{i}", "TEST", "Critical", "Test fault", f"12:00:0{i}") for i in range(3)]
+        row_ids = self.select_alert_rows(alerts)
+
+        self.ui.resolve_selected_alerts()
+        self.assertTrue(all(a.status == Status.RESOLVED for a in self.alert_module.get_all_alerts()))
+        self.assertEqual([self.rows[r][6] for r in row_ids], ["Resolved"] * 3)
+        mock_info.assert_called_with("Alerts Resolved", "3 alert(s) marked as resolved.")
+
+        self.ui.table.selection.return_value = tuple(row_ids[:2])
+        self.ui.reactivate_selected_alerts()
+        self.assertEqual([a.status for a in self.alert_module.get_all_alerts()], [Status.ACTIVE, Status.ACTIVE, Status.RESOLVED])
+        self.assertEqual([self.rows[r][6] for r in row_ids], ["Active", "Active", "Resolved"])
+        self.assertEqual([a[6] for a in self.ui.all_alerts], ["Active", "Active", "Resolved"])
+        mock_info.assert_called_with("Alerts Reactivated", "2 alert(s) reactivated.")
+
+        with patch("UserInterface.messagebox.askyesno", return_value=True):
+            self.ui.delete_selected_alerts()
+        self.ui.table.delete.assert_called_once_with(*row_ids[:2])
+        self.assertEqual([a.alert_id for a in self.alert_module.get_all_alerts()], [alerts[2].alert_id])
+        self.assertEqual([a[0] for a in self.ui.all_alerts], [alerts[2].alert_id])
+
+    @patch("UserInterface.messagebox.showinfo")
+    def test_matching_actions_apply_to_every_alert_of_the_filter(self, mock_info) -> None:
+        """(FR5, FR6, FR7) Test that the All Matching actions change every alert of the current filter, beyond the shown page."""
+        self.ui.ALERT_PAGE_SIZE = 2
+        for i in range(5):
+            self.alert_module.create_alert(f"S{i}", "TEST", "Critical", "Hot", f"12:00:0{i}")
+        advisory = self.alert_module.create_alert("S9", "TEST", "Advisory", "Warm", "12:01:00")
+
+        # With no filter shown the actions would touch every alert, so they are refused.
+        self.ui.show_all_alerts()
+        self.ui.resolve_matching_alerts()
+        self.ui.delete_matching_alerts()
+        self.assertEqual(mock_info.call_args_list[-1][0][0], "No Filter")
+        self.assertTrue(all(a.status == Status.ACTIVE for a in self.alert_module.get_all_alerts()))
+
+        self.ui.show_critical_alerts()
+        self.ui.resolve_matching_alerts()
+        mock_info.assert_called_with("Alerts Resolved", "5 alert(s) marked as resolved.")
+        self.assertEqual(
+            {a.severity: a.status for a in self.alert_module.get_all_alerts()},
+            {"Critical": Status.RESOLVED, "Advisory": Status.ACTIVE}
+        )
+
+        self.ui.show_resolved_alerts()
+        with patch("UserInterface.messagebox.askyesno", return_value=False):
+            self.ui.delete_matching_alerts()
+        self.assertEqual(len(self.alert_module.get_all_alerts()), 6)
+        with patch("UserInterface.messagebox.askyesno", return_value=True):
+            self.ui.delete_matching_alerts()
+        mock_info.assert_called_with("Alerts Deleted", "5 alert(s) deleted.")
+        self.assertEqual([a.alert_id for a in self.alert_module.get_all_alerts()], [advisory.alert_id])
+        self.assertEqual(self.ui.all_alerts, [])
+
     def test_module_is_independently_instantiable(self) -> None:
         """(NFR4) Verify UserInterface can be instantiated independently."""
         self.assertIsInstance(self.ui, UserInterface)
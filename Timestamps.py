@@ -0,0 +1,59 @@
+import re
+from functools import lru_cache
+from typing import Any, Iterable
+
+import numpy as np
+
+# Valid 24-hour HH:MM:SS timestamp (00:00:00 to 23:59:59).
+HOUR_MINUTE_SECOND = re.compile(r"^(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d$")
+
+SECONDS_PER_DAY = 86_400
+
+# Timestamps converted per block, bounding the fixed-width copy made of each block.
+PARSE_BLOCK_ROWS = 1_000_000
+
+_DIGITS = [0, 1, 3, 4, 6, 7]
+_COLON = ord(":")
+_ZERO = ord("0")
+
+def timestamp_seconds(timestamps: Iterable[Any]) -> np.ndarray:
+    """
+    Validate HH:MM:SS timestamps and convert them to seconds of the day in one vectorized pass.
+
+    The timestamps are copied into a fixed-width character array and every position is checked
+    with array comparisons, applying the same rule as HOUR_MINUTE_SECOND without a per-row
+    regex match.
+
+    Args:
+        timestamps: timestamp strings (other values are converted with str()).
+
+    Returns:
+        np.ndarray: int32 seconds of the day per timestamp, -1 where it is not valid HH:MM:SS.
+    """
+    strings = np.asarray(timestamps if isinstance(timestamps, np.ndarray) else list(timestamps), dtype=object)
+    seconds = np.full(len(strings), -1, dtype=np.int32)
+    for start in range(0, len(strings), PARSE_BLOCK_ROWS):
+        block = strings[start:start + PARSE_BLOCK_ROWS]
+        # A ninth character, when present, marks a string that is too long.
+        chars = np.array(block, dtype="U9").view(np.uint32).reshape(len(block), 9).astype(np.int32)
+
+        digits = chars[:, _DIGITS] - _ZERO
+        valid = ((digits >= 0) & (digits <= 9)).all(axis=1)
+        valid &= (chars[:, 2] == _COLON) & (chars[:, 5] == _COLON) & (chars[:, 8] == 0)
+
+        hours = digits[:, 0] * 10 + digits[:, 1]
+        minutes = digits[:, 2] * 10 + digits[:, 3]
+        secs = digits[:, 4] * 10 + digits[:, 5]
+        valid &= (hours < 24) & (minutes < 60) & (secs < 60)
+
+        seconds[start:start + len(block)] = np.where(valid, hours * 3600 + minutes * 60 + secs, -1)
+    return seconds
+
+@lru_cache(maxsize=1)
+def day_timestamps() -> np.ndarray:
+    """Every HH:MM:SS timestamp of a day, indexed by its seconds of the day."""
+    seconds = np.arange(SECONDS_PER_DAY)
+    timestamps = [f"{h:02d}:{m:02d}:{s:02d}" for h, m, s in zip((seconds // 3600).tolist(), (seconds % 3600 // 60).tolist(), (seconds % 60).tolist())]
+    array = np.array(timestamps, dtype=object)
+    array.flags.writeable = False
+    return array
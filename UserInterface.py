@@ -1,27 +1,48 @@
 import os
+import queue
+import threading
 import tkinter as tk
 import logging
-import re
+import numpy as np
 
 from tkinter import ttk, filedialog, messagebox
 from PIL import Image, ImageTk
+from Abstractions import Alert, Status
 from FaultDetection import FaultDetection
 from SensorIntegration import SensorIntegration
+from Timestamps import timestamp_seconds
 
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-hour_minute_second = re.compile(r"^(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d$")
-
 class UserInterface():
     """Tkinter based user interface for the HeMoSys Aircraft Health Monitoring System."""
 
-    def __init__(self, root: tk.Tk, alert_module = None) -> None:
+    # How often followed CSV batches are checked for, in milliseconds.
+    FOLLOW_POLL_MS = 250
+
+    # Seconds of stored readings shown either side of an alert.
+    READING_WINDOW_S = 30
+
+    # Alerts shown per page of a severity or status filter.
+    ALERT_PAGE_SIZE = 1000
+
+    # Pages list the newest alerts first, so the alerts an upload raises are on the first page.
+    ALERT_PAGE_DESCENDING = True
+
+    def __init__(self, root: tk.Tk, alert_module = None, reading_store = None) -> None:
         """Initialise the main application window and grid layout."""
         self.root = root
         self.alert_module = alert_module
-        self.fault_detection = FaultDetection()
+        self.reading_store = reading_store
+        self.alert_filter: dict = {}
+        self.next_cursor: tuple | None = None
+        # Detector and stored recording of the followed CSV, which carry over from batch to batch.
+        self.follow_detection: FaultDetection | None = None
+        self.follow_recording: int | None = None
         self.sensor_integration = SensorIntegration()
+        self.follow_stop: threading.Event | None = None
+        self.follow_queue: queue.Queue = queue.Queue()
         self.root.title("HeMoSys - Aircraft Health Monitoring System")
         self.root.state('zoomed')
         self.root.configure(bg="white")
@@ -59,7 +80,14 @@ class UserInterface():
             "Critical Alerts": self.show_critical_alerts,
             "Moderate Alerts": self.show_moderate_alerts,
             "Advisory Alerts": self.show_advisory_alerts,
-            "Resolved Alerts": self.show_resolved_alerts
+            "Resolved Alerts": self.show_resolved_alerts,
+            "Next Page": self.show_next_page,
+            "Export CSV": self.export_alerts,
+            "Resolve Selected": self.resolve_selected_alerts,
+            "Reactivate Selected": self.reactivate_selected_alerts,
+            "Delete Selected": self.delete_selected_alerts,
+            "Resolve All Matching": self.resolve_matching_alerts,
+            "Delete All Matching": self.delete_matching_alerts
         }
 
         for text, command in button_actions.items():
@@ -98,6 +126,25 @@ class UserInterface():
             command=self.upload_csv
         ).pack(pady=10)
 
+        tk.Button(
+            upload_box,
+            text="Select Folder",
+            font=("Arial", 10),
+            bg="#f7fbff",
+            activebackground="#d0eaff",
+            command=self.upload_folder
+        ).pack(pady=(0, 10))
+
+        self.follow_button = tk.Button(
+            upload_box,
+            text="Follow Live CSV",
+            font=("Arial", 10),
+            bg="#f7fbff",
+            activebackground="#d0eaff",
+            command=self.toggle_follow
+        )
+        self.follow_button.pack(pady=(0, 10))
+
     def upload_csv(self) -> None:
         """Handle CSV file selection and basic validation for file type."""
         file_path = filedialog.askopenfilename(
@@ -118,44 +165,161 @@ class UserInterface():
         try:
             # Load CSV into a pandas DataFrame.
             df = self.sensor_integration.read_csv(file_path)
+            created = self.raise_alerts(df, file_path)
+            logging.info(f"Raised {created} alert(s) from {file_path}")
+            messagebox.showinfo("Success", f"Processed and raised {created} alert(s) from {file_path}")
 
-            # Detect faults in the DataFrame.
-            rules_path = os.path.join(os.path.dirname(__file__), "fault_rules.json")
-            self.fault_detection.load_rules(rules_path)
-
-            faults = self.fault_detection.detect_from_batch(df)
-
-            # Create alerts from each fault.
-            for fault in faults:
-                self.alert_module.create_alert (
-                    sensor_id=fault.sensor_id,
-                    fault_code=fault.fault_id,
-                    severity=fault.severity.name,
-                    message=fault.description,
-                    timestamp=fault.timestamp
-                )
-                
-            # Reload the table with the latest alerts.
-            self.all_alerts = [
-                (
-                    alert.alert_id,
-                    alert.sensor_id,
-                    alert.fault_code,
-                    alert.severity,
-                    alert.message,
-                    alert.timestamp,
-                    "Active",
-                    "✅    ❌"
-                )
-                for alert in self.alert_module.get_all_alerts()
-            ]
+        except Exception as e:
+            messagebox.showerror("Processing Error", f"An error occurred while processing the file:\n{e}")
 
-            self.display_alerts(self.all_alerts)
-            logging.info(f"Raised {len(faults)} alert(s) from {file_path}")
-            messagebox.showinfo("Success", f"Processed and raised {len(faults)} alert(s) from {file_path}")
+    def upload_folder(self) -> None:
+        """Handle selection of a folder and load every CSV file in it as one recording."""
+        folder = filedialog.askdirectory(title="Select Folder of Sensor Data CSVs")
+        if not folder:
+            return
+
+        try:
+            report = self.sensor_integration.read_many(folder)
+            if not report.loaded and not report.errors:
+                messagebox.showerror("No Files", f"No CSV files were found in {folder}")
+                return
+
+            created = self.raise_alerts(report.data, folder)
+            logging.info(f"Raised {created} alert(s) from {len(report.loaded)} file(s) in {folder}")
+
+            summary = f"Processed {len(report.loaded)} file(s) and raised {created} alert(s) from {folder}"
+            if report.errors:
+                failed = "\n".join(f"{os.path.basename(path)}: {error}" for path, error in report.errors.items())
+                messagebox.showwarning("Some Files Failed", f"{summary}\n\n{len(report.errors)} file(s) could not be loaded:\n{failed}")
+            else:
+                messagebox.showinfo("Success", summary)
 
         except Exception as e:
-            messagebox.showerror("Processing Error", f"An error occurred while processing the file:\n{e}")
+            messagebox.showerror("Processing Error", f"An error occurred while processing the folder:\n{e}")
+
+    def toggle_follow(self) -> None:
+        """Start following a CSV that is still being written, raising alerts as rows are appended, or stop following it."""
+        if self.follow_stop is not None:
+            self.follow_stop.set()
+            return
+
+        file_path = filedialog.askopenfilename(
+            title="Select Sensor Data CSV to Follow",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not file_path:
+            return
+
+        # The file is tailed in a background thread; detection and alerts stay on the Tk thread.
+        self.follow_detection = FaultDetection()
+        self.follow_recording = self.reading_store.start_recording(file_path) if self.reading_store is not None else None
+        self.follow_stop = threading.Event()
+        self.follow_queue = queue.Queue()
+        threading.Thread(
+            target=self._follow_worker,
+            args=(file_path, self.follow_stop, self.follow_queue),
+            daemon=True
+        ).start()
+        self.follow_button.config(text="Stop Following")
+        logging.info(f"Following {file_path}")
+        self.root.after(self.FOLLOW_POLL_MS, self.drain_follow_queue)
+
+    def _follow_worker(self, file_path: str, stop: threading.Event, batches: queue.Queue) -> None:
+        """Put each batch of rows appended to file_path on the queue, then None once following ends."""
+        try:
+            for batch in SensorIntegration(self.sensor_integration.profile).follow_csv(file_path, stop=stop):
+                batches.put(batch)
+        except Exception as e:
+            batches.put(e)
+        finally:
+            batches.put(None)
+
+    def drain_follow_queue(self) -> None:
+        """Raise alerts for the batches read from the followed CSV since the last check."""
+        finished = False
+        while True:
+            try:
+                item = self.follow_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                finished = True
+            elif isinstance(item, Exception):
+                messagebox.showerror("Processing Error", f"An error occurred while following the file:\n{item}")
+            else:
+                try:
+                    created = self.raise_alerts(item, fault_detection=self.follow_detection, recording_id=self.follow_recording)
+                    if created:
+                        logging.info(f"Raised {created} alert(s) from {len(item)} new reading(s)")
+                except Exception as e:
+                    self.follow_stop.set()
+                    messagebox.showerror("Processing Error", f"An error occurred while processing new readings:\n{e}")
+
+        if finished:
+            self.follow_stop = None
+            self.follow_detection = None
+            self.follow_recording = None
+            self.follow_button.config(text="Follow Live CSV")
+        else:
+            self.root.after(self.FOLLOW_POLL_MS, self.drain_follow_queue)
+
+    def raise_alerts(self, df, source: str = "", fault_detection: FaultDetection | None = None,
+                     recording_id: int | None = None) -> int:
+        """
+        Detect faults in cleaned sensor data, raise alerts for them and refresh the table.
+
+        Each upload is an independent recording: it is checked by a fresh FaultDetection, so
+        faults still active at the end of one file don't hold back alerts in the next, and its
+        readings are stored as a new recording that its alerts are linked to. Batches of one
+        session (a followed CSV) pass that session's detector and recording instead.
+
+        Args:
+            df: cleaned sensor readings.
+            source: file or folder the readings came from, stored with a new recording.
+            fault_detection: detector carrying fault state between the batches of a session.
+            recording_id: stored recording of the session the batch belongs to.
+
+        Returns:
+            int: the number of alerts raised.
+        """
+        # Keep the readings so the ones around each alert can be shown later.
+        if self.reading_store is not None:
+            if recording_id is None:
+                recording_id = self.reading_store.start_recording(source)
+            self.reading_store.append(df, recording_id)
+
+        # Detect faults in the DataFrame. The compiled rules are cached and only rebuilt if the file changed.
+        rules_path = os.path.join(os.path.dirname(__file__), "fault_rules.json")
+        fault_detection = fault_detection if fault_detection is not None else FaultDetection()
+        fault_detection.load_rules(rules_path)
+
+        faults = fault_detection.detect_from_batch(df)
+
+        # Create alerts straight from the columnar fault batch (raised faults only).
+        created = self.alert_module.create_alerts(faults.to_alert_creations())
+        if not created:
+            return 0
+        if self.reading_store is not None:
+            self.reading_store.link_alerts((alert.alert_id for alert in created), recording_id)
+
+        # Reload the table with the first page of the current filter.
+        self.load_alert_page()
+        return len(created)
+
+    @staticmethod
+    def alert_row(alert: Alert) -> tuple:
+        """Table row of an alert."""
+        resolved = alert.status == Status.RESOLVED
+        return (
+            alert.alert_id,
+            alert.sensor_id,
+            alert.fault_code,
+            alert.severity,
+            alert.message,
+            alert.timestamp,
+            alert.status.value,
+            "☑    ❌" if resolved else "✅    ❌"
+        )
 
     def create_alert_table(self, parent: tk.Widget) -> None:
         """Create the main table showing active alerts."""
@@ -179,7 +343,8 @@ class UserInterface():
         style.map("Treeview", background=[("selected", "#a7c7e7")])
 
         columns = ("Alert ID", "Sensor ID", "Fault Code", "Severity", "Message", "Timestamp", "Status", "Actions")
-        self.table = ttk.Treeview(frame, columns=columns, show="headings", height=10)  
+        # Ctrl- and Shift-click select several rows for the "... Selected" actions.
+        self.table = ttk.Treeview(frame, columns=columns, show="headings", height=10, selectmode="extended")
 
         for col in columns:
             self.table.heading(col, text=col)
@@ -207,19 +372,9 @@ class UserInterface():
 
         # Load alerts dynamically from the backend.
         if self.alert_module:
-            self.all_alerts = [
-                (
-                    alert.alert_id,
-                    alert.sensor_id,
-                    alert.fault_code,
-                    alert.severity,
-                    alert.message,
-                    alert.timestamp,
-                    "Active",
-                    "✅    ❌"
-                )
-                for alert in self.alert_module.get_all_alerts()
-            ]
+            page = self.alert_module.query_alerts(descending=self.ALERT_PAGE_DESCENDING, limit=self.ALERT_PAGE_SIZE)
+            self.next_cursor = page.next_cursor
+            self.all_alerts = [self.alert_row(alert) for alert in page.alerts]
         else:
         # Fallback to show placeholder demo data.
             self.all_alerts = [
@@ -237,6 +392,7 @@ class UserInterface():
         self.table.grid(row=0, column=0, sticky="nsew")
         scrollbar.grid(row=0, column=1, sticky="ns")
         self.table.bind("<Button-1>", self.on_table_click)
+        self.table.bind("<Double-1>", self.show_readings)
 
     def display_alerts(self, alerts: list[tuple]) -> None:
         """Populate the alert table with data."""
@@ -259,27 +415,75 @@ class UserInterface():
 
     def show_all_alerts(self) -> None:
         """Display all alerts."""
-        self.display_alerts(self.all_alerts)
+        if self.alert_module:
+            self.show_filtered_alerts()
+        else:
+            self.display_alerts(self.all_alerts)
 
     def show_critical_alerts(self) -> None:
         """Display only critical alerts."""
-        critical_alerts = [a for a in self.all_alerts if a[3].lower() == "critical"]
-        self.display_alerts(critical_alerts)
+        self.show_filtered_alerts(severity="Critical")
 
     def show_moderate_alerts(self) -> None:
         """Display only moderate alerts."""
-        moderate_alerts = [a for a in self.all_alerts if a[3].lower() == "moderate"]
-        self.display_alerts(moderate_alerts)
+        self.show_filtered_alerts(severity="Moderate")
 
     def show_advisory_alerts(self) -> None:
         """Display only advisory alerts."""
-        advisory_alerts = [a for a in self.all_alerts if a[3].lower() == "advisory"]
-        self.display_alerts(advisory_alerts)
+        self.show_filtered_alerts(severity="Advisory")
 
     def show_resolved_alerts(self) -> None:
         """Display only resolved alerts."""
-        resolved_alerts = [a for a in self.all_alerts if a[6].lower() == "resolved"]
-        self.display_alerts(resolved_alerts)
+        self.show_filtered_alerts(status=Status.RESOLVED)
+
+    def show_filtered_alerts(self, **filters) -> None:
+        """Display the first page of the alerts matching filters, queried from the database."""
+        self.alert_filter = filters
+        self.next_cursor = None
+        if not self.alert_module:
+            # Placeholder rows are filtered here, as they are not in a database.
+            severity, status = filters.get("severity"), filters.get("status")
+            self.display_alerts([
+                a for a in self.all_alerts
+                if (severity is None or a[3].lower() == severity.lower()) and (status is None or a[6].lower() == status.value.lower())
+            ])
+            return
+
+        self.load_alert_page()
+
+    def show_next_page(self) -> None:
+        """Display the next page of the current filter, if there is one."""
+        if self.next_cursor is None:
+            messagebox.showinfo("Last Page", "There are no more alerts matching this filter.")
+            return
+        self.load_alert_page(self.next_cursor)
+
+    def load_alert_page(self, after: tuple | None = None) -> None:
+        """Query the page of the current filter after the cursor (the first, newest page by default) and display it."""
+        page = self.alert_module.query_alerts(
+            **self.alert_filter, descending=self.ALERT_PAGE_DESCENDING, after=after, limit=self.ALERT_PAGE_SIZE
+        )
+        self.next_cursor = page.next_cursor
+        self.all_alerts = [self.alert_row(alert) for alert in page.alerts]
+        self.display_alerts(self.all_alerts)
+
+    def export_alerts(self) -> None:
+        """Export every alert matching the current filter to a CSV file, streamed from the database."""
+        if not self.alert_module:
+            return
+        file_path = filedialog.asksaveasfilename(
+            title="Export Alerts",
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not file_path:
+            return
+
+        try:
+            written = self.alert_module.export_csv(file_path, **self.alert_filter)
+            messagebox.showinfo("Export Complete", f"Exported {written} alert(s) to {file_path}")
+        except Exception as e:
+            messagebox.showerror("Export Error", f"An error occurred while exporting alerts:\n{e}")
 
     def on_table_click(self, event: tk.Event) -> None:
         """Identify and handle user clicks in the alert table."""
@@ -306,6 +510,37 @@ class UserInterface():
             else:
                 self.delete_alert(row_id)
 
+    def show_readings(self, event: tk.Event) -> None:
+        """Plot the stored readings around the double-clicked alert in a new window."""
+        row_id = self.table.identify_row(event.y)
+        values = self.table.item(row_id, "values") if row_id else None
+        if not values or self.reading_store is None:
+            return
+
+        sensor_id, timestamp = values[1], values[5]
+        try:
+            # Only the recording the alert was raised from, not others at the same time of day.
+            recording_id = self.reading_store.recording_of(int(values[0])) if str(values[0]).isdigit() else None
+            readings = self.reading_store.around(sensor_id, timestamp, self.READING_WINDOW_S, recording_id)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load readings: {e}")
+            return
+        if readings.empty:
+            messagebox.showinfo("No Readings", f"No stored readings for {sensor_id} around {timestamp}.")
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title(f"{sensor_id} readings around {timestamp}")
+        fig = Figure(figsize=(7, 3), dpi=100)
+        ax = fig.add_subplot(111)
+        ax.plot(readings["seconds"] - timestamp_seconds([timestamp])[0], readings["value"], marker=".")
+        ax.axvline(0, color="red", linestyle="--") # the alert
+        ax.set_title(f"{sensor_id} ±{self.READING_WINDOW_S}s around alert {values[0]}")
+        ax.set_xlabel("Seconds from alert")
+        ax.set_ylabel(readings["unit"].iloc[0])
+        fig.tight_layout()
+        FigureCanvasTkAgg(fig, master=window).get_tk_widget().pack(fill="both", expand=True)
+
     def resolve_alert(self, row_id: str) -> None:
         """Toggle alert between active and resolved."""
         values = list(self.table.item(row_id, "values"))
@@ -391,13 +626,134 @@ class UserInterface():
             visible = [self.table.item(i, "values") for i in self.table.get_children("")]
             self.sort_and_display_alerts(visible)
 
+    def selected_alert_ids(self) -> dict[str, int]:
+        """Map each selected table row to its alert id, skipping rows without one."""
+        selected = {}
+        for row_id in self.table.selection():
+            alert_id = str(self.table.item(row_id, "values")[0]).strip()
+            if alert_id.isdigit():
+                selected[row_id] = int(alert_id)
+        return selected
+
+    def resolve_selected_alerts(self) -> None:
+        """Resolve every selected alert in one database transaction."""
+        selected = self.selected_alert_ids()
+        if not self.alert_module or not selected:
+            messagebox.showinfo("No Selection", "Select one or more alerts first (Ctrl- or Shift-click).")
+            return
+
+        try:
+            resolved = self.alert_module.resolve_alerts(selected.values())
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to resolve alerts: {e}")
+            return
+
+        self.show_selected_status(selected, Status.RESOLVED)
+        messagebox.showinfo("Alerts Resolved", f"{resolved} alert(s) marked as resolved.")
+
+    def reactivate_selected_alerts(self) -> None:
+        """Mark every selected alert as active again in one database transaction."""
+        selected = self.selected_alert_ids()
+        if not self.alert_module or not selected:
+            messagebox.showinfo("No Selection", "Select one or more alerts first (Ctrl- or Shift-click).")
+            return
+
+        try:
+            reactivated = self.alert_module.unresolve_alerts(selected.values())
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to reactivate alerts: {e}")
+            return
+
+        self.show_selected_status(selected, Status.ACTIVE)
+        messagebox.showinfo("Alerts Reactivated", f"{reactivated} alert(s) reactivated.")
+
+    def show_selected_status(self, selected: dict[str, int], status: Status) -> None:
+        """Show a new status on the selected table rows (see selected_alert_ids()) and in all_alerts."""
+        for row_id in selected:
+            values = list(self.table.item(row_id, "values"))
+            values[6] = status.value
+            if status == Status.RESOLVED:
+                values[7] = "☑    ❌"
+                tag = "resolved"
+            else:
+                values[7] = "✅    ❌"
+                tag = values[3].lower()
+            self.table.item(row_id, values=values, tags=(tag,))
+        rows = {str(alert_id): tuple(self.table.item(row_id, "values")) for row_id, alert_id in selected.items()}
+        self.all_alerts = [rows.get(str(a[0]), a) for a in self.all_alerts]
+
+        if hasattr(self, "graph_ax"):
+            visible = [self.table.item(i, "values") for i in self.table.get_children("")]
+            self.sort_and_display_alerts(visible)
+
+    def delete_selected_alerts(self) -> None:
+        """Delete every selected alert in one database transaction, after confirmation from the user."""
+        selected = self.selected_alert_ids()
+        if not self.alert_module or not selected:
+            messagebox.showinfo("No Selection", "Select one or more alerts first (Ctrl- or Shift-click).")
+            return
+        if not messagebox.askyesno("Delete Alerts", f"Are you sure you want to delete {len(selected)} alert(s)?"):
+            return
+
+        try:
+            deleted = self.alert_module.delete_alerts(selected.values())
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to delete alerts: {e}")
+            return
+
+        self.table.delete(*selected)
+        removed = {str(alert_id) for alert_id in selected.values()}
+        self.all_alerts = [a for a in self.all_alerts if str(a[0]) not in removed]
+        messagebox.showinfo("Alerts Deleted", f"{deleted} alert(s) deleted.")
+
+        if hasattr(self, "graph_ax"):
+            visible = [self.table.item(i, "values") for i in self.table.get_children("")]
+            self.sort_and_display_alerts(visible)
+
+    def resolve_matching_alerts(self) -> None:
+        """Resolve every alert matching the current filter, on every page, in one database transaction."""
+        if not self.alert_module:
+            return
+        # Only active alerts change, so the status filter adds nothing.
+        filters = {name: value for name, value in self.alert_filter.items() if name != "status"}
+        if not filters:
+            messagebox.showinfo("No Filter", "Choose a severity filter first; the action applies to every alert it shows.")
+            return
+        if self.alert_filter.get("status") == Status.RESOLVED:
+            messagebox.showinfo("Alerts Resolved", "Every alert matching this filter is already resolved.")
+            return
+
+        try:
+            resolved = self.alert_module.resolve_alerts(**filters)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to resolve alerts: {e}")
+            return
+
+        self.load_alert_page()
+        messagebox.showinfo("Alerts Resolved", f"{resolved} alert(s) marked as resolved.")
+
+    def delete_matching_alerts(self) -> None:
+        """Delete every alert matching the current filter, on every page, in one transaction after confirmation."""
+        if not self.alert_module:
+            return
+        if not self.alert_filter:
+            messagebox.showinfo("No Filter", "Choose a severity or status filter first; the action applies to every alert it shows.")
+            return
+        if not messagebox.askyesno("Delete Alerts", "Are you sure you want to delete every alert matching the current filter?"):
+            return
+
+        try:
+            deleted = self.alert_module.delete_alerts(**self.alert_filter)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to delete alerts: {e}")
+            return
+
+        self.load_alert_page()
+        messagebox.showinfo("Alerts Deleted", f"{deleted} alert(s) deleted.")
+
     def sort_and_display_alerts(self, alerts: list[tuple]) -> None:
-        counts = [0] * 24 # Create bin for each hour of the day
-        
-        for row in alerts:
-            timestamp = str(row[5])
-            if hour_minute_second.match(timestamp): # verify timestamp is in HH:MM:SS format
-                counts[int(timestamp[0:2])] += 1 # add it to the correct HH bin
+        seconds = timestamp_seconds([row[5] for row in alerts]) # -1 for anything that isn't HH:MM:SS
+        counts = np.bincount(seconds[seconds >= 0] // 3600, minlength=24) # Create bin for each hour of the day
 
         ax = self.graph_ax 
         ax.clear()
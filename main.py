@@ -2,6 +2,7 @@ import tkinter as tk
 from UserInterface import UserInterface
 from AlertModule import AlertModule
 from Database import AlertDatabase
+from ReadingStore import ReadingStore
 
 def main():
     """Main orcherstrator method intialising database, alert module, UI and tkinter main loop."""
@@ -10,9 +11,10 @@ def main():
     # Initialise the backend.
     database = AlertDatabase()
     alert_module = AlertModule(database)
+    reading_store = ReadingStore()
 
     # Pass backend to the User Interface.
-    ui = UserInterface(root, alert_module)
+    ui = UserInterface(root, alert_module, reading_store)
 
     # Draw the interface.
     ui.draw_window()